@@ -0,0 +1,122 @@
+"""스레드(Fetcher + ordered_map) 와 asyncio(AsyncFetcher) 수집 엔진 비교
+
+로컬 스텁 서버(bench/site_server.py)에 응답 지연을 넣고, 상세 페이지 코퍼스를
+--repeat 번 반복한 URL 목록을 수집·파싱해 요청 지연(p50/p95)과 처리량(pages/sec)을 잰다.
+파싱 함수(parse_pokemon_details / parse_move_details)는 두 엔진이 같은 것을 쓴다.
+--fetch-only 는 파싱 없이 HTTP 엔진만 비교한다 (CPU가 적으면 파싱 시간이 결과를 가린다).
+
+    python bench/async_engines.py [--repeat 40] [--delay 0.05] [--concurrency 8 32] [--fetch-only]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (ROOT, BENCH_DIR, os.path.join(ROOT, "data", "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from corpus import FIXTURE_DIR, iter_pages  # noqa: E402
+from move_basic import async_get_move_details, get_move_details  # noqa: E402
+from pokemon_basic import async_get_pokemon_details, get_pokemon_details  # noqa: E402
+from site_server import running_server  # noqa: E402
+from util.async_fetcher import AsyncFetcher  # noqa: E402
+from util.evolution import EvolutionCache  # noqa: E402
+from util.fetcher import Fetcher  # noqa: E402
+from util.parallel import ordered_map  # noqa: E402
+
+import pokemon_basic  # noqa: E402
+
+
+def _urls(base_url, repeat):
+    """(url, 종류) 목록: 코퍼스 URL의 호스트를 스텁 서버 경로로 바꾸고 ?i= 로 반복"""
+    urls = []
+    for kind in ("pokemon_detail", "move_detail"):
+        for url, _ in iter_pages(kind):
+            path = url.split("://", 1)[1]
+            urls += [(f"{base_url}/{path}?i={i}", kind) for i in range(repeat)]
+    return urls
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else 0.0
+
+
+def run_threads(urls, concurrency, fetch_only=False):
+    fetcher = Fetcher(pool_size=concurrency, retries=0)
+    latencies = []
+
+    def work(entry):
+        url, kind = entry
+        start = time.perf_counter()
+        if fetch_only:
+            detail = fetcher.fetch(url)
+        elif kind == "pokemon_detail":
+            detail = get_pokemon_details(url, fetcher=fetcher)
+        else:
+            detail = get_move_details(url, fetcher=fetcher)
+        latencies.append(time.perf_counter() - start)
+        return detail
+
+    start = time.perf_counter()
+    results = list(ordered_map(work, urls, workers=concurrency))
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+    return elapsed, latencies, sum(1 for r in results if r)
+
+
+async def _run_async(urls, concurrency, fetch_only=False):
+    latencies = []
+    # 스레드 엔진과 같게 작업 슬롯을 얻은 뒤부터 지연을 잰다 (대기열에 쌓인 시간 제외)
+    slots = asyncio.Semaphore(concurrency)
+    async with AsyncFetcher(concurrency=concurrency, per_host=concurrency, retries=0) as fetcher:
+        async def work(entry):
+            url, kind = entry
+            async with slots:
+                start = time.perf_counter()
+                if fetch_only:
+                    detail = await fetcher.fetch(url)
+                elif kind == "pokemon_detail":
+                    detail = await async_get_pokemon_details(url, fetcher=fetcher)
+                else:
+                    detail = await async_get_move_details(url, fetcher=fetcher)
+                latencies.append(time.perf_counter() - start)
+            return detail
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(work(entry) for entry in urls))
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies, sum(1 for r in results if r)
+
+
+def run_async(urls, concurrency, fetch_only=False):
+    return asyncio.run(_run_async(urls, concurrency, fetch_only))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=40)
+    parser.add_argument("--delay", type=float, default=0.05, help="스텁 서버 응답 지연(초)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--fetch-only", action="store_true", help="파싱 없이 수집만 측정")
+    args = parser.parse_args()
+
+    with running_server(args.delay) as base_url:
+        urls = _urls(base_url, args.repeat)
+        print(f"페이지 {len(urls)}개, 응답 지연 {args.delay * 1000:.0f}ms, 코퍼스 {FIXTURE_DIR}")
+        for concurrency in args.concurrency:
+            for name, engine in (("threads", run_threads), ("asyncio", run_async)):
+                # 진화 계열 캐시가 반복 URL 결과를 바꾸지 않도록 실행마다 비움
+                pokemon_basic.EVOLUTION_CACHE = EvolutionCache()
+                elapsed, latencies, ok = engine(urls, concurrency, args.fetch_only)
+                print(f"{name:<8} concurrency={concurrency:<3} {len(urls) / elapsed:8.1f} pages/s  "
+                      f"p50 {_percentile(latencies, 0.5) * 1000:6.1f}ms  p95 {_percentile(latencies, 0.95) * 1000:6.1f}ms  "
+                      f"성공 {ok}/{len(urls)}")
+
+
+if __name__ == "__main__":
+    main()
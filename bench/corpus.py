@@ -0,0 +1,56 @@
+"""오프라인 HTML 코퍼스 (bench/fixtures)
+
+파일 경로는 URL을 그대로 따른다:
+    https://pokemondb.net/pokedex/bulbasaur → fixtures/pokemondb.net/pokedex/bulbasaur.html
+
+체크인된 페이지는 파서가 읽는 구조(섹션 제목, vitals/data 테이블, 진화 차트,
+Learnt 카드 목록, Bulbapedia 기술 표)를 재현한 복제본이다. 실제 페이지로 바꾸려면
+bench/save_fixtures.py 를 실행한다.
+"""
+import glob
+import os
+from urllib.parse import urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+POKEMONDB_HOST = "pokemondb.net"
+BULBAPEDIA_HOST = "bulbapedia.bulbagarden.net"
+
+# 파서 종류별 코퍼스 파일 패턴
+KINDS = {
+    "gen_stats": os.path.join(POKEMONDB_HOST, "pokedex", "stats", "gen*.html"),
+    "pokemon_detail": os.path.join(POKEMONDB_HOST, "pokedex", "*.html"),
+    "move_list": os.path.join(POKEMONDB_HOST, "move", "generation", "*.html"),
+    "move_detail": os.path.join(POKEMONDB_HOST, "move", "*.html"),
+    "bulbapedia_moves": os.path.join(BULBAPEDIA_HOST, "wiki", "List_of_moves.html"),
+}
+
+
+def fixture_path(url):
+    """URL → 코퍼스 파일 경로"""
+    parts = urlsplit(url)
+    return os.path.join(FIXTURE_DIR, parts.netloc, parts.path.strip("/") + ".html")
+
+
+def fixture_url(path, scheme="https"):
+    """코퍼스 파일 경로 → 원래 URL"""
+    rel = os.path.relpath(path, FIXTURE_DIR).replace(os.sep, "/")
+    host, _, rest = rel.partition("/")
+    return f"{scheme}://{host}/{rest[:-len('.html')]}"
+
+
+def iter_pages(kind):
+    """kind 코퍼스의 (url, html) 목록"""
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, KINDS[kind]))):
+        with open(path, encoding="utf-8") as f:
+            yield fixture_url(path), f.read()
+
+
+class FixtureFetcher:
+    """Fetcher 대신 코퍼스 파일을 돌려주는 오프라인 수집기"""
+
+    def fetch(self, url):
+        path = fixture_path(url)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"코퍼스에 없는 URL: {url}")
+        with open(path, encoding="utf-8") as f:
+            return f.read()
@@ -0,0 +1,141 @@
+"""로컬 스텁 서버(bench/site_server.py)를 상대로 한 1~9세대 전체 수집 부하 테스트
+
+PORODECK_BASE_URL / PORODECK_BULBAPEDIA_URL 을 스텁 서버로 지정한 뒤 iter_pokemon_rows,
+iter_move_rows 를 그대로 실행하고, 수집기별로 다음을 보고한다.
+    - 처리량: 출력 행/초
+    - 꼬리 지연: 항목별 fetch(재시도·백오프 포함) p50/p95/p99/max
+    - 장애 복구: 서버가 주입한 429/잘림/느린 응답 수, 수집기의 재시도/오류 수, 상세 정보 없이 만들어진 행 수
+
+    python bench/crawl_load.py [--workers 8] [--rate 50] [--scale 3] [--delay 0.02] [--p429 0.02] [--truncate 0.01]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from urllib.request import urlopen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (ROOT, BENCH_DIR, os.path.join(ROOT, "data", "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from site_server import running_server  # noqa: E402
+from util.fetcher import Fetcher  # noqa: E402
+from util.ratelimit import RateLimiter  # noqa: E402
+
+
+class TimedFetcher(Fetcher):
+    """항목별 fetch 시간(재시도·백오프 포함)을 모으는 Fetcher"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        start = time.perf_counter()
+        try:
+            return super().fetch(url)
+        finally:
+            with self._lock:
+                self.latencies.append(time.perf_counter() - start)
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else 0.0
+
+
+def _server_stats(base_url):
+    with urlopen(f"{base_url}/__stats") as res:
+        return json.loads(res.read().decode("utf-8"))
+
+
+def crawl(name, iter_rows, base_url, args, tmp):
+    """수집기 하나 실행 → 보고용 dict"""
+    fetcher = TimedFetcher(pool_size=args.workers, retries=args.retries, backoff=args.backoff,
+                           rate_limiter=RateLimiter(rate=args.rate, burst=args.workers))
+    metrics_path = os.path.join(tmp, f"{name}.metrics.json")
+    # 진화 간선·도감 설명도 기본 경로(data/raw)에 쓰지 않도록 임시 디렉터리로 보낸다
+    outputs = dict(evolution_path=os.path.join(tmp, "pokemon_evolution.tsv"),
+                   descriptions_path=os.path.join(tmp, "pokemon_descriptions.bin")) if name == "pokemon" else {}
+    before = _server_stats(base_url)
+    start = time.perf_counter()
+    rows = incomplete = 0
+    # 수집기가 항목마다 print 하는 진행 출력은 버린다
+    with contextlib.redirect_stdout(io.StringIO()):
+        for row in iter_rows(generations=args.generations, workers=args.workers, fetcher=fetcher,
+                             checkpoint_path=os.path.join(tmp, f"{name}.checkpoint.jsonl"),
+                             parse_workers=args.parse_workers, metrics_path=metrics_path, **outputs):
+            rows += 1
+            incomplete += row.get("name_kr") is None
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+
+    after = _server_stats(base_url)
+    with open(metrics_path, encoding="utf-8") as f:
+        counters = json.load(f)["counters"]
+    latencies = fetcher.latencies
+    return {
+        "rows": rows, "elapsed": elapsed, "rows_per_sec": rows / elapsed if elapsed else 0.0,
+        "fetches": len(latencies),
+        "p50": _percentile(latencies, 0.5), "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99), "max": max(latencies, default=0.0),
+        "server": {k: after[k] - before.get(k, 0) for k in after},
+        "retries": counters.get("fetch.retries", 0), "errors": counters.get("fetch.errors", 0),
+        "incomplete": incomplete,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generations", type=int, nargs="+", default=list(range(1, 10)))
+    parser.add_argument("--workers", type=int, default=8, help="상세 페이지 수집 스레드 수")
+    parser.add_argument("--parse-workers", type=int, default=0, help="파싱 프로세스 수 (0: 프로세스 없음)")
+    parser.add_argument("--rate", type=float, default=50.0, help="호스트별 목표 요청 속도(초당)")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=0.1)
+    parser.add_argument("--collectors", nargs="+", default=["pokemon", "move"], choices=["pokemon", "move"])
+    # 스텁 서버 장애 주입
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.03)
+    parser.add_argument("--p429", type=float, default=0.02)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--truncate", type=float, default=0.01)
+    parser.add_argument("--slow", type=float, default=0.01)
+    parser.add_argument("--slow-seconds", type=float, default=1.0)
+    parser.add_argument("--scale", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faults = dict(jitter=args.jitter, p429=args.p429, retry_after=args.retry_after, truncate=args.truncate,
+                  slow=args.slow, slow_seconds=args.slow_seconds, scale=args.scale, seed=args.seed)
+    with running_server(args.delay, **faults) as base_url, tempfile.TemporaryDirectory() as tmp:
+        # 수집기 모듈은 import 시점에 BASE_URL 을 읽으므로 환경 변수를 먼저 지정
+        os.environ["PORODECK_BASE_URL"] = base_url
+        os.environ["PORODECK_BULBAPEDIA_URL"] = base_url
+        from move_basic import iter_move_rows
+        from pokemon_basic import iter_pokemon_rows
+
+        print(f"스텁 서버 {base_url}, {args.generations[0]}~{args.generations[-1]}세대, "
+              f"수집 스레드 {args.workers}개, 장애 {faults}")
+        collectors = {"pokemon": iter_pokemon_rows, "move": iter_move_rows}
+        for name in args.collectors:
+            r = crawl(name, collectors[name], base_url, args, tmp)
+            server = r["server"]
+            print(f"[{name}] {r['rows']}행 {r['elapsed']:.1f}s → {r['rows_per_sec']:.1f} rows/s")
+            print(f"  fetch {r['fetches']}건  p50 {r['p50'] * 1000:.0f}ms  p95 {r['p95'] * 1000:.0f}ms  "
+                  f"p99 {r['p99'] * 1000:.0f}ms  max {r['max'] * 1000:.0f}ms")
+            print(f"  서버 요청 {server['requests']}건: 429 {server['status_429']}  잘림 {server['truncated']}  "
+                  f"느림 {server['slow']}  404 {server['status_404']}")
+            print(f"  수집기 재시도 {r['retries']}  오류 {r['errors']}  상세 정보 없는 행 {r['incomplete']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""분산 수집(data/scripts/distributed_crawl.py) 작업자 수에 따른 처리량과 공유 요청 예산 확인
+
+로컬 스텁 서버(bench/site_server.py)를 상대로 작업 큐를 만든 뒤, 작업자 프로세스 수를 바꿔 가며
+같은 작업(캐시 없이)을 처음부터 처리하고 다음을 보고한다.
+    - 처리량: 상세 페이지/초
+    - 서버가 받은 요청 속도: 모든 작업자를 합한 초당 요청 수 (--rate 예산을 넘지 않아야 한다)
+
+    python bench/distributed_scaling.py [--processes 1 2 4] [--rate 200] [--workers 4] [--delay 0.1] [--scale 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.request import urlopen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(ROOT, "data", "scripts", "distributed_crawl.py")
+for path in (ROOT, BENCH_DIR, os.path.join(ROOT, "data", "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from site_server import running_server  # noqa: E402
+from util.workqueue import WorkQueue  # noqa: E402
+
+
+def _server_requests(base_url):
+    with urlopen(f"{base_url}/__stats") as res:
+        return json.loads(res.read().decode("utf-8"))["requests"]
+
+
+def _run(command, env, cwd, args):
+    """distributed_crawl.py 하위 명령을 별도 프로세스로 실행"""
+    argv = [sys.executable, SCRIPT, command, "--queue", args.queue, "--kinds", *args.kinds,
+            "--generations", *map(str, args.generations), "--rate", str(args.rate),
+            "--workers", str(args.workers), "--lease", "30", "--no-cache"]
+    if command == "init":
+        argv.append("--reset")
+    return subprocess.Popen(argv, env=env, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--kinds", nargs="+", default=["pokemon"], choices=["pokemon", "move"])
+    parser.add_argument("--generations", type=int, nargs="+", default=list(range(1, 10)))
+    parser.add_argument("--rate", type=float, default=200.0, help="모든 작업자가 나눠 쓰는 호스트별 요청 속도(초당)")
+    parser.add_argument("--workers", type=int, default=4, help="작업자당 수집 스레드 수")
+    parser.add_argument("--delay", type=float, default=0.1, help="스텁 서버 응답 지연(초)")
+    parser.add_argument("--scale", type=int, default=3)
+    args = parser.parse_args()
+
+    with running_server(args.delay, scale=args.scale) as base_url, tempfile.TemporaryDirectory() as tmp:
+        args.queue = os.path.join(tmp, "crawl_queue.db")
+        env = dict(os.environ, PORODECK_BASE_URL=base_url, PORODECK_BULBAPEDIA_URL=base_url,
+                   PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+        print(f"스텁 서버 {base_url} (지연 {args.delay}s), 요청 예산 초당 {args.rate}, 작업자당 스레드 {args.workers}개")
+        for n in args.processes:
+            # 요청 예산 상태도 새로 시작하도록 큐 파일을 지우고 다시 등록
+            if os.path.exists(args.queue):
+                os.remove(args.queue)
+            _run("init", env, tmp, args).wait()
+            tasks = sum(sum(c.values()) for c in WorkQueue(args.queue).counts().values())
+
+            before = _server_requests(base_url)
+            start = time.perf_counter()
+            procs = [_run("work", env, tmp, args) for _ in range(n)]
+            for proc in procs:
+                proc.wait()
+            elapsed = time.perf_counter() - start
+            requests = _server_requests(base_url) - before
+            counts = WorkQueue(args.queue).counts()
+            print(f"작업자 {n}개: 작업 {tasks}개 {elapsed:.1f}s → {tasks / elapsed:.1f} pages/s, "
+                  f"서버 요청 {requests}건 {requests / elapsed:.1f} req/s, 상태 {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""포켓몬 상세 페이지 섹션 탐색 마이크로벤치마크
+
+변경 전 방식(섹션마다 soup.select("h2") 재탐색)과 SectionIndex(문서 1회 순회)의
+페이지당 섹션 탐색 시간, 그리고 parse_pokemon_details 전체 시간을 비교한다.
+
+    python bench/parse_sections.py [HTML 파일 또는 URL ...] [--repeat N]
+
+인자가 없으면 오프라인 코퍼스(bench/fixtures)의 포켓몬 상세 페이지를 사용한다.
+"""
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "data", "scripts"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from corpus import iter_pages
+from pokemon_basic import parse_pokemon_details
+from util.evolution import EvolutionCache
+from util.fetcher import get_default_fetcher
+from util.parsing import SectionIndex
+
+SECTIONS = ["Training", "Base stats", "Pokédex entries", "Evolution chart", "Other languages"]
+
+
+def legacy_lookup(soup):
+    """변경 전 방식: 섹션마다 h2 전체를 다시 선택"""
+    found = {"vitals": soup.select_one("table.vitals-table")}
+    for title in SECTIONS:
+        for h2 in soup.select("h2"):
+            if title in h2.text:
+                if title == "Evolution chart":
+                    found[title] = h2.find_next("div", class_="infocard-list-evo")
+                else:
+                    found[title] = h2.find_next("table")
+                break
+    return found
+
+
+def indexed_lookup(soup):
+    """SectionIndex 방식"""
+    index = SectionIndex(soup, div_classes=["infocard-list-evo"])
+    found = {"vitals": index.table_with_class("vitals-table")}
+    for title in SECTIONS:
+        section = index.find(title)
+        if section:
+            found[title] = section.div("infocard-list-evo") if title == "Evolution chart" else section.table
+    return found
+
+
+def load_page(source):
+    if os.path.exists(source):
+        with open(source, encoding="utf-8") as f:
+            return source, f.read()
+    return source, get_default_fetcher().fetch(source)
+
+
+def time_call(func, arg, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv):
+    repeat = 20
+    if "--repeat" in argv:
+        pos = argv.index("--repeat")
+        repeat = int(argv[pos + 1])
+        argv = argv[:pos] + argv[pos + 2:]
+    pages = [load_page(source) for source in argv] if argv else list(iter_pages("pokemon_detail"))
+
+    print(f"{'page':<40} {'legacy(ms)':>11} {'index(ms)':>10} {'speedup':>8} {'full parse(ms)':>15}")
+    totals = [0.0, 0.0, 0.0]
+    for name, html in pages:
+        soup = BeautifulSoup(html, "html.parser")
+        # 두 방식이 같은 요소를 찾는지 먼저 확인
+        assert legacy_lookup(soup) == indexed_lookup(soup), f"섹션 탐색 결과 불일치: {name}"
+
+        legacy_ms = time_call(legacy_lookup, soup, repeat)
+        index_ms = time_call(indexed_lookup, soup, repeat)
+        full_ms = time_call(lambda h: parse_pokemon_details(h, name, evolution_cache=EvolutionCache()), html, max(1, repeat // 4))
+        totals[0] += legacy_ms
+        totals[1] += index_ms
+        totals[2] += full_ms
+        print(f"{os.path.basename(name)[:40]:<40} {legacy_ms:>11.2f} {index_ms:>10.2f} {legacy_ms / index_ms:>7.1f}x {full_ms:>15.2f}")
+
+    n = len(pages)
+    print(f"{'mean / page':<40} {totals[0] / n:>11.2f} {totals[1] / n:>10.2f} {totals[0] / totals[1]:>7.1f}x {totals[2] / n:>15.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,135 @@
+"""get_* 파서별 처리량(pages/sec)과 최대 RSS 측정
+
+코퍼스(bench/fixtures)만 사용하므로 네트워크가 필요 없다. 파서마다 새 프로세스에서
+측정해 RSS가 서로 섞이지 않게 하고, --json 으로 결과를 저장한 뒤 --compare 로
+이전 결과와 비교할 수 있다.
+
+    python bench/parse_throughput.py [--seconds 2] [--backend html.parser]
+                                     [--json out.json] [--compare base.json]
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _setup_path():
+    for path in (ROOT, BENCH_DIR, os.path.join(ROOT, "data", "scripts")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _parsers(backend):
+    """(이름, 코퍼스 종류, html → 결과 함수)"""
+    import move_basic
+    import pokemon_basic
+    from util.evolution import EvolutionCache
+
+    def gen_from_url(url):
+        return int("".join(c for c in url.rsplit("/", 1)[-1] if c.isdigit()))
+
+    return [
+        ("get_generation_pokemon_data", "gen_stats",
+         lambda url, html: pokemon_basic.parse_generation_pokemon_page(html, gen_from_url(url))),
+        ("get_pokemon_details", "pokemon_detail",
+         lambda url, html: pokemon_basic.parse_pokemon_details(html, url, parser_backend=backend,
+                                                               evolution_cache=EvolutionCache())),
+        ("get_move_id_mapping", "bulbapedia_moves",
+         lambda url, html: move_basic.parse_move_id_mapping(html)),
+        ("get_generation_moves_data", "move_list",
+         lambda url, html: move_basic.parse_generation_moves_page(html, gen_from_url(url))),
+        ("get_move_details", "move_detail",
+         lambda url, html: move_basic.parse_move_details(html, parser_backend=backend)),
+    ]
+
+
+def _run_one(name, backend, seconds, queue):
+    _setup_path()
+    from corpus import iter_pages
+
+    parser = {n: (kind, func) for n, kind, func in _parsers(backend)}[name]
+    kind, func = parser
+    pages = list(iter_pages(kind))
+    page_bytes = sum(len(html.encode("utf-8")) for _, html in pages)
+
+    # 준비 단계 (import/캐시 워밍업) 후의 RSS를 기준으로 삼는다
+    for url, html in pages:
+        func(url, html)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for url, html in pages:
+            func(url, html)
+            count += 1
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    queue.put({
+        "parser": name,
+        "backend": backend,
+        "pages": len(pages),
+        "pages_per_sec": count / elapsed,
+        "mb_per_sec": count / len(pages) * page_bytes / elapsed / 1e6,
+        "peak_rss_mb": peak_rss / 1024,
+        "parse_rss_mb": (peak_rss - base_rss) / 1024,
+    })
+
+
+def run(backend="html.parser", seconds=2.0, only=None):
+    _setup_path()
+    names = [name for name, _, _ in _parsers(backend)]
+    if only:
+        names = [name for name in names if name in only]
+
+    ctx = mp.get_context("spawn")
+    results = []
+    for name in names:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_one, args=(name, backend, seconds, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+    return results
+
+
+def print_results(results, baseline=None):
+    base = {(r["parser"], r["backend"]): r for r in (baseline or [])}
+    print(f"{'parser':<28} {'backend':<12} {'pages':>5} {'pages/s':>9} {'MB/s':>7} {'peak RSS':>9} {'parse RSS':>10} {'vs base':>8}")
+    for r in results:
+        prev = base.get((r["parser"], r["backend"]))
+        delta = f"{(r['pages_per_sec'] / prev['pages_per_sec'] - 1) * 100:+.0f}%" if prev else "-"
+        print(f"{r['parser']:<28} {r['backend']:<12} {r['pages']:>5} {r['pages_per_sec']:>9.1f} {r['mb_per_sec']:>7.2f} "
+              f"{r['peak_rss_mb']:>7.1f}MB {r['parse_rss_mb']:>8.1f}MB {delta:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_* 파서 처리량 벤치마크")
+    parser.add_argument("--seconds", type=float, default=2.0, help="파서별 측정 시간(초)")
+    parser.add_argument("--backend", default="html.parser", help="상세 페이지 파서 백엔드")
+    parser.add_argument("--only", nargs="*", help="측정할 파서 이름")
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    results = run(args.backend, args.seconds, args.only)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
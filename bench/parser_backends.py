@@ -0,0 +1,76 @@
+"""파서 백엔드별 상세 페이지 파싱 결과 비교 + 시간 측정
+
+설치된 모든 백엔드(html.parser / lxml / selectolax)와 부분/전체 파싱 조합으로
+parse_pokemon_details 결과를 만들어, 기준(html.parser 전체 파싱)과 추출 필드가
+바이트 단위로 같은지 확인한다. 하나라도 다르면 종료 코드 1.
+
+    python bench/parser_backends.py [포켓몬 HTML 파일 또는 URL ...] [--repeat N]
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "data", "scripts"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import iter_pages
+from pokemon_basic import BASE_URL, parse_pokemon_details
+from util.evolution import EvolutionCache
+from util.fetcher import get_default_fetcher
+from util.parsing import available_backends
+
+
+
+def load_page(source):
+    if os.path.exists(source):
+        with open(source, encoding="utf-8") as f:
+            # 파일 이름을 포켓몬 링크로 사용 (진화 차트에서 현재 포켓몬을 찾을 때 필요)
+            name = os.path.splitext(os.path.basename(source))[0]
+            return f"{BASE_URL}/pokedex/{name}", f.read()
+    return source, get_default_fetcher().fetch(source)
+
+
+def encode(detail):
+    return json.dumps(detail, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+def main(argv):
+    repeat = 10
+    if "--repeat" in argv:
+        pos = argv.index("--repeat")
+        repeat = int(argv[pos + 1])
+        argv = argv[:pos] + argv[pos + 2:]
+    pages = [load_page(source) for source in argv] if argv else list(iter_pages("pokemon_detail"))
+
+    # 기준: html.parser 전체 파싱 (진화 차트도 매번 파싱하도록 호출마다 빈 캐시 사용)
+    baseline = [encode(parse_pokemon_details(html, link, partial=False, evolution_cache=EvolutionCache()))
+                for link, html in pages]
+    combos = [(backend, partial) for backend in available_backends() for partial in (False, True)]
+    mismatches = 0
+    print(f"{'backend':<14} {'partial':<8} {'ms/page':>9} {'identical':>10}")
+    for backend, partial in combos:
+        times = []
+        identical = True
+        for (link, html), expected in zip(pages, baseline):
+            got = encode(parse_pokemon_details(html, link, parser_backend=backend, partial=partial,
+                                               evolution_cache=EvolutionCache()))
+            if got != expected:
+                identical = False
+                mismatches += 1
+                print(f"  불일치: {link} ({backend}, partial={partial})")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                parse_pokemon_details(html, link, parser_backend=backend, partial=partial,
+                                      evolution_cache=EvolutionCache())
+                times.append(time.perf_counter() - start)
+        print(f"{backend:<14} {str(partial):<8} {statistics.median(times) * 1000:>9.2f} {str(identical):>10}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""수집 → 파싱 파이프라인의 파싱 프로세스 수별 처리량(pages/sec) 측정
+
+캐시가 채워진 상태(디스크 읽기만 있는 수집)를 코퍼스로 흉내 내므로 네트워크가 필요 없다.
+상세 페이지 코퍼스를 --repeat 번 반복해 목록을 만든다.
+
+    python bench/pipeline_scaling.py [--repeat 50] [--workers 0 1 2 4] [--fetch-workers 4]
+"""
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (ROOT, BENCH_DIR, os.path.join(ROOT, "data", "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from corpus import FixtureFetcher, iter_pages  # noqa: E402
+from move_basic import parse_move_item  # noqa: E402
+from pokemon_basic import parse_pokemon_item  # noqa: E402
+from util.pipeline import pipeline_map  # noqa: E402
+
+
+def _items(repeat):
+    items = []
+    for kind, parse in (("pokemon_detail", parse_pokemon_item), ("move_detail", parse_move_item)):
+        items += [(url, parse) for url, _ in iter_pages(kind)] * repeat
+    return items
+
+
+def _parse(item, html, parser_backend="html.parser"):
+    url, parse = item
+    return parse({"link": url}, html, parser_backend=parser_backend)
+
+
+def run(items, parse_workers, fetch_workers, backend):
+    fetcher = FixtureFetcher()
+    start = time.perf_counter()
+    errors = 0
+    for _, _, error in pipeline_map(lambda item: fetcher.fetch(item[0]), partial(_parse, parser_backend=backend),
+                                    items, fetch_workers=fetch_workers, parse_workers=parse_workers):
+        errors += error is not None
+    elapsed = time.perf_counter() - start
+    return len(items) / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4], help="파싱 프로세스 수 (0: 프로세스 없음)")
+    parser.add_argument("--fetch-workers", type=int, default=4)
+    parser.add_argument("--backend", default="html.parser")
+    args = parser.parse_args()
+
+    items = _items(args.repeat)
+    print(f"페이지 {len(items)}개, 수집 스레드 {args.fetch_workers}개, CPU {os.cpu_count()}개")
+    base = None
+    for workers in args.workers:
+        pages_per_sec, errors = run(items, workers, args.fetch_workers, args.backend)
+        base = base or pages_per_sec
+        print(f"parse_workers={workers:<3} {pages_per_sec:8.1f} pages/s  x{pages_per_sec / base:.2f}  오류 {errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""실제 사이트에서 코퍼스 페이지를 받아 bench/fixtures 를 갱신
+
+현재 체크인된 코퍼스는 네트워크 없이 만든 구조 복제본이므로, 사이트에 접근할 수
+있는 환경에서 이 스크립트로 실제 페이지를 받아 교체한다.
+
+    python bench/save_fixtures.py [URL ...]
+
+인자가 없으면 코퍼스에 이미 있는 모든 URL을 다시 받는다.
+"""
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import FIXTURE_DIR, fixture_path, fixture_url
+from util.fetcher import Fetcher
+
+
+def main(urls):
+    if not urls:
+        paths = glob.glob(os.path.join(FIXTURE_DIR, "**", "*.html"), recursive=True)
+        urls = sorted(fixture_url(path) for path in paths)
+
+    with Fetcher() as fetcher:
+        for url in urls:
+            html = fetcher.fetch(url)
+            path = fixture_path(url)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+            print(f"{url} → {os.path.relpath(path, ROOT)} ({len(html):,} chars)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
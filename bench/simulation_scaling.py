@@ -0,0 +1,74 @@
+"""전투 시뮬레이터의 작업 프로세스 수별 처리량(battles/sec) 측정
+
+--snapshot 이 없으면 무작위 스탯/타입의 포켓몬·기술로 임시 스냅숏을 만들어 쓴다
+(data/scripts/compile_snapshot.py 로 만든 실제 스냅숏을 지정할 수도 있다).
+
+    python bench/simulation_scaling.py [--battles 200000] [--workers 0 1 2 4] [--snapshot PATH]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from game.damage import CATEGORIES, TYPES  # noqa: E402
+from game.simulate import simulate_battles, simulate_runs  # noqa: E402
+from util.snapshot import write_snapshot  # noqa: E402
+
+
+def synthetic_snapshot(path, n_pokemon=1000, n_moves=900, seed=0):
+    rng = np.random.default_rng(seed)
+    stat = lambda: int(rng.integers(20, 160))
+    pokemon = [{
+        "id": i + 1, "generation": 1, "name_en": f"pokemon-{i + 1}",
+        "type1": TYPES[rng.integers(len(TYPES))],
+        "type2": TYPES[rng.integers(len(TYPES))] if rng.random() < 0.5 else None,
+        "HP": stat(), "Atk": stat(), "Def": stat(), "SpAtk": stat(), "SpDef": stat(), "Spd": stat(),
+    } for i in range(n_pokemon)]
+    moves = [{
+        "id": i + 1, "name_en": f"move-{i + 1}", "type": TYPES[rng.integers(len(TYPES))],
+        "category": CATEGORIES[rng.integers(len(CATEGORIES))],
+        "power": int(rng.integers(20, 150)), "accuracy": int(rng.choice([70, 85, 90, 100])),
+    } for i in range(n_moves)]
+    write_snapshot(path, pokemon, moves)
+    return path
+
+
+def run(snapshot, battles, workers):
+    start = time.perf_counter()
+    stats = simulate_battles(battles, snapshot_path=snapshot, workers=workers)
+    return battles / (time.perf_counter() - start), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--battles", type=int, default=200000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4], help="작업 프로세스 수 (0: 프로세스 없음)")
+    parser.add_argument("--runs", type=int, default=20000, help="로그라이크 런 시뮬레이션 수 (0이면 생략)")
+    parser.add_argument("--snapshot")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = args.snapshot or synthetic_snapshot(os.path.join(tmp, "bench.snapshot"))
+        print(f"경기 {args.battles}개, CPU {os.cpu_count()}개, 스냅숏 {snapshot}")
+        base = None
+        for workers in args.workers:
+            battles_per_sec, stats = run(snapshot, args.battles, workers)
+            base = base or battles_per_sec
+            print(f"workers={workers:<3} {battles_per_sec:10.0f} battles/s  x{battles_per_sec / base:.2f}  "
+                  f"승률 {stats.win_rate:.3f}  평균 {stats.turns / stats.battles:.1f}턴")
+
+        if args.runs:
+            start = time.perf_counter()
+            stats = simulate_runs(args.runs, snapshot_path=snapshot, workers=args.workers[-1])
+            print(f"런 {args.runs}개 {time.perf_counter() - start:.2f}s, 클리어 층 분포 {stats.floors_cleared.tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""코퍼스(bench/fixtures)를 실제 사이트와 같은 URL 구조로 제공하는 로컬 스텁 서버
+
+    /pokedex/stats/genN, /pokedex/<name>, /move/generation/N, /move/<name>  → pokemondb.net
+    /wiki/List_of_moves                                                   → Bulbapedia
+    /<호스트>/<경로> (예: /pokemondb.net/pokedex/bulbasaur)                  → 해당 호스트 코퍼스
+
+수집기의 PORODECK_BASE_URL / PORODECK_BULBAPEDIA_URL 을 이 서버 주소로 지정하면
+1~9세대 전체 수집을 흉내 낼 수 있다. 코퍼스에 없는 세대 목록 페이지는 1세대 페이지로,
+코퍼스에 없는 상세 페이지는 이름 해시로 고른 코퍼스 페이지로 대신한다.
+--scale K 는 목록 페이지의 각 행을 K번(링크 이름에 -gN-k 접미사) 복제해 수집 규모를 늘린다.
+쿼리 문자열은 무시하므로 같은 페이지를 ?i=N 으로 여러 URL처럼 요청할 수 있다.
+
+장애 주입 (요청마다 --seed 난수로 결정):
+    --delay/--jitter   응답 지연(초) = delay + [0, jitter]
+    --p429             429 응답 비율 (Retry-After: --retry-after 초)
+    --truncate         Content-Length 는 그대로 두고 본문 절반만 보낸 뒤 연결을 끊는 비율
+    --slow             본문을 --slow-seconds 동안 조금씩 나눠 보내는 비율
+GET /__stats 는 요청 수와 주입한 장애 횟수를 JSON으로 돌려준다.
+
+    python bench/site_server.py [--port 8000] [--delay 0.05] [--p429 0.02] [--truncate 0.01] [--scale 3]
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from corpus import BULBAPEDIA_HOST, FIXTURE_DIR, POKEMONDB_HOST
+
+_TBODY = re.compile(r"(<tbody>)(.*?)(</tbody>)", re.S)
+_ROW = re.compile(r"<tr>.*?</tr>", re.S)
+_SUFFIX = re.compile(r"-g\d+-\d+$")
+_STATS_PAGE = re.compile(r"pokedex/stats/gen(\d+)$")
+_MOVES_PAGE = re.compile(r"move/generation/(\d+)$")
+
+
+def _fixture_file(host, path):
+    return os.path.join(FIXTURE_DIR, host, path + ".html")
+
+
+def _read(file_path):
+    with open(file_path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _detail_fixtures(host, directory):
+    folder = os.path.join(FIXTURE_DIR, host, directory)
+    return sorted(name[:-len(".html")] for name in os.listdir(folder) if name.endswith(".html"))
+
+
+def _scale_list(html, kind, gen, scale, synthetic):
+    """목록 페이지 행 복제: /kind/<name> 링크에 -g<세대>-<k> 접미사 (원본 세대의 k=0 행은 그대로)"""
+    link = re.compile(r'href="/%s/([a-z0-9-]+)"' % kind)
+
+    def rows(match):
+        copies = []
+        for row in _ROW.findall(match.group(2)):
+            for k in range(scale):
+                if k == 0 and not synthetic:
+                    copies.append(row)
+                else:
+                    copies.append(link.sub(lambda m: f'href="/{kind}/{m.group(1)}-g{gen}-{k}"', row))
+        return match.group(1) + "\n".join(copies) + match.group(3)
+
+    return _TBODY.sub(rows, html, count=1)
+
+
+def resolve_page(path, scale=1):
+    """요청 경로 → HTML (없으면 None)"""
+    path = path.strip("/")
+    host, _, rest = path.partition("/")
+    if host in (POKEMONDB_HOST, BULBAPEDIA_HOST) and os.path.isfile(_fixture_file(host, rest)):
+        return _read(_fixture_file(host, rest))
+    if path.startswith("wiki/"):
+        file_path = _fixture_file(BULBAPEDIA_HOST, path)
+        return _read(file_path) if os.path.isfile(file_path) else None
+
+    for pattern, kind, first_page in ((_STATS_PAGE, "pokedex", "pokedex/stats/gen1"),
+                                      (_MOVES_PAGE, "move", "move/generation/1")):
+        match = pattern.match(path)
+        if match:
+            gen = int(match.group(1))
+            file_path = _fixture_file(POKEMONDB_HOST, path)
+            synthetic = not os.path.isfile(file_path)
+            html = _read(_fixture_file(POKEMONDB_HOST, first_page) if synthetic else file_path)
+            if synthetic or scale > 1:
+                html = _scale_list(html, kind, gen, max(scale, 1), synthetic)
+            return html
+
+    kind, _, name = path.partition("/")
+    if kind not in ("pokedex", "move") or not name or "/" in name:
+        return None
+    name = _SUFFIX.sub("", name)
+    candidates = _detail_fixtures(POKEMONDB_HOST, kind)
+    if name not in candidates:
+        name = candidates[zlib.crc32(name.encode("utf-8")) % len(candidates)]
+    return _read(_fixture_file(POKEMONDB_HOST, f"{kind}/{name}"))
+
+
+class FaultConfig:
+    def __init__(self, delay=0.0, jitter=0.0, p429=0.0, retry_after=1, truncate=0.0,
+                 slow=0.0, slow_seconds=2.0, scale=1, seed=0):
+        self.delay = delay
+        self.jitter = jitter
+        self.p429 = p429
+        self.retry_after = retry_after
+        self.truncate = truncate
+        self.slow = slow
+        self.slow_seconds = slow_seconds
+        self.scale = scale
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "status_200": 0, "status_404": 0, "status_429": 0, "truncated": 0, "slow": 0}
+
+    def draw(self):
+        """요청 하나의 (지연, 장애 종류)"""
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.delay + self._random.uniform(0, self.jitter)
+            roll = self._random.random()
+        for fault, p in (("status_429", self.p429), ("truncated", self.truncate), ("slow", self.slow)):
+            if roll < p:
+                return delay, fault
+            roll -= p
+        return delay, None
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    faults = FaultConfig()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/__stats":
+            self._send(200, json.dumps(self.faults.stats).encode("utf-8"), "application/json")
+            return
+
+        delay, fault = self.faults.draw()
+        if delay:
+            time.sleep(delay)
+        if fault == "status_429":
+            self.faults.count(fault)
+            self._send(429, b"too many requests", "text/plain", {"Retry-After": str(self.faults.retry_after)})
+            return
+
+        html = resolve_page(path, self.faults.scale) if ".." not in path else None
+        if html is None:
+            self.faults.count("status_404")
+            self._send(404, b"not found", "text/plain")
+            return
+        body = html.encode("utf-8")
+        if fault:
+            self.faults.count(fault)
+        else:
+            self.faults.count("status_200")
+        self._send(200, body, "text/html; charset=utf-8", fault=fault)
+
+    def _send(self, status, body, content_type, headers=None, fault=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if fault == "truncated":
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        if fault == "slow":
+            chunks = 10
+            size = len(body) // chunks + 1
+            for i in range(0, len(body), size):
+                self.wfile.write(body[i:i + size])
+                self.wfile.flush()
+                time.sleep(self.faults.slow_seconds / chunks)
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer(ThreadingHTTPServer):
+    # 기본 listen 큐(5)로는 동시 연결이 많을 때 SYN 재전송으로 1~3초씩 지연된다
+    request_queue_size = 256
+    daemon_threads = True
+
+
+def serve(port=8000, host="127.0.0.1", **faults):
+    handler = type("Handler", (FixtureHandler,), {"faults": FaultConfig(**faults)})
+    server = FixtureServer((host, port), handler)
+    # 포트 0이면 OS가 고른 포트를 부모 프로세스에 알림
+    print(f"http://{host}:{server.server_address[1]}", flush=True)
+    server.serve_forever()
+
+
+@contextlib.contextmanager
+def running_server(delay=0.0, **faults):
+    """별도 프로세스로 스텁 서버 실행 → 기본 URL (벤치마크 프로세스와 GIL을 나누지 않도록)
+
+    faults: FaultConfig 인자 (jitter, p429, retry_after, truncate, slow, slow_seconds, scale, seed)
+    """
+    args = [sys.executable, os.path.abspath(__file__), "--port", "0", "--delay", str(delay)]
+    for name, value in faults.items():
+        args += [f"--{name.replace('_', '-')}", str(value)]
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, text=True)
+    try:
+        yield proc.stdout.readline().strip()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 상한(초)")
+    parser.add_argument("--p429", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--truncate", type=float, default=0.0, help="본문 잘림 비율")
+    parser.add_argument("--slow", type=float, default=0.0, help="느린 응답 비율")
+    parser.add_argument("--slow-seconds", type=float, default=2.0, help="느린 응답의 본문 전송 시간(초)")
+    parser.add_argument("--scale", type=int, default=1, help="목록 페이지 행 복제 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    serve(args.port, delay=args.delay, jitter=args.jitter, p429=args.p429, retry_after=args.retry_after,
+          truncate=args.truncate, slow=args.slow, slow_seconds=args.slow_seconds, scale=args.scale, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
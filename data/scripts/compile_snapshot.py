@@ -0,0 +1,56 @@
+import csv
+import os
+
+from util.common import setup_logging
+from util.descriptions import DescriptionStoreWriter, split_descriptions
+from util.snapshot import open_snapshot, write_snapshot
+
+POKEMON_TSV = "data/raw/pokemon_basic.tsv"
+LEGACY_POKEMON_CSV = "pokemon_basic.csv"
+MOVE_TSV = "data/raw/move_basic.tsv"
+SNAPSHOT_PATH = "data/raw/gamedata.snapshot"
+DESCRIPTIONS_PATH = "data/raw/pokemon_descriptions.bin"
+
+
+def _read_rows(path):
+    if not path or not os.path.exists(path):
+        return []
+    delimiter = "," if path.endswith(".csv") else "\t"
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f, delimiter=delimiter))
+
+
+def compile_snapshot(pokemon_path=POKEMON_TSV, move_path=MOVE_TSV, snapshot_path=SNAPSHOT_PATH,
+                     descriptions_path=DESCRIPTIONS_PATH):
+    """수집 결과(TSV) → mmap 으로 읽는 고정 길이 바이너리 스냅숏
+
+    pokemon_basic.tsv 가 없으면 저장소의 pokemon_basic.csv(1세대)를 대신 사용한다.
+    입력에 도감 설명 열(descriptions / explanation_text)이 있으면 스냅숏에는 넣지 않고
+    descriptions_path 설명 저장소로 옮긴다.
+    """
+    logger = setup_logging()
+    if not os.path.exists(pokemon_path):
+        pokemon_path = LEGACY_POKEMON_CSV
+    pokemon_rows = _read_rows(pokemon_path)
+    move_rows = _read_rows(move_path)
+
+    write_snapshot(snapshot_path, pokemon_rows, move_rows)
+
+    descriptions = DescriptionStoreWriter()
+    for row in pokemon_rows:
+        text = row.get("descriptions") or row.get("explanation_text")
+        descriptions.add_descriptions(row["id"], split_descriptions(text))
+    if descriptions_path and len(descriptions):
+        descriptions.save(descriptions_path)
+        logger.info("도감 설명 %s개 (고유 문장 %s개) → %s (%s bytes)", len(descriptions),
+                    descriptions.unique_count, descriptions_path, os.path.getsize(descriptions_path))
+    logger.info("스냅숏 생성: 포켓몬 %s행 (%s), 기술 %s행 (%s) → %s (%s bytes)",
+                len(pokemon_rows), pokemon_path, len(move_rows), move_path,
+                snapshot_path, os.path.getsize(snapshot_path))
+    return snapshot_path
+
+
+if __name__ == "__main__":
+    path = compile_snapshot()
+    with open_snapshot(path) as snapshot:
+        print(f"저장 완료: 포켓몬 {len(snapshot.pokemon)}행, 기술 {len(snapshot.moves)}행 {path}")
@@ -0,0 +1,232 @@
+"""SQLite 작업 큐(util.workqueue)로 여러 프로세스·머신이 나눠 수집하는 분산 수집
+
+    init   목록 페이지(get_generation_pokemon_data / get_generation_moves_data)를 읽어 상세 URL마다 작업 한 행 등록
+    work   작업을 batch 개씩 빌려(lease, heartbeat) 수집·파싱하고 결과를 큐에 기록. 여러 개를 동시에 실행한다
+    merge  목록 순서대로 결과를 합쳐 단일 프로세스 수집과 같은 TSV(+Parquet), 진화 간선, 도감 설명, 변경 목록 생성
+    status 작업 상태별 개수
+
+모든 작업자는 큐 파일의 호스트별 요청 예산(SharedRateLimiter)을 나눠 쓰므로 작업자 수와 관계없이
+전체 요청 속도는 --rate 를 넘지 않는다. 공유 파일 시스템의 같은 큐 파일을 쓰면 다른 머신에서도 작업자를 띄울 수 있다.
+
+    python data/scripts/distributed_crawl.py init [--generations 1 2 3] [--kinds pokemon move] [--reset]
+    python data/scripts/distributed_crawl.py work [--workers 4] [--parse-workers 0] [--rate 5] [--batch 16]
+    python data/scripts/distributed_crawl.py merge [--partial]
+"""
+import argparse
+import os
+import socket
+import threading
+import time
+from functools import partial
+
+from util.cache import HttpCache
+from util.common import setup_logging
+from util.descriptions import DescriptionStoreWriter
+from util.evolution import EVOLUTION_COLUMNS, EvolutionEdges
+from util.fetcher import Fetcher
+from util.metrics import export_run_metrics, reset_metrics
+from util.pipeline import pipeline_map
+from util.workqueue import SharedRateLimiter, WorkQueue
+from util.writer import RowWriter
+
+from move_basic import (build_move_row, get_generation_moves_data, get_move_id_mapping, load_learnable,
+                        parse_move_item, write_move_data)
+from pokemon_basic import build_pokemon_row, get_generation_pokemon_data, parse_pokemon_item, write_pokemon_data
+
+QUEUE_PATH = "data/raw/crawl_queue.db"
+KINDS = ["pokemon", "move"]
+
+
+def init_queue(queue_path=QUEUE_PATH, kinds=KINDS, generations=range(1, 10), learnset_path=None,
+               rate=5.0, reset=False, fetcher=None):
+    """목록 페이지 수집 → 작업 등록, 상태별 작업 수 반환
+
+    이미 등록된 작업(같은 URL)은 상태를 유지하므로 중단된 분산 수집을 이어갈 수 있다 (reset=True면 새로 시작).
+    learnset_path: 주면 작업자는 기술 페이지의 Learnt 섹션을 파싱하지 않고, 병합 때 이 테이블로 learnable 을 채운다.
+    """
+    logger = setup_logging()
+    queue = WorkQueue(queue_path)
+    fetcher = fetcher or Fetcher(cache=HttpCache(), rate_limiter=SharedRateLimiter(queue_path, rate=rate, logger=logger),
+                                 logger=logger)
+    generations = list(generations)
+
+    if "pokemon" in kinds:
+        pokemon_list = get_generation_pokemon_data(generations=generations, logger=logger, fetcher=fetcher)
+        if pokemon_list:
+            added = queue.add_items("pokemon", pokemon_list, reset=reset)
+            logger.info("포켓몬 %s종, 새 작업 %s개 등록", len(pokemon_list), added)
+        else:
+            logger.error("포켓몬 목록을 가져올 수 없어 작업을 등록하지 않습니다")
+
+    if "move" in kinds:
+        move_id_mapping = get_move_id_mapping(logger=logger, fetcher=fetcher)
+        moves_list = get_generation_moves_data(generations=generations, logger=logger, fetcher=fetcher)
+        if moves_list:
+            queue.set_meta("move_id_mapping", move_id_mapping)
+            queue.set_meta("learnset_path", learnset_path)
+            added = queue.add_items("move", moves_list, reset=reset)
+            logger.info("기술 %s개, 새 작업 %s개 등록", len(moves_list), added)
+        else:
+            logger.error("기술 목록을 가져올 수 없어 작업을 등록하지 않습니다")
+
+    counts = queue.counts()
+    logger.info("작업 큐 %s: %s", queue_path, counts)
+    return counts
+
+
+def _claimed_items(queue, kind, worker_id, batch_size):
+    """빌릴 작업이 없을 때까지 batch_size 개씩 빌려 yield (pipeline_map 수집 스레드에서 필요할 때마다)"""
+    while True:
+        batch = queue.claim(kind, worker_id, batch_size)
+        if not batch:
+            return
+        yield from batch
+
+
+def run_worker(queue_path=QUEUE_PATH, kinds=KINDS, workers=4, parse_workers=0, rate=5.0, batch_size=16,
+               lease_seconds=120.0, parser_backend="html.parser", use_cache=True, worker_id=None, fetcher=None,
+               metrics_path=None, poll_seconds=2.0):
+    """큐의 작업이 모두 끝날 때까지 빌려서 처리 → {kind: (완료 수, 실패 수)}
+
+    workers / parse_workers / parser_backend: iter_pokemon_rows 와 같음 (이 작업자 안의 수집 스레드·파싱 프로세스)
+    rate: 모든 작업자가 함께 지키는 호스트별 요청 속도(초당), batch_size: 한 번에 빌리는 작업 수
+    lease_seconds: 작업을 빌리는 시간, lease_seconds/3 마다 연장하므로 작업자가 멈추면 그 뒤에 다른 작업자가 가져간다
+    다른 작업자가 빌린 작업만 남으면 poll_seconds 마다 다시 확인한다 (그 작업자가 멈춰 lease가 끝나면 가져감).
+    """
+    logger = setup_logging()
+    metrics = reset_metrics()
+    queue = WorkQueue(queue_path, lease_seconds=lease_seconds)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    fetcher = fetcher or Fetcher(pool_size=max(workers, 1), cache=HttpCache() if use_cache else None,
+                                 rate_limiter=SharedRateLimiter(queue_path, rate=rate, logger=logger), logger=logger)
+    parsers = {
+        "pokemon": partial(parse_pokemon_item, parser_backend=parser_backend),
+        "move": partial(parse_move_item, parser_backend=parser_backend,
+                        learnable=queue.get_meta("learnset_path") is None),
+    }
+    logger.info("=== 분산 수집 작업자 시작: %s (%s) ===", worker_id, queue_path)
+
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(lease_seconds / 3):
+            queue.heartbeat(worker_id)
+
+    heartbeat_thread = threading.Thread(target=heartbeat, name="queue-heartbeat", daemon=True)
+    heartbeat_thread.start()
+    summary = {kind: [0, 0] for kind in kinds}
+    try:
+        while True:
+            # 종류별로 빌릴 수 있는 작업을 모두 처리 (다른 작업자가 빌린 작업을 기다리지 않고 다음 종류로)
+            for kind in kinds:
+                buffer = []
+                claimed = _claimed_items(queue, kind, worker_id, batch_size)
+                results = pipeline_map(lambda item: fetcher.fetch(item["link"]), parsers[kind], claimed,
+                                       fetch_workers=workers, parse_workers=parse_workers)
+                for item, detail, error in results:
+                    if error:
+                        summary[kind][1] += 1
+                        logger.warning("상세 정보 수집 실패 (%s): %s", item["link"], error)
+                    else:
+                        summary[kind][0] += 1
+                    buffer.append((item["link"], detail, error))
+                    if len(buffer) >= batch_size:
+                        queue.finish(kind, worker_id, buffer)
+                        buffer = []
+                        logger.info("%s 진행: %s", kind, queue.counts(kind))
+                queue.finish(kind, worker_id, buffer)
+
+            if queue.unfinished(kinds) == 0:
+                break
+            # 다른 작업자가 빌린 작업만 남음: 끝나거나 lease가 만료되는지 주기적으로 확인
+            expiry = queue.next_expiry(kinds)
+            time.sleep(min(max(expiry - time.time(), 0.0) + 0.1, poll_seconds) if expiry else poll_seconds)
+    finally:
+        stop.set()
+        heartbeat_thread.join()
+
+    export_run_metrics(metrics, metrics_path, labels={"collector": "distributed_crawl", "worker": worker_id},
+                       logger=logger)
+    logger.info("=== 분산 수집 작업자 종료: %s, 처리/실패 %s ===", worker_id, summary)
+    return {kind: tuple(counts) for kind, counts in summary.items()}
+
+
+def merge_queue(queue_path=QUEUE_PATH, kinds=KINDS, allow_partial=False,
+                evolution_path="data/raw/pokemon_evolution.tsv", descriptions_path="data/raw/pokemon_descriptions.bin"):
+    """큐의 결과를 목록 순서대로 합쳐 출력 파일 생성 → {kind: 행 수}
+
+    상세 정보가 없는(실패한) 항목은 단일 프로세스 수집과 같이 목록 정보만으로 행을 만든다.
+    끝나지 않은 작업이 있으면 병합하지 않는다 (allow_partial=True면 그 항목도 목록 정보만으로 병합).
+    """
+    logger = setup_logging()
+    queue = WorkQueue(queue_path)
+    unfinished = queue.unfinished(kinds)
+    if unfinished and not allow_partial:
+        logger.error("끝나지 않은 작업 %s개가 있어 병합하지 않습니다: %s", unfinished, queue.counts())
+        return {}
+
+    merged = {}
+    if "pokemon" in kinds:
+        evolution_edges = EvolutionEdges()
+        descriptions = DescriptionStoreWriter()
+
+        def pokemon_rows():
+            for p, detail, _ in queue.results("pokemon"):
+                detail = detail or {}
+                evolution_edges.add_all(detail.get("evo_family"))
+                descriptions.add_descriptions(p["id"], detail.get("descriptions"))
+                yield build_pokemon_row(p, detail)
+
+        count, output_files, changeset = write_pokemon_data(rows=pokemon_rows())
+        if evolution_path:
+            with RowWriter(evolution_path, EVOLUTION_COLUMNS) as edge_writer:
+                for edge in evolution_edges.edges:
+                    edge_writer.write(edge)
+        if descriptions_path:
+            descriptions.save(descriptions_path)
+        merged["pokemon"] = count
+        logger.info("포켓몬 %s행 병합: %s, 진화 간선 %s개", count, ", ".join(output_files), len(evolution_edges))
+        if changeset.has_previous:
+            logger.info("포켓몬 변경 목록: %s → %s", changeset.summary(), changeset.path)
+
+    if "move" in kinds:
+        move_id_mapping = queue.get_meta("move_id_mapping", {})
+        learnset_path = queue.get_meta("learnset_path")
+        learnable = load_learnable(learnset_path) if learnset_path else None
+        rows = (build_move_row(move, detail or {}, move_id_mapping, learnable)
+                for move, detail, _ in queue.results("move"))
+        count, output_files, changeset = write_move_data(rows=rows)
+        merged["move"] = count
+        logger.info("기술 %s행 병합: %s", count, ", ".join(output_files))
+        if changeset.has_previous:
+            logger.info("기술 변경 목록: %s → %s", changeset.summary(), changeset.path)
+    return merged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["init", "work", "merge", "status"])
+    parser.add_argument("--queue", default=QUEUE_PATH, help="작업 큐(SQLite) 경로")
+    parser.add_argument("--kinds", nargs="+", default=KINDS, choices=KINDS)
+    parser.add_argument("--generations", type=int, nargs="+", default=list(range(1, 10)))
+    parser.add_argument("--learnset", default=None, help="learnset_basic.tsv 경로 (init, 주면 learnable 을 이 테이블로)")
+    parser.add_argument("--reset", action="store_true", help="init: 기존 작업을 지우고 새로 시작")
+    parser.add_argument("--workers", type=int, default=4, help="작업자당 수집 스레드 수")
+    parser.add_argument("--parse-workers", type=int, default=0, help="작업자당 파싱 프로세스 수 (0: 프로세스 없음)")
+    parser.add_argument("--rate", type=float, default=5.0, help="모든 작업자가 나눠 쓰는 호스트별 요청 속도(초당)")
+    parser.add_argument("--batch", type=int, default=16, help="한 번에 빌리는 작업 수")
+    parser.add_argument("--lease", type=float, default=120.0, help="작업 lease 시간(초)")
+    parser.add_argument("--no-cache", action="store_true", help="work: 디스크 캐시(HttpCache)를 쓰지 않음")
+    parser.add_argument("--partial", action="store_true", help="merge: 끝나지 않은 작업이 있어도 병합")
+    args = parser.parse_args()
+
+    if args.command == "init":
+        print(init_queue(args.queue, args.kinds, args.generations, args.learnset, args.rate, args.reset))
+    elif args.command == "work":
+        print(run_worker(args.queue, args.kinds, args.workers, args.parse_workers, args.rate, args.batch,
+                         args.lease, use_cache=not args.no_cache))
+    elif args.command == "merge":
+        merged = merge_queue(args.queue, args.kinds, args.partial)
+        print(f"병합 완료: {merged}" if merged else "병합하지 않음")
+    else:
+        print(WorkQueue(args.queue).counts())
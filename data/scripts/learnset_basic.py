@@ -0,0 +1,175 @@
+from functools import partial
+
+from tqdm import tqdm
+
+from util.archive import PageArchiveWriter
+from util.cache import HttpCache
+from util.checkpoint import CheckpointJournal
+from util.common import setup_logging
+from util.fetcher import Fetcher
+from util.metrics import export_run_metrics, reset_metrics, timed
+from util.ratelimit import RateLimiter
+from util.parsing import LEARNSET_PARTS, make_soup
+from util.pipeline import pipeline_map
+from util.writer import RowWriter
+
+from pokemon_basic import get_generation_pokemon_data
+
+LEARNSET_COLUMNS = ["pokemon_id", "move_name", "method", "level"]
+
+# h3 제목 → 학습 방법
+LEARN_METHODS = {
+    "Moves learnt by level up": "level_up",
+    "Egg moves": "egg",
+    "Move Tutor moves": "tutor",
+    "Moves learnt by TM": "tm",
+    "Moves learnt by HM": "hm",
+    "Moves learnt by TR": "tr",
+    "Pre-evolution moves": "pre_evolution",
+    "Transfer-only moves": "transfer",
+}
+
+
+def _learn_method(title):
+    title = title.strip()
+    return LEARN_METHODS.get(title, title.lower().replace(" ", "_"))
+
+
+def parse_learnset(html, logger=None, parser_backend="html.parser", partial=True):
+    """포켓몬 상세 페이지 HTML → 배울 수 있는 기술 목록 [{move_name, method, level}]
+
+    "Moves learned by ..." 섹션의 첫 번째(최신 게임) 탭만 읽는다.
+    h3 제목(레벨업/알/TM 등)이 학습 방법이고, 그 뒤의 data-table 행이 기술이다.
+    partial: True면 기술 탭 묶음(LEARNSET_PARTS)만 트리로 만든다.
+    """
+    with timed("parse.soup"):
+        soup = make_soup(html, parser_backend, LEARNSET_PARTS if partial else None)
+
+    moves = []
+    with timed("parse.learnset"):
+        tabset = soup.find("div", class_="tabset-moves-game")
+        panel = tabset.find("div", class_="sv-tabs-panel") if tabset else None
+        if not panel:
+            return moves
+
+        method = None
+        for el in panel.find_all(["h3", "table"]):
+            if el.name == "h3":
+                method = _learn_method(el.get_text())
+                continue
+            if method is None or "data-table" not in el.get("class", ()):
+                continue
+            for row in el.select("tbody tr"):
+                try:
+                    move_link = row.select_one("a.ent-name")
+                    if not move_link:
+                        continue
+                    level = None
+                    if method == "level_up":
+                        level_cell = row.select_one("td.cell-num")
+                        level_text = level_cell.text.strip() if level_cell else ""
+                        level = int(level_text) if level_text.isdigit() else None
+                    moves.append({"move_name": move_link.text.strip(), "method": method, "level": level})
+                except Exception as e:
+                    if logger:
+                        logger.debug("기술 표 행 파싱 오류: %s", e)
+    return moves
+
+
+def parse_learnset_item(p, html, parser_backend="html.parser"):
+    """파이프라인 파싱 단계: 목록 항목 + 상세 페이지 HTML → 기술 목록 (파싱 프로세스에서 실행)"""
+    return parse_learnset(html, parser_backend=parser_backend)
+
+
+def iter_learnset_rows(generations=[1], workers=1, rate=5.0, fetcher=None,
+                       resume=False, checkpoint_path="data/raw/learnset_basic.checkpoint.jsonl",
+                       parser_backend="html.parser", parse_workers=0,
+                       metrics_path="data/raw/learnset_basic.metrics.json", prometheus_path=None,
+                       archive_path=None):
+    """포켓몬별 배울 수 있는 기술을 (pokemon_id, move_name, method, level) 행으로 yield
+
+    pokemon_basic 과 같은 포켓몬 상세 페이지를 읽으므로, 같은 디스크 캐시(HttpCache)를
+    쓰면 포켓몬 수집 후에는 네트워크 요청 없이 만들어진다. 폼이 달라 링크가 같은
+    포켓몬은 한 번만 (목록의 첫 번째 ID로) 기록한다.
+    나머지 인자는 iter_pokemon_rows와 같다.
+    """
+    logger = setup_logging()
+    metrics = reset_metrics()
+    archive = PageArchiveWriter(archive_path) if archive_path and fetcher is None else None
+    fetcher = fetcher or Fetcher(pool_size=max(workers, 1), cache=HttpCache(),
+                                 rate_limiter=RateLimiter(rate=rate, logger=logger), archive=archive, logger=logger)
+    logger.info("=== 기술 학습 정보 수집 시작 ===")
+    journal = None
+
+    try:
+        pokemon_list = get_generation_pokemon_data(generations=generations, logger=logger, fetcher=fetcher)
+        if not pokemon_list:
+            logger.error("포켓몬 데이터를 가져올 수 없습니다. 프로그램을 종료합니다.")
+            return
+
+        # 링크 기준으로 중복 제거 (폼 차이)
+        seen_links = set()
+        pages = []
+        for p in pokemon_list:
+            if p["link"] not in seen_links:
+                seen_links.add(p["link"])
+                pages.append(p)
+        logger.info("%s종 포켓몬 기술 학습 정보 수집", len(pages))
+
+        row_count = 0
+        error_count = 0
+        journal = CheckpointJournal(checkpoint_path, resume=resume)
+        if journal.completed:
+            logger.info("체크포인트에서 %s건 복원: %s", len(journal.completed), checkpoint_path)
+
+        def fetch_html(p):
+            if p["link"] in journal.completed:
+                return None
+            return fetcher.fetch(p["link"])
+
+        parse = partial(parse_learnset_item, parser_backend=parser_backend)
+        results = pipeline_map(fetch_html, parse, pages, fetch_workers=workers, parse_workers=parse_workers)
+        for p, moves, error in tqdm(results, total=len(pages), desc="기술 학습 정보 수집"):
+            if error:
+                error_count += 1
+                logger.warning("기술 학습 정보 수집 실패 (%s): %s", p["link"], error)
+                continue
+            if moves is None:
+                moves = journal.completed[p["link"]]
+            else:
+                journal.record(p["link"], moves)
+
+            for move in moves:
+                row_count += 1
+                yield {"pokemon_id": p["id"], **move}
+
+        export_run_metrics(metrics, metrics_path, prometheus_path, labels={"collector": "learnset_basic"}, logger=logger)
+        logger.info("기술 학습 정보 수집 완료: %s행, 실패 %s종", row_count, error_count)
+        logger.info("=== 기술 학습 정보 수집 완료 ===")
+
+    except Exception as e:
+        logger.error("데이터 수집 중 심각한 오류 발생: %s", e)
+    finally:
+        # 소비자가 중간에 멈추거나(break) 예외가 나도 저널 파일을 닫는다
+        if journal is not None:
+            journal.close()
+        if archive is not None:
+            archive.close()
+
+
+def write_learnset_data(output_file="data/raw/learnset_basic.tsv", **kwargs):
+    """iter_learnset_rows 결과를 TSV에 기록 (kwargs 는 iter_learnset_rows 인자) → 기록한 행 수"""
+    with RowWriter(output_file, LEARNSET_COLUMNS) as writer:
+        for row in iter_learnset_rows(**kwargs):
+            writer.write(row)
+    return writer.count
+
+
+if __name__ == "__main__":
+    # pokemon_basic.py 실행 후 같은 캐시로 수집하면 추가 요청이 거의 없다
+    output_file = "data/raw/learnset_basic.tsv"
+    count = write_learnset_data(output_file, generations=[1,2,3,4,5,6,7,8,9], workers=4, parse_workers=None,
+                                archive_path="data/raw/pages.archive")
+
+    if count > 0:
+        print(f"수집 완료: 총 {count}행 기술 학습 데이터 {output_file}에 저장됨")
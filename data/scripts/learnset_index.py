@@ -0,0 +1,45 @@
+import csv
+import os
+
+from util.common import setup_logging
+from util.learnset import LearnsetIndex, pairs_from_learnset_table, pairs_from_move_table, write_pairs
+
+MOVE_TSV = "data/raw/move_basic.tsv"
+LEARNSET_TSV = "data/raw/learnset_basic.tsv"
+PAIRS_TSV = "data/raw/learnset_pairs.tsv"
+INDEX_PATH = "data/raw/learnset_index.bin"
+
+
+def _read_tsv(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f, delimiter="\t"))
+
+
+def build_learnset_index(move_tsv=MOVE_TSV, learnset_tsv=LEARNSET_TSV,
+                         pairs_path=PAIRS_TSV, index_path=INDEX_PATH):
+    """수집 결과 → 정수 키 조인 테이블 + 양방향 CSR 인덱스 저장
+
+    learnset_basic.tsv 가 있으면 그 테이블(기술 이름은 move_basic 의 ID로 변환)을,
+    없으면 move_basic.tsv 의 learnable 열을 풀어서 사용한다.
+    """
+    logger = setup_logging()
+    move_rows = _read_tsv(move_tsv)
+
+    if learnset_tsv and os.path.exists(learnset_tsv):
+        move_ids = {row["name_en"]: int(row["id"]) for row in move_rows if row.get("id", "").isdigit()}
+        pairs = pairs_from_learnset_table(_read_tsv(learnset_tsv), move_ids)
+        source = learnset_tsv
+    else:
+        pairs = pairs_from_move_table(move_rows)
+        source = move_tsv
+
+    index = LearnsetIndex.from_pairs(pairs)
+    write_pairs(pairs_path, pairs)
+    index.save(index_path)
+    logger.info("learnset 인덱스 생성 (%s): %s쌍 → %s, %s", source, len(pairs), pairs_path, index_path)
+    return index
+
+
+if __name__ == "__main__":
+    index = build_learnset_index()
+    print(f"저장 완료: {len(index)}쌍 {PAIRS_TSV}, {INDEX_PATH}")
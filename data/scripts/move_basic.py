@@ -1,16 +1,75 @@
-import requests
+import asyncio
+import csv
+import os
+
 from bs4 import BeautifulSoup
 import pandas as pd
 from tqdm import tqdm
-import time
+from functools import partial
 
+from util.archive import PageArchiveWriter
+from util.async_fetcher import AsyncFetcher
+from util.cache import HttpCache
+from util.checkpoint import CheckpointJournal
 from util.common import setup_logging
+from util.delta import ChangesetWriter, PageHashStore, page_hash, parser_version
+from util.fetcher import Fetcher, get_default_fetcher
+from util.metrics import export_run_metrics, reset_metrics, timed
+from util.ratelimit import RateLimiter
+from util.parsing import SectionIndex, make_soup
+from util.pipeline import pipeline_map
+from util.columnar import HAS_PYARROW
+from util.writer import TeeWriter, open_writer
+
+# 로컬 스텁 서버(bench/site_server.py) 등으로 바꿀 때는 환경 변수로 지정
+BASE_URL = os.environ.get("PORODECK_BASE_URL", "https://pokemondb.net").rstrip("/")
+BULBAPEDIA_URL = os.environ.get("PORODECK_BULBAPEDIA_URL", "https://bulbapedia.bulbagarden.net").rstrip("/")
+
+# "Learnt ..." 섹션의 포켓몬 카드 목록 div
+LEARNT_DIV = ("infocard-list", "infocard-list-pkmn-md")
 
-BASE_URL = "https://pokemondb.net"
-BULBAPEDIA_URL = "https://bulbapedia.bulbagarden.net"
+def parse_move_id_mapping(html, logger=None):
+    """Bulbapedia List_of_moves 페이지 HTML 파싱 → {기술 이름(소문자): ID}"""
+    move_id_mapping = {}
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # sortable roundy 테이블 찾기
+    main_table = soup.find('table', class_=['sortable', 'roundy'])
+    if not main_table:
+        if logger:
+            logger.error("Bulbapedia에서 기술 테이블을 찾을 수 없습니다")
+        return move_id_mapping
+    
+    rows = main_table.find_all('tr')
+    if logger:
+        logger.info("총 %s개 기술 정보 처리 중...", len(rows)-1)
+    
+    for i, row in enumerate(rows[1:], 1):  # 헤더 제외
+        try:
+            cells = row.find_all(['td', 'th'])
+            if len(cells) < 2:
+                continue
+            
+            # ID (첫 번째 열)
+            move_id = cells[0].get_text().strip()
+            
+            # 이름 (두 번째 열)
+            name_cell = cells[1]
+            name_link = name_cell.find('a')
+            if name_link:
+                move_name = name_link.get_text().strip()
+                move_id_mapping[move_name.lower()] = move_id
+            
+        except Exception as e:
+            if logger:
+                logger.debug("Bulbapedia 행 %s 파싱 오류: %s", i, e)
+            continue
+    
+    return move_id_mapping
 
-def get_move_id_mapping(logger=None):
+def get_move_id_mapping(logger=None, fetcher=None):
     """Bulbapedia에서 기술 ID와 이름 매핑 딕셔너리 생성"""
+    fetcher = fetcher or get_default_fetcher()
     if logger:
         logger.info("Bulbapedia에서 기술 ID와 이름 매핑 수집 시작")
     
@@ -18,412 +77,609 @@ def get_move_id_mapping(logger=None):
     
     try:
         url = f"{BULBAPEDIA_URL}/wiki/List_of_moves"
-        res = requests.get(url)
-        res.raise_for_status()
+        html = fetcher.fetch(url)
         
-        soup = BeautifulSoup(res.text, "html.parser")
+        move_id_mapping = parse_move_id_mapping(html, logger=logger)
         
-        # sortable roundy 테이블 찾기
-        main_table = soup.find('table', class_=['sortable', 'roundy'])
-        if not main_table:
-            if logger:
-                logger.error("Bulbapedia에서 기술 테이블을 찾을 수 없습니다")
-            return move_id_mapping
-        
-        rows = main_table.find_all('tr')
-        if logger:
-            logger.info(f"총 {len(rows)-1}개 기술 정보 처리 중...")
-        
-        for i, row in enumerate(rows[1:], 1):  # 헤더 제외
-            try:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 2:
-                    continue
-                
-                # ID (첫 번째 열)
-                move_id = cells[0].get_text().strip()
-                
-                # 이름 (두 번째 열)
-                name_cell = cells[1]
-                name_link = name_cell.find('a')
-                if name_link:
-                    move_name = name_link.get_text().strip()
-                    move_id_mapping[move_name.lower()] = move_id
-                
-            except Exception as e:
-                if logger:
-                    logger.debug(f"Bulbapedia 행 {i} 파싱 오류: {str(e)}")
-                continue
-        
-        if logger:
-            logger.info(f"기술 ID 매핑 완료: {len(move_id_mapping)}개 기술")
+        if logger and move_id_mapping:
+            logger.info("기술 ID 매핑 완료: %s개 기술", len(move_id_mapping))
         
     except Exception as e:
         if logger:
-            logger.error(f"Bulbapedia 기술 매핑 수집 실패: {str(e)}")
+            logger.error("Bulbapedia 기술 매핑 수집 실패: %s", e)
     
     return move_id_mapping
 
-def get_generation_moves_data(generations=[1], logger=None):
+def parse_generation_moves_page(html, gen, logger=None):
+    """세대별 기술 목록 페이지 HTML 파싱 (기술 테이블이 없으면 None)"""
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # 메인 테이블 찾기
+    table = soup.find('table', class_=['data-table', 'sticky-header', 'block-wide'])
+    if not table:
+        return None
+    
+    moves_data = []
+    rows = table.find_all('tr')
+    
+    for row in rows[1:]:  # 헤더 제외
+        try:
+            cells = row.find_all('td')
+            if len(cells) < 7:
+                continue
+            
+            # 이름과 링크 (첫 번째 셀)
+            name_link = cells[0].find('a')
+            if not name_link:
+                continue
+            
+            name = name_link.get_text().strip()
+            link = BASE_URL + name_link.get('href', '')
+            
+            # 타입 (두 번째 셀)
+            type_link = cells[1].find('a')
+            move_type = type_link.get_text().strip() if type_link else cells[1].get_text().strip()
+            
+            # 카테고리 (세 번째 셀) - 물리/특수/상태
+            category = cells[2].get_text().strip()
+            
+            # 위력 (네 번째 셀)
+            power = cells[3].get_text().strip()
+            if power == '—' or power == '-':
+                power = None
+            else:
+                try:
+                    power = int(power)
+                except:
+                    power = None
+            
+            # 명중률 (다섯 번째 셀)
+            accuracy = cells[4].get_text().strip()
+            if accuracy == '—' or accuracy == '-':
+                accuracy = None
+            elif accuracy == '∞' or 'inf' in accuracy.lower():
+                accuracy = "inf"
+            else:
+                try:
+                    accuracy = int(accuracy)
+                except:
+                    accuracy = None
+            
+            # PP (여섯 번째 셀)
+            pp = cells[5].get_text().strip()
+            try:
+                pp = int(pp)
+            except:
+                pp = None
+            
+            # 효과 (일곱 번째 셀)
+            effects = cells[6].get_text().strip()
+            
+            moves_data.append({
+                "name_en": name,
+                "link": link,
+                "type": move_type,
+                "category": category,
+                "power": power,
+                "accuracy": accuracy,
+                "pp": pp,
+                "effects": effects,
+                "generation": gen
+            })
+            
+        except Exception as e:
+            if logger:
+                logger.debug("기술 행 파싱 오류: %s", e)
+            continue
+    
+    return moves_data
+
+def get_generation_moves_data(generations=[1], logger=None, fetcher=None):
     """세대별 기술 데이터 수집"""
+    fetcher = fetcher or get_default_fetcher()
     if logger:
-        logger.info(f"세대별 기술 데이터 수집 시작: {generations}세대")
+        logger.info("세대별 기술 데이터 수집 시작: %s세대", generations)
     
     moves_data = []
     
     for gen in generations:
         if logger:
-            logger.debug(f"{gen}세대 기술 정보 수집 중...")
+            logger.debug("%s세대 기술 정보 수집 중...", gen)
         
         try:
             url = f"{BASE_URL}/move/generation/{gen}"
-            res = requests.get(url)
-            res.raise_for_status()
+            html = fetcher.fetch(url)
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            
-            # 메인 테이블 찾기
-            table = soup.find('table', class_=['data-table', 'sticky-header', 'block-wide'])
-            if not table:
+            with timed("parse.list_page"):
+                gen_data = parse_generation_moves_page(html, gen, logger=logger)
+            if gen_data is None:
                 if logger:
-                    logger.warning(f"{gen}세대 기술 테이블을 찾을 수 없습니다")
+                    logger.warning("%s세대 기술 테이블을 찾을 수 없습니다", gen)
                 continue
+            moves_data.extend(gen_data)
             
-            rows = table.find_all('tr')
-            gen_count = 0
-            
-            for row in rows[1:]:  # 헤더 제외
-                try:
-                    cells = row.find_all('td')
-                    if len(cells) < 7:
-                        continue
-                    
-                    # 이름과 링크 (첫 번째 셀)
-                    name_link = cells[0].find('a')
-                    if not name_link:
-                        continue
-                    
-                    name = name_link.get_text().strip()
-                    link = BASE_URL + name_link.get('href', '')
-                    
-                    # 타입 (두 번째 셀)
-                    type_link = cells[1].find('a')
-                    move_type = type_link.get_text().strip() if type_link else cells[1].get_text().strip()
-                    
-                    # 카테고리 (세 번째 셀) - 물리/특수/상태
-                    category = cells[2].get_text().strip()
-                    
-                    # 위력 (네 번째 셀)
-                    power = cells[3].get_text().strip()
-                    if power == '—' or power == '-':
-                        power = None
+            if logger:
+                logger.info("%s세대: %s개 기술 수집 완료", gen, len(gen_data))
+                
+        except Exception as e:
+            if logger:
+                logger.error("%s세대 기술 정보 수집 실패: %s", gen, e)
+            continue
+    
+    if logger:
+        logger.info("세대별 기술 데이터 수집 완료: 총 %s개", len(moves_data))
+    
+    return moves_data
+
+
+async def async_get_generation_moves_data(generations=[1], logger=None, fetcher=None):
+    """get_generation_moves_data 의 asyncio 버전: 모든 세대 목록 페이지를 동시에 요청
+
+    fetcher: AsyncFetcher (없으면 디스크 캐시를 쓰는 AsyncFetcher를 만들어 쓰고 닫음)
+    """
+    if fetcher is None:
+        async with AsyncFetcher(cache=HttpCache(), logger=logger) as fetcher:
+            return await async_get_generation_moves_data(generations, logger=logger, fetcher=fetcher)
+    if logger:
+        logger.info("세대별 기술 데이터 수집 시작: %s세대", generations)
+
+    urls = [f"{BASE_URL}/move/generation/{gen}" for gen in generations]
+    pages = await fetcher.fetch_all(urls)
+
+    moves_data = []
+    for gen, html in zip(generations, pages):
+        if isinstance(html, Exception):
+            if logger:
+                logger.error("%s세대 기술 정보 수집 실패: %s", gen, html)
+            continue
+        with timed("parse.list_page"):
+            gen_data = parse_generation_moves_page(html, gen, logger=logger)
+        if gen_data is None:
+            if logger:
+                logger.warning("%s세대 기술 테이블을 찾을 수 없습니다", gen)
+            continue
+        moves_data.extend(gen_data)
+        if logger:
+            logger.info("%s세대: %s개 기술 수집 완료", gen, len(gen_data))
+
+    if logger:
+        logger.info("세대별 기술 데이터 수집 완료: 총 %s개", len(moves_data))
+    return moves_data
+
+
+def _parse_move_vitals(index, data, logger=None):
+    """기본 정보 (첫 번째 vitals-table: Type, Category, Power, Accuracy, PP)"""
+    first_table = index.table_with_class("vitals-table")
+    if not first_table:
+        return
+    rows = first_table.find_all('tr')
+    for row in rows:
+        try:
+            th = row.find('th')
+            td = row.find('td')
+            if th and td:
+                key = th.get_text().strip()
+                value = td.get_text().strip()
+                
+                if key == "Type":
+                    data["type"] = value
+                elif key == "Category":
+                    data["category"] = value
+                elif key == "Power":
+                    if value == '—' or value == '-':
+                        data["power"] = None
                     else:
                         try:
-                            power = int(power)
+                            data["power"] = int(value)
                         except:
-                            power = None
-                    
-                    # 명중률 (다섯 번째 셀)
-                    accuracy = cells[4].get_text().strip()
-                    if accuracy == '—' or accuracy == '-':
-                        accuracy = None
-                    elif accuracy == '∞' or 'inf' in accuracy.lower():
-                        accuracy = "inf"
+                            data["power"] = None
+                elif key == "Accuracy":
+                    if value == '—' or value == '-':
+                        data["accuracy"] = None
+                    elif '∞' in value or 'inf' in value.lower():
+                        data["accuracy"] = "inf"
                     else:
                         try:
-                            accuracy = int(accuracy)
+                            # "100%" → "100"
+                            clean_value = value.replace('%', '').strip()
+                            data["accuracy"] = int(clean_value)
                         except:
-                            accuracy = None
-                    
-                    # PP (여섯 번째 셀)
-                    pp = cells[5].get_text().strip()
+                            data["accuracy"] = None
+                elif key == "PP":
+                    # "25 (max. 40)" → "25"
+                    pp_value = value.split()[0].strip()
                     try:
-                        pp = int(pp)
+                        data["pp"] = int(pp_value)
                     except:
-                        pp = None
-                    
-                    # 효과 (일곱 번째 셀)
-                    effects = cells[6].get_text().strip()
-                    
-                    moves_data.append({
-                        "name_en": name,
-                        "link": link,
-                        "type": move_type,
-                        "category": category,
-                        "power": power,
-                        "accuracy": accuracy,
-                        "pp": pp,
-                        "effects": effects,
-                        "generation": gen
-                    })
-                    gen_count += 1
-                    
-                except Exception as e:
-                    if logger:
-                        logger.debug(f"기술 행 파싱 오류: {str(e)}")
-                    continue
-            
-            if logger:
-                logger.info(f"{gen}세대: {gen_count}개 기술 수집 완료")
-                
+                        data["pp"] = None
         except Exception as e:
             if logger:
-                logger.error(f"{gen}세대 기술 정보 수집 실패: {str(e)}")
+                logger.debug("기본 정보 파싱 오류: %s", e)
             continue
-            
-        time.sleep(0.5)
+
+
+def _parse_move_korean_name(index, data, logger=None):
+    """한글 이름 수집 (Other languages 섹션에서)"""
+    data["name_kr"] = None
+    section = index.find('Other languages')
+    if section and section.table:
+        rows = section.table.find_all('tr')
+        for row in rows:
+            cells = row.find_all(['th', 'td'])
+            if len(cells) >= 2:
+                lang = cells[0].get_text().strip()
+                name = cells[1].get_text().strip()
+                if 'Korean' in lang:
+                    data["name_kr"] = name
+                    break
+
+
+def _parse_move_target(index, data, logger=None):
+    """Target 정보 수집 (Move target 섹션에서)"""
+    data["target"] = None
+    section = index.find('Move target')
+    if not section:
+        return
+    next_element = section.heading.find_next_sibling()
+    while next_element and next_element.name != 'h2':
+        if next_element.name == 'p':
+            target_text = next_element.get_text().strip()
+            if target_text:
+                data["target"] = target_text
+                break
+        next_element = next_element.find_next_sibling()
+
+
+def _parse_move_description(index, data, logger=None):
+    """Description 수집 (Game descriptions 섹션의 마지막 세대)"""
+    data["description"] = None
+    section = index.find('Game descriptions')
+    if section and section.table:
+        rows = section.table.find_all('tr')
+        if rows:
+            # 마지막 행 (가장 최신 세대)
+            last_row = rows[-1]
+            cells = last_row.find_all(['th', 'td'])
+            if len(cells) >= 2:
+                desc = cells[1].get_text().strip()
+                data["description"] = desc
+
+
+def _parse_move_learnable(index, data, logger=None):
+    """Learnable 포켓몬 정보 수집 (모든 학습 방법)"""
+    learnable_pokemon_ids = set()
     
-    if logger:
-        logger.info(f"세대별 기술 데이터 수집 완료: 총 {len(moves_data)}개")
+    # "Learnt"로 시작하는 모든 섹션
+    for section in index.sections:
+        if not section.title.strip().startswith('Learnt'):
+            continue
+        infocard_div = section.div(LEARNT_DIV)
+        if infocard_div:
+            # infocard 클래스 div들 찾기
+            infocard_divs = infocard_div.find_all('div', class_='infocard')
+            for infocard in infocard_divs:
+                # <small>#0005</small> 형태의 ID 찾기
+                small_tag = infocard.find('small')
+                if small_tag:
+                    id_text = small_tag.get_text().split('/')[0].strip()
+                    if id_text.startswith('#'):
+                        # "#0005" -> "0005" 형태로 변환
+                        pokemon_id = id_text[1:]  # # 제거
+                        learnable_pokemon_ids.add(pokemon_id)
     
-    return moves_data
+    # learnable_pokemon_ids를 콤마로 구분된 문자열로 변환
+    data["learnable"] = ','.join(sorted(learnable_pokemon_ids)) if learnable_pokemon_ids else None
+
 
-def get_move_details(link, logger=None):
+def parse_move_details(html, logger=None, parser_backend="html.parser", learnable=True):
+    """기술 상세 페이지 HTML 파싱
+
+    문서를 한 번 순회해 섹션 색인을 만든 뒤 각 추출기가 색인을 공유한다.
+    Move target 추출이 h2의 형제 요소를 따라가므로 부분 파싱은 하지 않는다.
+    parser_backend: "html.parser" / "lxml" / "selectolax" / "auto"
+    learnable: False면 Learnt 섹션(페이지에서 가장 큰 부분)을 읽지 않는다 (learnset 테이블을 쓰는 경우)
+    """
+    with timed("parse.soup"):
+        soup = make_soup(html, parser_backend)
+    with timed("parse.index"):
+        index = SectionIndex(soup, div_classes=[LEARNT_DIV] if learnable else [])
+    data = {}
+
+    # 추출기별 소요 시간은 parse.<이름> 히스토그램으로 기록
+    with timed("parse.move_vitals"):
+        _parse_move_vitals(index, data, logger)
+    with timed("parse.move_korean_name"):
+        _parse_move_korean_name(index, data, logger)
+    with timed("parse.move_target"):
+        _parse_move_target(index, data, logger)
+    with timed("parse.move_description"):
+        _parse_move_description(index, data, logger)
+    if learnable:
+        with timed("parse.move_learnable"):
+            _parse_move_learnable(index, data, logger)
+    return data
+
+
+def get_move_details(link, logger=None, fetcher=None, parser_backend="html.parser"):
     """기술 상세 정보 수집"""
+    fetcher = fetcher or get_default_fetcher()
     try:
-        res = requests.get(link)
-        res.raise_for_status()
-        
-        soup = BeautifulSoup(res.text, "html.parser")
-        data = {}
-        
-        # 기본 정보 (첫 번째 vitals-table에서)
-        vitals_tables = soup.find_all('table', class_='vitals-table')
-        
-        if vitals_tables:
-            # 첫 번째 테이블: Type, Category, Power, Accuracy, PP
-            first_table = vitals_tables[0]
-            rows = first_table.find_all('tr')
-            for row in rows:
-                try:
-                    th = row.find('th')
-                    td = row.find('td')
-                    if th and td:
-                        key = th.get_text().strip()
-                        value = td.get_text().strip()
-                        
-                        if key == "Type":
-                            data["type"] = value
-                        elif key == "Category":
-                            data["category"] = value
-                        elif key == "Power":
-                            if value == '—' or value == '-':
-                                data["power"] = None
-                            else:
-                                try:
-                                    data["power"] = int(value)
-                                except:
-                                    data["power"] = None
-                        elif key == "Accuracy":
-                            if value == '—' or value == '-':
-                                data["accuracy"] = None
-                            elif '∞' in value or 'inf' in value.lower():
-                                data["accuracy"] = "inf"
-                            else:
-                                try:
-                                    # "100%" → "100"
-                                    clean_value = value.replace('%', '').strip()
-                                    data["accuracy"] = int(clean_value)
-                                except:
-                                    data["accuracy"] = None
-                        elif key == "PP":
-                            # "25 (max. 40)" → "25"
-                            pp_value = value.split()[0].strip()
-                            try:
-                                data["pp"] = int(pp_value)
-                            except:
-                                data["pp"] = None
-                except Exception as e:
-                    if logger:
-                        logger.debug(f"기본 정보 파싱 오류: {str(e)}")
-                    continue
-        
-        # 한글 이름 수집 (Other languages 섹션에서)
-        data["name_kr"] = None
-        h2_tags = soup.find_all('h2')
-        for h2 in h2_tags:
-            if 'Other languages' in h2.get_text():
-                next_table = h2.find_next('table')
-                if next_table:
-                    rows = next_table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all(['th', 'td'])
-                        if len(cells) >= 2:
-                            lang = cells[0].get_text().strip()
-                            name = cells[1].get_text().strip()
-                            if 'Korean' in lang:
-                                data["name_kr"] = name
-                                break
-                break
-        
-        # Target 정보 수집 (Move target 섹션에서)
-        data["target"] = None
-        for h2 in h2_tags:
-            if 'Move target' in h2.get_text():
-                next_element = h2.find_next_sibling()
-                while next_element and next_element.name != 'h2':
-                    if next_element.name == 'p':
-                        target_text = next_element.get_text().strip()
-                        if target_text:
-                            data["target"] = target_text
-                            break
-                    next_element = next_element.find_next_sibling()
-                break
-        
-        # Description 수집 (Game descriptions 섹션의 마지막 세대)
-        data["description"] = None
-        for h2 in h2_tags:
-            if 'Game descriptions' in h2.get_text():
-                next_table = h2.find_next('table')
-                if next_table:
-                    rows = next_table.find_all('tr')
-                    if rows:
-                        # 마지막 행 (가장 최신 세대)
-                        last_row = rows[-1]
-                        cells = last_row.find_all(['th', 'td'])
-                        if len(cells) >= 2:
-                            desc = cells[1].get_text().strip()
-                            data["description"] = desc
-                break
-        
-        # Learnable 포켓몬 정보 수집 (모든 학습 방법)
-        learnable_pokemon_ids = set()
-        
-        # "Learnt"로 시작하는 모든 섹션 찾기
-        for h2 in h2_tags:
-            h2_text = h2.get_text().strip()
-            if h2_text.startswith('Learnt'):
-                infocard_div = h2.find_next('div', class_=['infocard-list', 'infocard-list-pkmn-md'])
-                if infocard_div:
-                    # infocard 클래스 div들 찾기
-                    infocard_divs = infocard_div.find_all('div', class_='infocard')
-                    for infocard in infocard_divs:
-                        # <small>#0005</small> 형태의 ID 찾기
-                        small_tag = infocard.find('small')
-                        if small_tag:
-                            id_text = small_tag.get_text().split('/')[0].strip()
-                            if id_text.startswith('#'):
-                                # "#0005" -> "0005" 형태로 변환
-                                pokemon_id = id_text[1:]  # # 제거
-                                learnable_pokemon_ids.add(pokemon_id)
-        
-        # learnable_pokemon_ids를 콤마로 구분된 문자열로 변환
-        data["learnable"] = ','.join(sorted(learnable_pokemon_ids)) if learnable_pokemon_ids else None
-        
-        return data
+        html = fetcher.fetch(link)
+        return parse_move_details(html, logger=logger, parser_backend=parser_backend)
         
     except Exception as e:
         if logger:
-            logger.warning(f"기술 상세 정보 수집 실패 ({link}): {str(e)}")
+            logger.warning("기술 상세 정보 수집 실패 (%s): %s", link, e)
         return {}
 
-def collect_all_moves_data(generations=[1]):
-    """모든 기술 데이터 수집"""
+
+async def async_get_move_details(link, logger=None, fetcher=None, parser_backend="html.parser"):
+    """get_move_details 의 asyncio 버전 (fetcher: AsyncFetcher, 파싱은 기본 스레드 풀에서 실행)"""
+    try:
+        html = await fetcher.fetch(link)
+        parse = partial(parse_move_details, html, logger=logger, parser_backend=parser_backend)
+        return await asyncio.get_running_loop().run_in_executor(None, parse)
+
+    except Exception as e:
+        if logger:
+            logger.warning("기술 상세 정보 수집 실패 (%s): %s", link, e)
+        return {}
+
+def parse_move_item(move, html, parser_backend="html.parser", learnable=True):
+    """파이프라인 파싱 단계: 목록 항목 + 상세 페이지 HTML → 상세 정보 (파싱 프로세스에서 실행)"""
+    return parse_move_details(html, parser_backend=parser_backend, learnable=learnable)
+
+
+def load_learnable(learnset_path):
+    """learnset 테이블(learnset_basic.tsv) → {기술 이름: 콤마로 구분된 포켓몬 ID 문자열}"""
+    learnable = {}
+    with open(learnset_path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            learnable.setdefault(row["move_name"], set()).add(row["pokemon_id"])
+    return {name: ",".join(sorted(ids)) for name, ids in learnable.items()}
+
+MOVE_COLUMNS = [
+    "id", "name_en", "name_kr", "type", "category", "power", "accuracy", "pp",
+    "effects", "description", "target", "learnable", "generation", "link",
+]
+
+# Parquet 출력 열 타입 (지정하지 않은 열은 string, 명중률 "inf"는 inf)
+MOVE_PARQUET_TYPES = {
+    "id": "uint16", "type": "category", "category": "category",
+    "power": "uint8", "accuracy": "float32", "pp": "uint8", "generation": "uint8",
+}
+
+def build_move_row(move, detail, move_id_mapping, learnable=None):
+    """목록 항목 + 상세 정보 + ID 매핑 → 출력 행
+
+    learnable: load_learnable 결과, 주면 상세 페이지 대신 learnset 테이블로 learnable 을 채운다.
+    """
+    # ID 매핑에서 ID 찾기
+    move_id = move_id_mapping.get(move["name_en"].lower())
+    
+    # power와 pp를 정수형으로 변환
+    power = detail.get("power", move["power"])
+    if power is not None:
+        power = int(power)
+    
+    pp = detail.get("pp", move["pp"])
+    if pp is not None:
+        pp = int(pp)
+    
+    return {
+        "id": move_id,
+        "name_en": move["name_en"],
+        "name_kr": detail.get("name_kr"),
+        "type": detail.get("type", move["type"]),
+        "category": detail.get("category", move["category"]),
+        "power": power,
+        "accuracy": detail.get("accuracy", move["accuracy"]),
+        "pp": pp,
+        "effects": move["effects"],
+        "description": detail.get("description"),
+        "target": detail.get("target"),
+        "learnable": learnable.get(move["name_en"]) if learnable is not None else detail.get("learnable"),
+        "generation": move["generation"],
+        "link": move["link"]
+    }
+
+def iter_move_rows(generations=[1], workers=1, rate=5.0, fetcher=None,
+                   resume=False, checkpoint_path="data/raw/move_basic.checkpoint.jsonl",
+                   parser_backend="html.parser", parse_workers=0,
+                   metrics_path="data/raw/move_basic.metrics.json", prometheus_path=None,
+                   learnset_path=None, fetch_details=True, refresh_path=None, archive_path=None):
+    """기술 데이터를 한 행씩 수집해 목록 순서대로 yield
+
+    workers: 상세 페이지 동시 다운로드 스레드 수 (1이면 순차 수집)
+    rate: 호스트별 목표 요청 속도(초당 요청 수), 429/503 응답 시 자동 감속 후 다시 회복
+    fetcher: 공용 HTTP 수집기 (없으면 workers 크기의 커넥션 풀 + 디스크 캐시 + rate 제한으로 생성)
+    resume: True면 checkpoint_path 저널에 기록된 완료 항목은 다시 수집하지 않고 결과에 병합
+    parser_backend: 상세 페이지 HTML 파서 ("html.parser" / "lxml" / "selectolax" / "auto")
+    parse_workers: 상세 페이지 파싱 프로세스 수 (0이면 별도 프로세스 없이 파싱, None이면 CPU 코어 수)
+    metrics_path: 단계별 계측 요약(JSON) 저장 경로, prometheus_path: Prometheus textfile 경로 (선택)
+    learnset_path: learnset_basic.py 결과(TSV), 주면 learnable 을 이 테이블에서 채우고
+                   기술 페이지의 Learnt 섹션은 파싱하지 않는다
+    fetch_details: False면 기술 페이지를 요청하지 않는다 (name_kr/description/target 은 비어 있음).
+                   "missing"이면 refresh_path 저장소에 추출 결과가 없는 기술 페이지(새 기술)만 요청하고,
+                   나머지는 저장된 name_kr/description/target 을 그대로 쓴다 (learnset_path 와 함께 쓰면
+                   기술 페이지 요청 대부분이 없어진다). 저장된 결과는 추출기가 바뀌어도 다시 만들지 않으므로
+                   그때는 True 로 수집하거나 reparse.py 를 실행한다. refresh_path 가 없으면 True 와 같다.
+    refresh_path: 변경 감지 저장소(PageHashStore) 경로, 주면 페이지 내용 해시가 지난 실행과 같은
+                  기술 페이지는 파싱하지 않고 저장된 결과를 다시 쓴다 (None이면 항상 파싱)
+    archive_path: 원본 페이지 보관소(PageArchiveWriter) 경로, 주면 받은 페이지를 모두 압축 보관해
+                  reparse.py 로 네트워크 없이 다시 파싱할 수 있다 (fetcher를 넘기면 무시)
+    """
     # 로깅 설정
     logger = setup_logging()
+    metrics = reset_metrics()
+    archive = PageArchiveWriter(archive_path) if archive_path and fetcher is None else None
+    fetcher = fetcher or Fetcher(pool_size=max(workers, 1), cache=HttpCache(),
+                                 rate_limiter=RateLimiter(rate=rate, logger=logger), archive=archive, logger=logger)
     logger.info("=== 기술 데이터 수집 시작 ===")
+    journal = None
     
     try:
         # 1. Bulbapedia에서 기술 ID 매핑 수집
         logger.info("1단계: 기술 ID 매핑 수집")
-        move_id_mapping = get_move_id_mapping(logger=logger)
+        move_id_mapping = get_move_id_mapping(logger=logger, fetcher=fetcher)
         
         if not move_id_mapping:
             logger.warning("기술 ID 매핑을 가져올 수 없습니다. ID 없이 진행합니다.")
         
         # 2. 세대별 기술 데이터 수집
         logger.info("2단계: 세대별 기술 데이터 수집")
-        moves_list = get_generation_moves_data(generations=generations, logger=logger)
+        moves_list = get_generation_moves_data(generations=generations, logger=logger, fetcher=fetcher)
         
         if not moves_list:
             logger.error("기술 데이터를 가져올 수 없습니다. 프로그램을 종료합니다.")
-            return None
+            return
         
         # 3. 상세 정보 수집
-        logger.info(f"3단계: {len(moves_list)}개 기술 상세 정보 수집")
-        final_data = []
+        logger.info("3단계: %s개 기술 상세 정보 수집", len(moves_list))
         success_count = 0
         error_count = 0
         
-        for i, move in enumerate(tqdm(moves_list, desc="기술 상세 정보 수집")):
+        journal = CheckpointJournal(checkpoint_path, resume=resume)
+        if journal.completed:
+            logger.info("체크포인트에서 %s건 복원: %s", len(journal.completed), checkpoint_path)
+
+        learnable = load_learnable(learnset_path) if learnset_path else None
+        if learnable is not None:
+            logger.info("learnset 테이블에서 %s개 기술의 learnable 로드: %s", len(learnable), learnset_path)
+
+        pages = PageHashStore(refresh_path) if refresh_path else None
+        page_hashes = {}
+        reused_count = 0
+        stored_links = set()
+        # 추출기 코드와 Learnt 섹션 파싱 여부에 따라 추출 결과가 달라지므로 해시에 함께 넣는다
+        hash_salt = f"parser={parser_version(__name__, 'util.parsing')},learnable={learnable is None}"
+
+        def fetch_html(move):
+            if not fetch_details or move["link"] in journal.completed:
+                return None
+            if fetch_details == "missing" and pages is not None and pages.detail(move["link"]):
+                # 저장된 추출 결과가 있는 기술 페이지는 요청하지 않음
+                stored_links.add(move["link"])
+                return None
+            html = fetcher.fetch(move["link"])
+            if pages is not None:
+                digest = page_hash(html, hash_salt)
+                if pages.unchanged(move["link"], digest):
+                    return None
+                page_hashes[move["link"]] = digest
+            return html
+
+        parse = partial(parse_move_item, parser_backend=parser_backend, learnable=learnable is None)
+        results = pipeline_map(fetch_html, parse, moves_list, fetch_workers=workers, parse_workers=parse_workers)
+        for i, (move, detail, detail_error) in enumerate(tqdm(results, total=len(moves_list), desc="기술 상세 정보 수집")):
             try:
-                detail = get_move_details(move["link"], logger=logger)
-                
-                # ID 매핑에서 ID 찾기
-                move_id = move_id_mapping.get(move["name_en"].lower())
-                
-                # power와 pp를 정수형으로 변환
-                power = detail.get("power", move["power"])
-                if power is not None:
-                    power = int(power)
-                
-                pp = detail.get("pp", move["pp"])
-                if pp is not None:
-                    pp = int(pp)
-                
-                final_data.append({
-                    "id": move_id,
-                    "name_en": move["name_en"],
-                    "name_kr": detail.get("name_kr"),
-                    "type": detail.get("type", move["type"]),
-                    "category": detail.get("category", move["category"]),
-                    "power": power,
-                    "accuracy": detail.get("accuracy", move["accuracy"]),
-                    "pp": pp,
-                    "effects": move["effects"],
-                    "description": detail.get("description"),
-                    "target": detail.get("target"),
-                    "learnable": detail.get("learnable"),
-                    "generation": move["generation"],
-                    "link": move["link"]
-                })
+                if detail_error:
+                    # 상세 정보 없이 목록 정보만으로 행 생성
+                    logger.warning("기술 상세 정보 수집 실패 (%s): %s", move['link'], detail_error)
+                    detail = {}
+                elif detail is None:
+                    if move["link"] in journal.completed or not fetch_details:
+                        detail = journal.completed.get(move["link"], {})
+                    else:
+                        # 페이지가 바뀌지 않았거나 요청하지 않음("missing"): 지난 실행의 추출 결과 재사용
+                        detail = pages.detail(move["link"])
+                        journal.record(move["link"], detail)
+                        reused_count += move["link"] not in stored_links
+                elif detail:
+                    journal.record(move["link"], detail)
+                    if pages is not None:
+                        pages.record(move["link"], page_hashes.get(move["link"]), detail)
                 
+                row = build_move_row(move, detail, move_id_mapping, learnable)
                 success_count += 1
                 
                 # 진행 상황 로깅 (매 50개마다)
                 if (i + 1) % 50 == 1:
-                    logger.info(f"진행 상황: {i + 1}/{len(moves_list)} 완료 ({((i + 1)/len(moves_list)*100):.1f}%)")
-                    logger.info(f"기술 정보: \n{move} \n{detail}")
+                    logger.info("진행 상황: %s/%s 완료 (%.1f%%)", i + 1, len(moves_list), (i + 1)/len(moves_list)*100)
+                    logger.info("기술 정보: \n%s \n%s", move, detail)
                 
-                time.sleep(0.2)
-                print(move_id, move["name_en"], detail.get("name_kr"))
+                print(row["id"], move["name_en"], detail.get("name_kr"))
                 
             except Exception as e:
                 error_count += 1
-                logger.error(f"기술 정보 수집 실패 ({move['name_en']}): {str(e)}")
+                logger.error("기술 정보 수집 실패 (%s): %s", move['name_en'], e)
                 continue
+            
+            yield row
         
-        logger.info(f"상세 정보 수집 완료: 성공 {success_count}개, 실패 {error_count}개")
+        if pages is not None:
+            pages.close()
+            logger.info("변경 감지: 바뀌지 않은 페이지 %s개 파싱 생략 (%s)", reused_count, refresh_path)
+            if stored_links:
+                logger.info("저장된 추출 결과가 있는 기술 페이지 %s개 요청 생략", len(stored_links))
+        if archive is not None:
+            logger.info("원본 페이지 보관: 새 레코드 %s개, 내용이 같아 생략 %s개 (%s)", archive.added, archive.skipped, archive_path)
+        export_run_metrics(metrics, metrics_path, prometheus_path, labels={"collector": "move_basic"}, logger=logger)
+        logger.info("상세 정보 수집 완료: 성공 %s개, 실패 %s개", success_count, error_count)
         logger.info("=== 기술 데이터 수집 완료 ===")
         
-        # DataFrame 생성 후 power와 pp를 정수형으로 변환
-        df = pd.DataFrame(final_data)
-        
-        # power 열이 있는 경우 정수형으로 변환 (None은 그대로 유지)
-        if 'power' in df.columns:
-            df['power'] = df['power'].astype('Int64')  # nullable integer type
-        
-        # pp 열이 있는 경우 정수형으로 변환 (None은 그대로 유지)
-        if 'pp' in df.columns:
-            df['pp'] = df['pp'].astype('Int64')  # nullable integer type
-        
-        return df
-        
     except Exception as e:
-        logger.error(f"데이터 수집 중 심각한 오류 발생: {str(e)}")
+        logger.error("데이터 수집 중 심각한 오류 발생: %s", e)
+    finally:
+        # 소비자가 중간에 멈추거나(break) 예외가 나도 저널 파일을 닫는다
+        if journal is not None:
+            journal.close()
+        if archive is not None:
+            archive.close()
+
+def collect_all_moves_data(generations=[1], **kwargs):
+    """모든 기술 데이터 수집 (DataFrame 반환, 인자는 iter_move_rows와 같음)"""
+    rows = list(iter_move_rows(generations=generations, **kwargs))
+    if not rows:
         return None
+    
+    # DataFrame 생성 후 power와 pp를 정수형으로 변환
+    df = pd.DataFrame(rows, columns=MOVE_COLUMNS)
+    
+    # power, pp는 None을 유지하는 nullable integer type
+    df['power'] = df['power'].astype('Int64')
+    df['pp'] = df['pp'].astype('Int64')
+    
+    return df
+
+def write_move_data(output_files=None, changes_path="data/raw/move_basic.changes.jsonl", rows=None, **kwargs):
+    """iter_move_rows 결과를 한 행씩 바로 기록 (pyarrow가 있으면 세대별 Parquet도 함께)
+
+    첫 번째 출력(TSV)의 지난 결과와 비교한 변경 목록을 changes_path 에 쓴다.
+    rows: 기록할 행 (없으면 iter_move_rows(**kwargs) 를 실행해 수집).
+    → (기록한 행 수, 출력 파일 목록, ChangesetWriter)
+    """
+    if output_files is None:
+        output_files = ["data/raw/move_basic.tsv"]
+        if HAS_PYARROW:
+            output_files.append("data/raw/move_basic.parquet")
+    # 변경 목록 작성기는 새 TSV를 열기 전에 만들어(이전 TSV를 옮겨 둠) 맨 뒤에 둔다 (새 TSV가 닫힌 뒤 비교)
+    changeset = ChangesetWriter(changes_path, output_files[0], key_columns=["name_en"], columns=MOVE_COLUMNS)
+    writers = [open_writer(path, MOVE_COLUMNS, MOVE_PARQUET_TYPES) for path in output_files] + [changeset]
+    with TeeWriter(writers) as writer:
+        for row in rows if rows is not None else iter_move_rows(**kwargs):
+            writer.write(row)
+    return writer.count, output_files, changeset
+
+
+def default_learnset_path(path="data/raw/learnset_basic.tsv"):
+    """learnset_basic.py 결과가 있으면 그 경로 (learnable 을 그 테이블에서 채움), 없으면 None"""
+    return path if os.path.exists(path) else None
+
 
 if __name__ == "__main__":
-    # 1세대 기술 데이터 수집
-    df = collect_all_moves_data(generations=[1])
-    # df = collect_all_moves_data(generations=[1,2,3,4,5,6,7,8,9])
-    
-    if df is not None and len(df) > 0:
-        import os
-        os.makedirs("data/raw", exist_ok=True)
-        
-        output_file = "data/raw/move_basic.tsv"
-        df.to_csv(output_file, index=False, sep="\t")
-        print(f"수집 완료: 총 {len(df)} 기술 데이터 {output_file}에 저장됨")
+    # 1세대 기술 데이터를 수집하며 받은 페이지는 원본 보관소에 함께 기록
+    # learnset 테이블이 있으면 learnable 은 테이블에서 채우고, 기술 페이지는 처음 보는 기술만 요청
+    learnset_path = default_learnset_path()
+    count, output_files, changeset = write_move_data(
+        generations=[1], workers=4, parse_workers=None, learnset_path=learnset_path,
+        fetch_details="missing" if learnset_path else True,
+        refresh_path="data/raw/move_basic.pages.jsonl", archive_path="data/raw/pages.archive")
+    # count, output_files, changeset = write_move_data(generations=[1,2,3,4,5,6,7,8,9])
+
+    if count > 0:
+        print(f"수집 완료: 총 {count} 기술 데이터 {', '.join(output_files)}에 저장됨")
+        if changeset.has_previous:
+            print(f"변경 목록: {changeset.summary()} → {changeset.path}")
     else:
         print("데이터 수집 실패")
@@ -1,394 +1,613 @@
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 from tqdm import tqdm
-import time
+from functools import partial
+import asyncio
+import os
 
+from util.archive import PageArchiveWriter
+from util.async_fetcher import AsyncFetcher
+from util.cache import HttpCache
+from util.checkpoint import CheckpointJournal
 from util.common import setup_logging
+from util.delta import ChangesetWriter, PageHashStore, page_hash, parser_version
+from util.descriptions import DescriptionStoreWriter
+from util.evolution import (EVOLUTION_COLUMNS, EvolutionCache, EvolutionEdges, EvolutionFamily,
+                            evolution_containers, parse_evolution_chart)
+from util.fetcher import Fetcher, get_default_fetcher
+from util.metrics import export_run_metrics, reset_metrics, timed
+from util.ratelimit import RateLimiter
+from util.parsing import POKEMON_DETAIL_PARTS, SectionIndex, make_soup
+from util.pipeline import pipeline_map
+from util.columnar import HAS_PYARROW
+from util.writer import RowWriter, TeeWriter, open_writer
 
-BASE_URL = "https://pokemondb.net"
+# 로컬 스텁 서버(bench/site_server.py) 등으로 바꿀 때는 환경 변수로 지정
+BASE_URL = os.environ.get("PORODECK_BASE_URL", "https://pokemondb.net").rstrip("/")
 
-def get_generation_pokemon_data(generations=[1], logger=None):
+# 진화 계열 캐시 (파싱 프로세스마다 하나)
+EVOLUTION_CACHE = EvolutionCache()
+
+def parse_generation_pokemon_page(html, gen, logger=None):
+    """세대별 스탯 목록 페이지 HTML 파싱"""
+    soup = BeautifulSoup(html, "html.parser")
+    table_rows = soup.select("table tbody tr")
+    
+    pokemon_data = []
+    for row in table_rows:
+        try:
+            cells = row.select("td")
+            if len(cells) < 3:
+                continue
+            
+            # 번호 (첫 번째 셀)
+            dex_num = cells[0].text.strip().zfill(3)
+            
+            # 이름과 링크 (두 번째 셀)
+            name_link = cells[1].select_one("a[href*='/pokedex/']")
+            if not name_link:
+                continue
+            
+            name = name_link.text.strip()
+            link = BASE_URL + name_link["href"]
+            
+            # 타입 (세 번째 셀)
+            type_links = cells[2].select("a")
+            types = [t.text.strip() for t in type_links]
+            
+            pokemon_data.append({
+                "id": dex_num,
+                "name_en": name,
+                "link": link,
+                "type1": types[0] if types else None,
+                "type2": types[1] if len(types) > 1 else None,
+                "generation": gen
+            })
+            
+        except Exception as e:
+            if logger:
+                logger.debug("테이블 행 파싱 오류: %s", e)
+            continue
+    
+    return pokemon_data
+
+
+def get_generation_pokemon_data(generations=[1], logger=None, fetcher=None):
     """세대별 포켓몬 데이터 수집"""
+    fetcher = fetcher or get_default_fetcher()
     if logger:
-        logger.info(f"세대별 포켓몬 데이터 수집 시작: {generations}세대")
+        logger.info("세대별 포켓몬 데이터 수집 시작: %s세대", generations)
     
     pokemon_data = []
     
     for gen in generations:
         if logger:
-            logger.debug(f"{gen}세대 포켓몬 정보 수집 중...")
+            logger.debug("%s세대 포켓몬 정보 수집 중...", gen)
         
         try:
             url = f"{BASE_URL}/pokedex/stats/gen{gen}"
-            res = requests.get(url)
-            res.raise_for_status()
+            html = fetcher.fetch(url)
             
-            soup = BeautifulSoup(res.text, "html.parser")
-            table_rows = soup.select("table tbody tr")
-            
-            gen_count = 0
-            for row in table_rows:
-                try:
-                    cells = row.select("td")
-                    if len(cells) < 3:
-                        continue
-                    
-                    # 번호 (첫 번째 셀)
-                    dex_num = cells[0].text.strip().zfill(3)
-                    
-                    # 이름과 링크 (두 번째 셀)
-                    name_link = cells[1].select_one("a[href*='/pokedex/']")
-                    if not name_link:
-                        continue
-                    
-                    name = name_link.text.strip()
-                    link = BASE_URL + name_link["href"]
-                    
-                    # 타입 (세 번째 셀)
-                    type_links = cells[2].select("a")
-                    types = [t.text.strip() for t in type_links]
-                    
-                    pokemon_data.append({
-                        "id": dex_num,
-                        "name_en": name,
-                        "link": link,
-                        "type1": types[0] if types else None,
-                        "type2": types[1] if len(types) > 1 else None,
-                        "generation": gen
-                    })
-                    gen_count += 1
-                    
-                except Exception as e:
-                    if logger:
-                        logger.debug(f"테이블 행 파싱 오류: {str(e)}")
-                    continue
+            with timed("parse.list_page"):
+                gen_data = parse_generation_pokemon_page(html, gen, logger=logger)
+            pokemon_data.extend(gen_data)
             
             if logger:
-                logger.info(f"{gen}세대: {gen_count}종 포켓몬 수집 완료")
+                logger.info("%s세대: %s종 포켓몬 수집 완료", gen, len(gen_data))
                 
         except Exception as e:
             if logger:
-                logger.error(f"{gen}세대 정보 수집 실패: {str(e)}")
+                logger.error("%s세대 정보 수집 실패: %s", gen, e)
             continue
-            
-        time.sleep(0.5)
     
     if logger:
-        logger.info(f"세대별 데이터 수집 완료: 총 {len(pokemon_data)}종")
+        logger.info("세대별 데이터 수집 완료: 총 %s종", len(pokemon_data))
     
     return pokemon_data
 
 
+async def async_get_generation_pokemon_data(generations=[1], logger=None, fetcher=None):
+    """get_generation_pokemon_data 의 asyncio 버전: 모든 세대 목록 페이지를 동시에 요청
+
+    fetcher: AsyncFetcher (없으면 디스크 캐시를 쓰는 AsyncFetcher를 만들어 쓰고 닫음)
+    """
+    if fetcher is None:
+        async with AsyncFetcher(cache=HttpCache(), logger=logger) as fetcher:
+            return await async_get_generation_pokemon_data(generations, logger=logger, fetcher=fetcher)
+    if logger:
+        logger.info("세대별 포켓몬 데이터 수집 시작: %s세대", generations)
 
-def get_pokemon_details(link, logger=None):
+    urls = [f"{BASE_URL}/pokedex/stats/gen{gen}" for gen in generations]
+    pages = await fetcher.fetch_all(urls)
+
+    pokemon_data = []
+    for gen, html in zip(generations, pages):
+        if isinstance(html, Exception):
+            if logger:
+                logger.error("%s세대 정보 수집 실패: %s", gen, html)
+            continue
+        with timed("parse.list_page"):
+            gen_data = parse_generation_pokemon_page(html, gen, logger=logger)
+        pokemon_data.extend(gen_data)
+        if logger:
+            logger.info("%s세대: %s종 포켓몬 수집 완료", gen, len(gen_data))
+
+    if logger:
+        logger.info("세대별 데이터 수집 완료: 총 %s종", len(pokemon_data))
+    return pokemon_data
+
+
+def _parse_vitals(index, data, logger=None):
+    """기본 정보 (vitals-table에서)"""
+    vitals_table = index.table_with_class("vitals-table")
+    if not vitals_table:
+        return
+    rows = vitals_table.select("tr")
+    for row in rows:
+        try:
+            th = row.select_one("th")
+            td = row.select_one("td")
+            if th and td:
+                th_text = th.text.strip()
+                td_text = td.text.strip()
+                
+                if "Species" in th_text:
+                    # Pokémon을 Pokemon으로 변경
+                    data["species"] = td_text.replace("Pokémon", "Pokemon")
+                elif "Height" in th_text:
+                    height_text = td_text.split("m")[0].strip()
+                    data["height_m"] = float(height_text)
+                elif "Weight" in th_text:
+                    weight_text = td_text.split("kg")[0].strip()
+                    data["weight_kg"] = float(weight_text)
+        except (ValueError, AttributeError, IndexError) as e:
+            if logger:
+                logger.debug("기본 정보 파싱 오류 (%s): %s", th_text if 'th_text' in locals() else 'unknown', e)
+            continue
+
+
+def _parse_training(index, data, logger=None):
+    """Training 섹션에서 Base Exp와 Catch rate 수집"""
+    section = index.find("Training")
+    if not section or not section.table:
+        return
+    rows = section.table.select("tr")
+    for row in rows:
+        try:
+            th = row.select_one("th")
+            td = row.select_one("td")
+            if th and td:
+                th_text = th.text.strip()
+                td_text = td.text.strip()
+                
+                if "Base Exp" in th_text:
+                    data["base_exp"] = int(td_text.replace(",", ""))
+                if "Catch rate" in th_text:
+                    # "45 (5.9% with PokéBall, full HP)" → "45"
+                    catch_rate_text = td_text.split()[0]
+                    data["catch_rate"] = int(catch_rate_text)
+        except (ValueError, AttributeError, IndexError) as e:
+            if logger:
+                logger.debug("Training 정보 파싱 오류 (%s): %s", th_text if 'th_text' in locals() else 'unknown', e)
+            continue
+
+
+def _parse_base_stats(index, data, logger=None):
+    """Base stats 수집"""
+    section = index.find("Base stats")
+    if not section or not section.table:
+        return
+    stats_rows = section.table.select("tr")
+    for row in stats_rows:
+        try:
+            th = row.select_one("th")
+            tds = row.select("td")
+            
+            if th and tds:
+                stat_name = th.text.strip()
+                
+                # Total은 다른 구조를 가질 수 있음
+                if stat_name == "Total":
+                    # Total은 .cell-total 클래스를 찾거나 특별한 처리
+                    total_cell = row.select_one("td.cell-total")
+                    if total_cell:
+                        data["Tot"] = int(total_cell.text.strip())
+                    else:
+                        # 일반적인 경우 첫 번째 td 사용
+                        first_td = tds[0]
+                        stat_text = first_td.text.strip()
+                        data["Tot"] = int(stat_text)
+                else:
+                    # 일반 스탯들은 첫 번째 td에서 숫자만 추출
+                    first_td = tds[0]
+                    stat_text = first_td.text.strip()
+                    stat_value = int(stat_text)
+                    
+                    if stat_name == "HP":
+                        data["HP"] = stat_value
+                    elif stat_name == "Attack":
+                        data["Atk"] = stat_value
+                    elif stat_name == "Defense":
+                        data["Def"] = stat_value
+                    elif stat_name == "Sp. Atk":
+                        data["SpAtk"] = stat_value
+                    elif stat_name == "Sp. Def":
+                        data["SpDef"] = stat_value
+                    elif stat_name == "Speed":
+                        data["Spd"] = stat_value
+        except (ValueError, AttributeError, IndexError) as e:
+            if logger:
+                logger.debug("스탯 파싱 오류 (%s): %s", stat_name if 'stat_name' in locals() else 'unknown', e)
+            continue
+
+
+def _parse_dex_entries(index, data, logger=None):
+    """Pokédex entries 수집 → data["descriptions"] = [[게임, 문장], ...]
+
+    th 안에 여러 게임(span)이 있으면 게임마다 한 항목으로 나눈다.
+    """
+    entries = []
+    section = index.find("Pokédex entries")
+    if section and section.table:
+        for row in section.table.select("tr"):
+            try:
+                th = row.select_one("th")
+                td = row.select_one("td")
+                if th and td:
+                    spans = th.select("span")
+                    if spans:
+                        game_names = [span.text.strip() for span in spans]
+                    else:
+                        game_names = [th.text.strip()]
+                    
+                    description = td.text.strip().replace("POKéMON", "POKEMON").replace("Pokémon", "POKEMON")
+                    if description:
+                        entries.extend([game, description] for game in game_names if game)
+            except Exception as e:
+                if logger:
+                    logger.debug("포켓덱스 엔트리 파싱 오류: %s", e)
+                continue
+    
+    data["descriptions"] = entries or None
+
+
+def _parse_evolution(index, link, data, logger=None, cache=None):
+    """진화 조건 수집 (Evolution chart 섹션)
+
+    계열의 진화 차트는 처음 본 구성원 페이지에서 한 번만 파싱해 전체 간선(분기 포함)을
+    cache에 저장하고, 그 페이지의 결과에만 evo_family(간선 목록)를 담는다.
+    같은 계열의 다른 포켓몬은 캐시에서 바로 evo_from_id/evo_from_cond를 찾는다.
+    """
+    cache = cache if cache is not None else EVOLUTION_CACHE
+    data["evo_from_id"] = None
+    data["evo_from_cond"] = None
+
+    pokemon_name = link.rstrip("/").split("/")[-1]
+    family = cache.get(pokemon_name)
+    if family is None:
+        section = index.find("Evolution chart")
+        if not section:
+            return
+        try:
+            family = EvolutionFamily(parse_evolution_chart(evolution_containers(section)))
+        except Exception as e:
+            if logger:
+                logger.debug("진화 조건 파싱 오류: %s", e)
+            return
+        cache.add(family, pokemon_name)
+        data["evo_family"] = family.edges
+
+    edge = family.edge_to(pokemon_name)
+    if edge:
+        data["evo_from_id"] = edge["from_id"]
+        data["evo_from_cond"] = edge["condition"]
+
+
+def _parse_korean_name(index, data, logger=None):
+    """한글 이름 ("Other languages" 섹션)"""
+    data["name_kr"] = None
+    for section in index.find_all("Other languages"):
+        if section.table:
+            for row in section.table.select("tr"):
+                # th와 td 구조 확인: <th>Korean</th><td>이상해씨</td>
+                th = row.select_one("th")
+                td = row.select_one("td")
+                
+                if th and td:
+                    lang_name = th.text.strip().lower()
+                    if "korean" in lang_name:
+                        korean_name = td.text.strip()
+                        # 괄호 안의 내용 제거 (예: "이상해씨 (isanghaessi)" → "이상해씨")
+                        data["name_kr"] = korean_name.split("(")[0].strip()
+                        break
+        if data["name_kr"]:
+            break
+
+
+def parse_pokemon_details(html, link, logger=None, parser_backend="html.parser", partial=True,
+                          evolution_cache=None):
+    """포켓몬 상세 페이지 HTML 파싱
+
+    문서를 한 번 순회해 섹션 색인을 만든 뒤 각 추출기가 색인을 공유한다.
+    parser_backend: "html.parser" / "lxml" / "selectolax" / "auto"
+    partial: True면 추출기가 읽는 요소(POKEMON_DETAIL_PARTS)만 트리로 만든다.
+    evolution_cache: 진화 계열 캐시 (기본: 모듈 공용 EVOLUTION_CACHE)
+    """
+    with timed("parse.soup"):
+        soup = make_soup(html, parser_backend, POKEMON_DETAIL_PARTS if partial else None)
+    with timed("parse.index"):
+        index = SectionIndex(soup, div_classes=["infocard-list-evo"])
+    data = {"form": "normal"}  # 기본적으로 normal 폼으로 설정
+
+    # 추출기별 소요 시간은 parse.<이름> 히스토그램으로 기록
+    with timed("parse.vitals"):
+        _parse_vitals(index, data, logger)
+    with timed("parse.training"):
+        _parse_training(index, data, logger)
+    with timed("parse.base_stats"):
+        _parse_base_stats(index, data, logger)
+    with timed("parse.dex_entries"):
+        _parse_dex_entries(index, data, logger)
+    with timed("parse.evolution"):
+        _parse_evolution(index, link, data, logger, evolution_cache)
+    with timed("parse.korean_name"):
+        _parse_korean_name(index, data, logger)
+    return data
+
+
+def get_pokemon_details(link, logger=None, fetcher=None, parser_backend="html.parser"):
     """포켓몬 상세 정보 + 한글 이름 수집"""
+    fetcher = fetcher or get_default_fetcher()
     try:
-        res = requests.get(link)
-        res.raise_for_status()
+        html = fetcher.fetch(link)
+        return parse_pokemon_details(html, link, logger=logger, parser_backend=parser_backend)
         
-        soup = BeautifulSoup(res.text, "html.parser")
-        data = {"form": "normal"}  # 기본적으로 normal 폼으로 설정
-
-        # 기본 정보 (vitals-table에서)
-        vitals_table = soup.select_one("table.vitals-table")
-        if vitals_table:
-            rows = vitals_table.select("tr")
-            for row in rows:
-                try:
-                    th = row.select_one("th")
-                    td = row.select_one("td")
-                    if th and td:
-                        th_text = th.text.strip()
-                        td_text = td.text.strip()
-                        
-                        if "Species" in th_text:
-                            # Pokémon을 Pokemon으로 변경
-                            data["species"] = td_text.replace("Pokémon", "Pokemon")
-                        elif "Height" in th_text:
-                            height_text = td_text.split("m")[0].strip()
-                            data["height_m"] = float(height_text)
-                        elif "Weight" in th_text:
-                            weight_text = td_text.split("kg")[0].strip()
-                            data["weight_kg"] = float(weight_text)
-                except (ValueError, AttributeError, IndexError) as e:
-                    if logger:
-                        logger.debug(f"기본 정보 파싱 오류 ({th_text if 'th_text' in locals() else 'unknown'}): {str(e)}")
-                    continue
-
-        # Training 섹션에서 Base Exp와 Catch rate 수집
-        for h2 in soup.select("h2"):
-            if "Training" in h2.text:
-                training_table = h2.find_next("table")
-                if training_table:
-                    rows = training_table.select("tr")
-                    for row in rows:
-                        try:
-                            th = row.select_one("th")
-                            td = row.select_one("td")
-                            if th and td:
-                                th_text = th.text.strip()
-                                td_text = td.text.strip()
-                                
-                                if "Base Exp" in th_text:
-                                    data["base_exp"] = int(td_text.replace(",", ""))
-                                if "Catch rate" in th_text:
-                                    # "45 (5.9% with PokéBall, full HP)" → "45"
-                                    catch_rate_text = td_text.split()[0]
-                                    data["catch_rate"] = int(catch_rate_text)
-                        except (ValueError, AttributeError, IndexError) as e:
-                            if logger:
-                                logger.debug(f"Training 정보 파싱 오류 ({th_text if 'th_text' in locals() else 'unknown'}): {str(e)}")
-                            continue
-                break
-
-        # Base stats 수집 
-        # "Base stats" 헤딩 찾기
-        for h2 in soup.select("h2"):
-            if "Base stats" in h2.text:
-                stats_table = h2.find_next("table")
-                if stats_table:
-                    stats_rows = stats_table.select("tr")
-                    for row in stats_rows:
-                        try:
-                            th = row.select_one("th")
-                            tds = row.select("td")
-                            
-                            if th and tds:
-                                stat_name = th.text.strip()
-                                
-                                # Total은 다른 구조를 가질 수 있음
-                                if stat_name == "Total":
-                                    # Total은 .cell-total 클래스를 찾거나 특별한 처리
-                                    total_cell = row.select_one("td.cell-total")
-                                    if total_cell:
-                                        data["Tot"] = int(total_cell.text.strip())
-                                    else:
-                                        # 일반적인 경우 첫 번째 td 사용
-                                        first_td = tds[0]
-                                        stat_text = first_td.text.strip()
-                                        data["Tot"] = int(stat_text)
-                                else:
-                                    # 일반 스탯들은 첫 번째 td에서 숫자만 추출
-                                    first_td = tds[0]
-                                    stat_text = first_td.text.strip()
-                                    stat_value = int(stat_text)
-                                    
-                                    if stat_name == "HP":
-                                        data["HP"] = stat_value
-                                    elif stat_name == "Attack":
-                                        data["Atk"] = stat_value
-                                    elif stat_name == "Defense":
-                                        data["Def"] = stat_value
-                                    elif stat_name == "Sp. Atk":
-                                        data["SpAtk"] = stat_value
-                                    elif stat_name == "Sp. Def":
-                                        data["SpDef"] = stat_value
-                                    elif stat_name == "Speed":
-                                        data["Spd"] = stat_value
-                        except (ValueError, AttributeError, IndexError) as e:
-                            if logger:
-                                logger.debug(f"스탯 파싱 오류 ({stat_name if 'stat_name' in locals() else 'unknown'}): {str(e)}")
-                            continue
-                break
-
-        # Pokédex entries 수집
-        entries = []
-        for h2 in soup.select("h2"):
-            if "Pokédex entries" in h2.text:
-                entries_table = h2.find_next("table")
-                if entries_table:
-                    for row in entries_table.select("tr"):
-                        try:
-                            th = row.select_one("th")
-                            td = row.select_one("td")
-                            if th and td:
-                                # th 안에 여러 span이 있는 경우 &로 연결
-                                spans = th.select("span")
-                                if spans:
-                                    game_names = [span.text.strip() for span in spans]
-                                    game_name = "&".join(game_names)
-                                else:
-                                    game_name = th.text.strip()
-                                
-                                description = td.text.strip().replace("POKéMON", "POKEMON").replace("Pokémon", "POKEMON")
-                                entries.append(f"({game_name}){description}")
-                        except Exception as e:
-                            if logger:
-                                logger.debug(f"포켓덱스 엔트리 파싱 오류: {str(e)}")
-                            continue
-                break
-        
-        data["descriptions"] = ", ".join(entries) if entries else None
+    except Exception as e:
+        if logger:
+            logger.warning("상세 정보 수집 실패 (%s): %s", link, e)
+        return {}
+
+
+async def async_get_pokemon_details(link, logger=None, fetcher=None, parser_backend="html.parser"):
+    """get_pokemon_details 의 asyncio 버전 (fetcher: AsyncFetcher)
+
+    파싱은 기본 스레드 풀에서 실행해 그동안 이벤트 루프가 다른 요청을 계속 처리하게 한다.
+    """
+    try:
+        html = await fetcher.fetch(link)
+        parse = partial(parse_pokemon_details, html, link, logger=logger, parser_backend=parser_backend)
+        return await asyncio.get_running_loop().run_in_executor(None, parse)
 
-        # 진화 조건 수집
-        data["evo_from_id"] = None
-        data["evo_from_cond"] = None
-        
-        # Evolution chart 섹션 찾기
-        for h2 in soup.select("h2"):
-            if "Evolution chart" in h2.text:
-                evo_container = h2.find_next("div", class_="infocard-list-evo")
-                if evo_container:
-                    # 진화 체인의 모든 요소 (카드 + 화살표) 순서대로 수집
-                    evo_elements = evo_container.find_all(["div", "span"], class_=["infocard", "infocard-arrow"])
-                    
-                    current_pokemon_id = None
-                    # 현재 페이지의 포켓몬 ID 추출 (URL에서)
-                    try:
-                        # link에서 포켓몬 이름 추출
-                        pokemon_name = link.split("/")[-1]
-                        
-                        # 진화 체인에서 현재 포켓몬 찾기
-                        for i, element in enumerate(evo_elements):
-                            if "infocard" in element.get("class", []) and "infocard-arrow" not in element.get("class", []):
-                                # 포켓몬 카드인 경우
-                                name_link = element.select_one("a.ent-name")
-                                if name_link:
-                                    card_pokemon_name = name_link["href"].split("/")[-1]
-                                    
-                                    # 현재 포켓몬과 매칭되는 카드 찾기
-                                    if card_pokemon_name == pokemon_name:
-                                        # 이 포켓몬 바로 앞의 진화 조건과 진화 전 포켓몬 찾기
-                                        if i >= 2:  # 최소 [포켓몬] -> [화살표] -> [현재포켓몬] 구조
-                                            # 바로 앞 화살표에서 진화 조건 추출
-                                            prev_arrow = evo_elements[i-1]
-                                            if "infocard-arrow" in prev_arrow.get("class", []):
-                                                condition_small = prev_arrow.select_one("small")
-                                                if condition_small:
-                                                    condition_text = condition_small.text.strip()
-                                                    # 괄호 제거: "(Level 16)" -> "Level 16"
-                                                    data["evo_from_cond"] = condition_text.strip("()")
-                                            
-                                            # 바로 앞 포켓몬에서 ID 추출
-                                            prev_pokemon = evo_elements[i-2]
-                                            if "infocard" in prev_pokemon.get("class", []) and "infocard-arrow" not in prev_pokemon.get("class", []):
-                                                prev_id_small = prev_pokemon.select_one("small")
-                                                if prev_id_small:
-                                                    prev_id_text = prev_id_small.text.strip()
-                                                    # "#0004" -> "0004"
-                                                    data["evo_from_id"] = prev_id_text.replace("#", "")
-                                        break
-                    except Exception as e:
-                        if logger:
-                            logger.debug(f"진화 조건 파싱 오류: {str(e)}")
-                break
-
-        # 한글 이름
-        data["name_kr"] = None
-        # "Other languages" 섹션 찾기
-        for h2 in soup.select("h2"):
-            if "Other languages" in h2.text:
-                table = h2.find_next("table")
-                if table:
-                    for row in table.select("tr"):
-                        # th와 td 구조 확인: <th>Korean</th><td>이상해씨</td>
-                        th = row.select_one("th")
-                        td = row.select_one("td")
-                        
-                        if th and td:
-                            lang_name = th.text.strip().lower()
-                            if "korean" in lang_name:
-                                korean_name = td.text.strip()
-                                # 괄호 안의 내용 제거 (예: "이상해씨 (isanghaessi)" → "이상해씨")
-                                data["name_kr"] = korean_name.split("(")[0].strip()
-                                break
-                if data["name_kr"]:
-                    break
-
-        return data
-        
     except Exception as e:
         if logger:
-            logger.warning(f"상세 정보 수집 실패 ({link}): {str(e)}")
+            logger.warning("상세 정보 수집 실패 (%s): %s", link, e)
         return {}
 
 
-def collect_all_pokemon_data(generations=[1]):
+def parse_pokemon_item(p, html, parser_backend="html.parser"):
+    """파이프라인 파싱 단계: 목록 항목 + 상세 페이지 HTML → 상세 정보 (파싱 프로세스에서 실행)"""
+    return parse_pokemon_details(html, p["link"], parser_backend=parser_backend)
+
+
+POKEMON_COLUMNS = [
+    "id", "generation", "name_en", "name_kr", "type1", "type2", "species",
+    "height_m", "weight_kg", "base_exp", "catch_rate", "form", "evo_from_id", "evo_from_cond",
+    "HP", "Atk", "Def", "SpAtk", "SpDef", "Spd", "Tot", "link",
+]
+
+# Parquet 출력 열 타입 (지정하지 않은 열은 string)
+POKEMON_PARQUET_TYPES = {
+    "id": "uint16", "generation": "uint8", "type1": "category", "type2": "category",
+    "height_m": "float32", "weight_kg": "float32", "base_exp": "uint16", "catch_rate": "uint8",
+    "form": "category", "evo_from_id": "uint16",
+    "HP": "uint8", "Atk": "uint8", "Def": "uint8", "SpAtk": "uint8", "SpDef": "uint8", "Spd": "uint8",
+    "Tot": "uint16",
+}
+
+
+def build_pokemon_row(p, detail):
+    """목록 항목 + 상세 정보 → 출력 행"""
+    return {
+        "id": p["id"],
+        "generation": p["generation"],
+        "name_en": p["name_en"],
+        "name_kr": detail.get("name_kr"),
+        "type1": p["type1"],
+        "type2": p["type2"],
+        "species": detail.get("species"),
+        "height_m": detail.get("height_m"),
+        "weight_kg": detail.get("weight_kg"),
+        "base_exp": detail.get("base_exp"),
+        "catch_rate": detail.get("catch_rate"),
+        "form": detail.get("form", "normal"),
+        "evo_from_id": detail.get("evo_from_id"),
+        "evo_from_cond": detail.get("evo_from_cond"),
+        "HP": detail.get("HP"),
+        "Atk": detail.get("Atk"),
+        "Def": detail.get("Def"),
+        "SpAtk": detail.get("SpAtk"),
+        "SpDef": detail.get("SpDef"),
+        "Spd": detail.get("Spd"),
+        "Tot": detail.get("Tot"),
+        "link": p["link"],
+    }
+
+
+def iter_pokemon_rows(generations=[1], workers=1, rate=5.0, fetcher=None,
+                      resume=False, checkpoint_path="data/raw/pokemon_basic.checkpoint.jsonl",
+                      parser_backend="html.parser", parse_workers=0,
+                      metrics_path="data/raw/pokemon_basic.metrics.json", prometheus_path=None,
+                      evolution_path="data/raw/pokemon_evolution.tsv",
+                      descriptions_path="data/raw/pokemon_descriptions.bin", refresh_path=None,
+                      archive_path=None):
+    """포켓몬 데이터를 한 행씩 수집해 목록 순서대로 yield
+
+    workers: 상세 페이지 동시 다운로드 스레드 수 (1이면 순차 수집)
+    rate: 호스트별 목표 요청 속도(초당 요청 수), 429/503 응답 시 자동 감속 후 다시 회복
+    fetcher: 공용 HTTP 수집기 (없으면 workers 크기의 커넥션 풀 + 디스크 캐시 + rate 제한으로 생성)
+    resume: True면 checkpoint_path 저널에 기록된 완료 항목은 다시 수집하지 않고 결과에 병합
+    parser_backend: 상세 페이지 HTML 파서 ("html.parser" / "lxml" / "selectolax" / "auto")
+    parse_workers: 상세 페이지 파싱 프로세스 수 (0이면 별도 프로세스 없이 파싱, None이면 CPU 코어 수)
+    metrics_path: 단계별 계측 요약(JSON) 저장 경로, prometheus_path: Prometheus textfile 경로 (선택)
+    evolution_path: 진화 간선 테이블(EVOLUTION_COLUMNS) 저장 경로 (None이면 저장하지 않음)
+    descriptions_path: 도감 설명 저장소 경로 (행에는 설명을 넣지 않고 게임별로 중복 제거·압축해 따로 저장,
+                       None이면 저장하지 않음)
+    refresh_path: 변경 감지 저장소(PageHashStore) 경로, 주면 페이지 내용 해시가 지난 실행과 같은
+                  상세 페이지는 파싱하지 않고 저장된 결과를 다시 쓴다 (None이면 항상 파싱)
+    archive_path: 원본 페이지 보관소(PageArchiveWriter) 경로, 주면 받은 페이지를 모두 압축 보관해
+                  reparse.py 로 네트워크 없이 다시 파싱할 수 있다 (fetcher를 넘기면 무시)
+    """
     # 로깅 설정
     logger = setup_logging()
+    metrics = reset_metrics()
+    archive = PageArchiveWriter(archive_path) if archive_path and fetcher is None else None
+    fetcher = fetcher or Fetcher(pool_size=max(workers, 1), cache=HttpCache(),
+                                 rate_limiter=RateLimiter(rate=rate, logger=logger), archive=archive, logger=logger)
     logger.info("=== 포켓몬 데이터 수집 시작 ===")
+    journal = None
     
     try:
         # 세대별 포켓몬 데이터 수집
         logger.info("세대별 포켓몬 데이터 수집")
-        pokemon_list = get_generation_pokemon_data(generations=generations, logger=logger)
+        pokemon_list = get_generation_pokemon_data(generations=generations, logger=logger, fetcher=fetcher)
         
         if not pokemon_list:
             logger.error("포켓몬 데이터를 가져올 수 없습니다. 프로그램을 종료합니다.")
-            return None
+            return
 
         # 상세 정보 수집
-        logger.info(f"{len(pokemon_list)}종 포켓몬 상세 정보 수집")
-        final_data = []
+        logger.info("%s종 포켓몬 상세 정보 수집", len(pokemon_list))
         success_count = 0
         error_count = 0
         
-        for i, p in enumerate(tqdm(pokemon_list, desc="포켓몬 상세 정보 수집")):
+        journal = CheckpointJournal(checkpoint_path, resume=resume)
+        if journal.completed:
+            logger.info("체크포인트에서 %s건 복원: %s", len(journal.completed), checkpoint_path)
+        EVOLUTION_CACHE.clear()
+        evolution_edges = EvolutionEdges()
+        descriptions = DescriptionStoreWriter()
+        pages = PageHashStore(refresh_path) if refresh_path else None
+        page_hashes = {}
+        reused_count = 0
+        # 추출기(이 모듈 + 섹션 색인 + 진화 차트)가 바뀌면 예전 추출 결과를 재사용하지 않도록 해시에 함께 넣는다
+        hash_salt = f"parser={parser_version(__name__, 'util.parsing', 'util.evolution')}"
+
+        def fetch_html(p):
+            # 같은 링크(폼 차이)는 상세 정보가 같으므로 링크를 체크포인트 키로 사용
+            if p["link"] in journal.completed:
+                return None
+            html = fetcher.fetch(p["link"])
+            if pages is not None:
+                digest = page_hash(html, hash_salt)
+                if pages.unchanged(p["link"], digest):
+                    return None
+                page_hashes[p["link"]] = digest
+            return html
+
+        parse = partial(parse_pokemon_item, parser_backend=parser_backend)
+        results = pipeline_map(fetch_html, parse, pokemon_list, fetch_workers=workers, parse_workers=parse_workers)
+        for i, (p, detail, detail_error) in enumerate(tqdm(results, total=len(pokemon_list), desc="포켓몬 상세 정보 수집")):
             try:
-                detail = get_pokemon_details(p["link"], logger=logger)
-
-                final_data.append({
-                    "id": p["id"],
-                    "generation": p["generation"],
-                    "name_en": p["name_en"],
-                    "name_kr": detail.get("name_kr"),
-                    "type1": p["type1"],
-                    "type2": p["type2"],
-                    "species": detail.get("species"),
-                    "height_m": detail.get("height_m"),
-                    "weight_kg": detail.get("weight_kg"),
-                    "base_exp": detail.get("base_exp"),
-                    "catch_rate": detail.get("catch_rate"),
-                    "form": detail.get("form", "normal"),
-                    "evo_from_id": detail.get("evo_from_id"),
-                    "evo_from_cond": detail.get("evo_from_cond"),
-                    "HP": detail.get("HP"),
-                    "Atk": detail.get("Atk"),
-                    "Def": detail.get("Def"),
-                    "SpAtk": detail.get("SpAtk"),
-                    "SpDef": detail.get("SpDef"),
-                    "Spd": detail.get("Spd"),
-                    "Tot": detail.get("Tot"),
-                    "descriptions": detail.get("descriptions"),
-                    "link": p["link"],
-                })
+                if detail_error:
+                    # 상세 정보 없이 목록 정보만으로 행 생성
+                    logger.warning("상세 정보 수집 실패 (%s): %s", p['link'], detail_error)
+                    detail = {}
+                elif detail is None:
+                    if p["link"] in journal.completed:
+                        detail = journal.completed[p["link"]]
+                    else:
+                        # 페이지가 바뀌지 않음: 지난 실행의 추출 결과 재사용
+                        detail = pages.detail(p["link"])
+                        journal.record(p["link"], detail)
+                        reused_count += 1
+                elif detail:
+                    journal.record(p["link"], detail)
+                    if pages is not None:
+                        pages.record(p["link"], page_hashes.get(p["link"]), detail)
+                evolution_edges.add_all(detail.get("evo_family"))
+                descriptions.add_descriptions(p["id"], detail.get("descriptions"))
 
+                row = build_pokemon_row(p, detail)
                 success_count += 1
                 
                 # 진행 상황 로깅 (매 50종마다)
                 if (i + 1) % 50 == 1:
-                    logger.info(f"진행 상황: {i + 1}/{len(pokemon_list)} 완료 ({((i + 1)/len(pokemon_list)*100):.1f}%)")
-                    logger.info(f"포켓몬 정보: \n{p} \n{detail}")
-                time.sleep(0.2)
+                    logger.info("진행 상황: %s/%s 완료 (%.1f%%)", i + 1, len(pokemon_list), (i + 1)/len(pokemon_list)*100)
+                    logger.info("포켓몬 정보: \n%s \n%s", p, detail)
                 print(p["id"], p["name_en"], detail.get("name_kr"))
                 
             except Exception as e:
                 error_count += 1
-                logger.error(f"포켓몬 정보 수집 실패 ({p['id']} {p['name_en']}): {str(e)}")
+                logger.error("포켓몬 정보 수집 실패 (%s %s): %s", p['id'], p['name_en'], e)
                 continue
 
-        logger.info(f"상세 정보 수집 완료: 성공 {success_count}종, 실패 {error_count}종")
+            yield row
+
+        if pages is not None:
+            pages.close()
+            logger.info("변경 감지: 바뀌지 않은 페이지 %s개 파싱 생략 (%s)", reused_count, refresh_path)
+        if archive is not None:
+            logger.info("원본 페이지 보관: 새 레코드 %s개, 내용이 같아 생략 %s개 (%s)", archive.added, archive.skipped, archive_path)
+        if evolution_path:
+            with RowWriter(evolution_path, EVOLUTION_COLUMNS) as edge_writer:
+                for edge in evolution_edges.edges:
+                    edge_writer.write(edge)
+            logger.info("진화 간선 %s개 저장: %s", len(evolution_edges), evolution_path)
+        if descriptions_path:
+            descriptions.save(descriptions_path)
+            logger.info("도감 설명 %s개 (고유 문장 %s개) 저장: %s", len(descriptions), descriptions.unique_count, descriptions_path)
+        export_run_metrics(metrics, metrics_path, prometheus_path, labels={"collector": "pokemon_basic"}, logger=logger)
+        logger.info("상세 정보 수집 완료: 성공 %s종, 실패 %s종", success_count, error_count)
         logger.info("=== 포켓몬 데이터 수집 완료 ===")
         
-        return pd.DataFrame(final_data)
-        
     except Exception as e:
-        logger.error(f"데이터 수집 중 심각한 오류 발생: {str(e)}")
+        logger.error("데이터 수집 중 심각한 오류 발생: %s", e)
+    finally:
+        # 소비자가 중간에 멈추거나(break) 예외가 나도 저널 파일을 닫는다
+        if journal is not None:
+            journal.close()
+        if archive is not None:
+            archive.close()
+
+
+def collect_all_pokemon_data(generations=[1], **kwargs):
+    """모든 포켓몬 데이터 수집 (DataFrame 반환, 인자는 iter_pokemon_rows와 같음)"""
+    rows = list(iter_pokemon_rows(generations=generations, **kwargs))
+    if not rows:
         return None
+    return pd.DataFrame(rows, columns=POKEMON_COLUMNS)
+
+
+def write_pokemon_data(output_files=None, changes_path="data/raw/pokemon_basic.changes.jsonl", rows=None, **kwargs):
+    """iter_pokemon_rows 결과를 한 행씩 바로 기록 (pyarrow가 있으면 세대별 Parquet도 함께)
+
+    첫 번째 출력(TSV)의 지난 결과와 비교한 변경 목록을 changes_path 에 쓴다.
+    rows: 기록할 행 (없으면 iter_pokemon_rows(**kwargs) 를 실행해 수집).
+    → (기록한 행 수, 출력 파일 목록, ChangesetWriter)
+    """
+    if output_files is None:
+        output_files = ["data/raw/pokemon_basic.tsv"]
+        if HAS_PYARROW:
+            output_files.append("data/raw/pokemon_basic.parquet")
+    # 변경 목록 작성기는 새 TSV를 열기 전에 만들어(이전 TSV를 옮겨 둠) 맨 뒤에 둔다 (새 TSV가 닫힌 뒤 비교)
+    changeset = ChangesetWriter(changes_path, output_files[0], key_columns=["id", "name_en"], columns=POKEMON_COLUMNS)
+    writers = [open_writer(path, POKEMON_COLUMNS, POKEMON_PARQUET_TYPES) for path in output_files] + [changeset]
+    with TeeWriter(writers) as writer:
+        for row in rows if rows is not None else iter_pokemon_rows(**kwargs):
+            writer.write(row)
+    return writer.count, output_files, changeset
 
 
 if __name__ == "__main__":
-    # 1세대 포켓몬 데이터 수집
-    df = collect_all_pokemon_data(generations=[1,2,3,4,5,6,7,8,9])
-    # df = collect_all_pokemon_data(generations=[1])
-    
-    if df is not None and len(df) > 0:
-        import os
-        os.makedirs("data/raw", exist_ok=True)
-        
-        output_file = "data/raw/pokemon_basic.tsv"
-        df.to_csv(output_file, index=False, sep="\t")
-        print(f"수집 완료: 총 {len(df)} 포켓몬 데이터 {output_file}에 저장됨")
+    # 1세대부터 9세대까지 수집하며 받은 페이지는 원본 보관소에 함께 기록
+    count, output_files, changeset = write_pokemon_data(
+        generations=[1,2,3,4,5,6,7,8,9], workers=4, parse_workers=None,
+        refresh_path="data/raw/pokemon_basic.pages.jsonl", archive_path="data/raw/pages.archive")
+    # count, output_files, changeset = write_pokemon_data(generations=[1])
+
+    if count > 0:
+        print(f"수집 완료: 총 {count} 포켓몬 데이터 {', '.join(output_files)}에 저장됨")
+        if changeset.has_previous:
+            print(f"변경 목록: {changeset.summary()} → {changeset.path}")
     else:
         print("데이터 수집 실패")
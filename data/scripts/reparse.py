@@ -0,0 +1,76 @@
+"""원본 페이지 보관소(data/raw/pages.archive)만으로 수집 결과를 다시 만드는 오프라인 재파싱
+
+추출기를 고친 뒤 네트워크 요청 없이 TSV(+Parquet), 진화 간선, 도감 설명, 변경 목록을 다시 만든다.
+수집기(iter_*_rows)를 ArchiveFetcher 로 그대로 실행하므로 결과는 같은 페이지로 수집한 것과 같고,
+파싱은 CPU 코어 수만큼의 프로세스에서 병렬로 실행한다.
+기술의 learnable 이 learnset 테이블을 따르므로 learnset → move 순서로 만든다.
+변경 감지 저장소(*.pages.jsonl)는 지난 추출 결과를 담고 있으므로 비우고 새 결과로 다시 채운다.
+
+    python data/scripts/reparse.py [--collectors pokemon learnset move] [--generations 1 2 3] [--parse-workers 4]
+"""
+import argparse
+import os
+import time
+
+from util.archive import DEFAULT_ARCHIVE_PATH, ArchiveFetcher, open_archive
+from util.common import setup_logging
+
+from learnset_basic import write_learnset_data
+from move_basic import default_learnset_path, write_move_data
+from pokemon_basic import write_pokemon_data
+
+COLLECTORS = ["pokemon", "learnset", "move"]
+POKEMON_PAGES = "data/raw/pokemon_basic.pages.jsonl"
+MOVE_PAGES = "data/raw/move_basic.pages.jsonl"
+
+
+def _reset(path):
+    if os.path.exists(path):
+        os.remove(path)
+    return path
+
+
+def reparse(collectors=COLLECTORS, generations=range(1, 10), archive_path=DEFAULT_ARCHIVE_PATH,
+            workers=8, parse_workers=None):
+    """보관소의 페이지로 collectors 결과를 다시 생성 → {수집기: (행 수, 소요 시간)}
+
+    보관소에 없는 세대 목록 페이지는 건너뛰고, 없는 상세 페이지는 수집 실패와 같이
+    상세 정보 없는 행이 된다.
+    workers: 보관소 읽기(압축 해제) 스레드 수, parse_workers: 파싱 프로세스 수 (None이면 CPU 코어 수)
+    """
+    logger = setup_logging()
+    generations = list(generations)
+    results = {}
+    with open_archive(archive_path) as archive:
+        logger.info("원본 페이지 보관소: %s개 페이지 (%s)", len(archive), archive_path)
+        options = dict(generations=generations, workers=workers, parse_workers=parse_workers,
+                       fetcher=ArchiveFetcher(archive))
+        for name in [c for c in COLLECTORS if c in collectors]:
+            start = time.perf_counter()
+            if name == "pokemon":
+                count, _, changeset = write_pokemon_data(refresh_path=_reset(POKEMON_PAGES), **options)
+            elif name == "learnset":
+                count, changeset = write_learnset_data(**options), None
+            else:
+                count, _, changeset = write_move_data(learnset_path=default_learnset_path(),
+                                                      refresh_path=_reset(MOVE_PAGES), **options)
+            elapsed = time.perf_counter() - start
+            results[name] = (count, elapsed)
+            logger.info("재파싱 %s: %s행 %.1f초", name, count, elapsed)
+            if changeset is not None and changeset.has_previous:
+                logger.info("재파싱 %s 변경 목록: %s → %s", name, changeset.summary(), changeset.path)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collectors", nargs="+", default=COLLECTORS, choices=COLLECTORS)
+    parser.add_argument("--generations", type=int, nargs="+", default=list(range(1, 10)))
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_PATH, help="원본 페이지 보관소 경로")
+    parser.add_argument("--workers", type=int, default=8, help="보관소 읽기 스레드 수")
+    parser.add_argument("--parse-workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+
+    results = reparse(args.collectors, args.generations, args.archive, args.workers, args.parse_workers)
+    for name, (count, elapsed) in results.items():
+        print(f"{name}: {count}행 {elapsed:.1f}초")
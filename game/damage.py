@@ -0,0 +1,207 @@
+import numpy as np
+
+# 타입 순서 (상성표의 행/열 번호), NO_TYPE 은 단일 타입 포켓몬의 빈 두 번째 타입
+TYPES = (
+    "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison", "Ground",
+    "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy",
+)
+TYPE_INDEX = {name.lower(): i for i, name in enumerate(TYPES)}
+NO_TYPE = len(TYPES)
+
+PHYSICAL, SPECIAL, STATUS = 0, 1, 2
+CATEGORIES = ("Physical", "Special", "Status")
+
+# 공격 타입 → (효과가 굉장한 타입, 효과가 별로인 타입, 효과가 없는 타입)
+_MATCHUPS = {
+    "Normal": ((), ("Rock", "Steel"), ("Ghost",)),
+    "Fire": (("Grass", "Ice", "Bug", "Steel"), ("Fire", "Water", "Rock", "Dragon"), ()),
+    "Water": (("Fire", "Ground", "Rock"), ("Water", "Grass", "Dragon"), ()),
+    "Electric": (("Water", "Flying"), ("Electric", "Grass", "Dragon"), ("Ground",)),
+    "Grass": (("Water", "Ground", "Rock"), ("Fire", "Grass", "Poison", "Flying", "Bug", "Dragon", "Steel"), ()),
+    "Ice": (("Grass", "Ground", "Flying", "Dragon"), ("Fire", "Water", "Ice", "Steel"), ()),
+    "Fighting": (("Normal", "Ice", "Rock", "Dark", "Steel"), ("Poison", "Flying", "Psychic", "Bug", "Fairy"), ("Ghost",)),
+    "Poison": (("Grass", "Fairy"), ("Poison", "Ground", "Rock", "Ghost"), ("Steel",)),
+    "Ground": (("Fire", "Electric", "Poison", "Rock", "Steel"), ("Grass", "Bug"), ("Flying",)),
+    "Flying": (("Grass", "Fighting", "Bug"), ("Electric", "Rock", "Steel"), ()),
+    "Psychic": (("Fighting", "Poison"), ("Psychic", "Steel"), ("Dark",)),
+    "Bug": (("Grass", "Psychic", "Dark"), ("Fire", "Fighting", "Poison", "Flying", "Ghost", "Steel", "Fairy"), ()),
+    "Rock": (("Fire", "Ice", "Flying", "Bug"), ("Fighting", "Ground", "Steel"), ()),
+    "Ghost": (("Psychic", "Ghost"), ("Dark",), ("Normal",)),
+    "Dragon": (("Dragon",), ("Steel",), ("Fairy",)),
+    "Dark": (("Psychic", "Ghost"), ("Fighting", "Dark", "Fairy"), ()),
+    "Steel": (("Ice", "Rock", "Fairy"), ("Fire", "Water", "Electric", "Steel"), ()),
+    "Fairy": (("Fighting", "Dragon", "Dark"), ("Fire", "Poison", "Steel"), ()),
+}
+
+
+def _build_type_chart():
+    chart = np.ones((len(TYPES), len(TYPES)), dtype=np.float32)
+    for attack, (double, half, immune) in _MATCHUPS.items():
+        row = chart[TYPES.index(attack)]
+        for multiplier, targets in ((2.0, double), (0.5, half), (0.0, immune)):
+            for target in targets:
+                row[TYPES.index(target)] = multiplier
+    return chart
+
+
+# TYPE_CHART[공격 타입, 방어 타입] (18×18)
+TYPE_CHART = _build_type_chart()
+
+# DUAL_TYPE_CHART[공격 타입, 방어 type1, 방어 type2] (18×19×19, 마지막 번호는 NO_TYPE = 배율 1)
+_PADDED = np.hstack([TYPE_CHART, np.ones((len(TYPES), 1), dtype=np.float32)])
+DUAL_TYPE_CHART = _PADDED[:, :, None] * _PADDED[:, None, :]
+# 같은 타입이 두 번 들어간 경우(type1 == type2)는 한 번만 적용
+_diag = np.arange(len(TYPES))
+DUAL_TYPE_CHART[:, _diag, _diag] = TYPE_CHART
+
+# 기대값 보정: 난수 0.85~1.00 평균, 급소(1/24 확률, 1.5배)
+RANDOM_FACTOR = 0.925
+CRIT_FACTOR = 1.0 + 0.5 / 24
+STAB = 1.5
+
+
+def type_codes(names):
+    """타입 이름 목록 → 타입 번호 배열 (없거나 모르는 타입은 NO_TYPE)"""
+    return np.array([TYPE_INDEX.get(str(name).strip().lower(), NO_TYPE) if name else NO_TYPE
+                     for name in names], dtype=np.int8)
+
+
+def category_codes(names):
+    """기술 분류 이름 목록 → PHYSICAL / SPECIAL / STATUS (모르는 값은 STATUS = 피해 없음)"""
+    codes = {name.lower(): i for i, name in enumerate(CATEGORIES)}
+    return np.array([codes.get(str(name).strip().lower(), STATUS) if name else STATUS
+                     for name in names], dtype=np.int8)
+
+
+def _numbers(values, missing=0.0):
+    """숫자/문자열/None 목록 → float32 배열 (결측·-1 은 missing)"""
+    result = np.full(len(values), missing, dtype=np.float32)
+    for i, value in enumerate(values):
+        if value is None or value == "":
+            continue
+        value = float(value)
+        if value == value and value >= 0:
+            result[i] = value
+    return result
+
+
+class PokemonArrays:
+    """피해 계산에 쓰는 포켓몬 열 (행 번호가 인덱스)"""
+
+    def __init__(self, atk, def_, spatk, spdef, type1, type2):
+        self.atk, self.def_, self.spatk, self.spdef = atk, def_, spatk, spdef
+        self.type1, self.type2 = type1, type2
+
+    def __len__(self):
+        return len(self.type1)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """pokemon_basic 행(dict) 목록 → PokemonArrays (스탯 결측은 1로 두어 0 나눗셈 방지)"""
+        rows = list(rows)
+        column = lambda name: [row.get(name) for row in rows]
+        return cls(
+            np.maximum(_numbers(column("Atk")), 1), np.maximum(_numbers(column("Def")), 1),
+            np.maximum(_numbers(column("SpAtk")), 1), np.maximum(_numbers(column("SpDef")), 1),
+            type_codes(column("type1")), type_codes(column("type2")),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """util.snapshot.Snapshot → PokemonArrays (타입 문자열은 풀에서 종류별로 한 번만 디코딩)"""
+        table = snapshot.pokemon
+        stat = lambda name: np.maximum(table[name].astype(np.float32), 1)
+        return cls(stat("Atk"), stat("Def"), stat("SpAtk"), stat("SpDef"),
+                   _pooled_codes(snapshot, table["type1"], type_codes),
+                   _pooled_codes(snapshot, table["type2"], type_codes))
+
+
+class MoveArrays:
+    """피해 계산에 쓰는 기술 열 (행 번호가 인덱스)"""
+
+    def __init__(self, power, category, move_type, accuracy):
+        self.power, self.category, self.type, self.accuracy = power, category, move_type, accuracy
+
+    def __len__(self):
+        return len(self.type)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """move_basic 행(dict) 목록 → MoveArrays (명중률 "inf"/결측은 반드시 명중)"""
+        rows = list(rows)
+        column = lambda name: [row.get(name) for row in rows]
+        return cls(_numbers(column("power")), category_codes(column("category")),
+                   type_codes(column("type")), _accuracy(_numbers(column("accuracy"), missing=np.inf)))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        table = snapshot.moves
+        power = table["power"].astype(np.float32)
+        accuracy = table["accuracy"].astype(np.float32)
+        return cls(np.where(power > 0, power, 0).astype(np.float32),
+                   _pooled_codes(snapshot, table["category"], category_codes),
+                   _pooled_codes(snapshot, table["type"], type_codes),
+                   _accuracy(np.where(np.isnan(accuracy), np.inf, accuracy)))
+
+
+def _accuracy(percent):
+    """명중률(%) → 명중 확률 (inf 는 1)"""
+    return np.minimum(percent / 100.0, 1.0).astype(np.float32)
+
+
+def _pooled_codes(snapshot, pool_ids, encode):
+    unique, inverse = np.unique(pool_ids, return_inverse=True)
+    return encode([snapshot.string(i) for i in unique])[inverse]
+
+
+class DamageCalculator:
+    """공격자 × 기술 × 방어자 기대 피해량 계산기
+
+    모든 메서드는 인덱스 배열을 받아 NumPy 브로드캐스팅으로 한 번에 계산한다.
+    기대 피해 = 기본 피해(세대 5 이후 공식) × 자속 보정 × 타입 상성 × 난수 평균 × 급소 기대값 × 명중률
+    (버림 처리를 하지 않은 연속값이므로 실제 게임 수치와는 1~2 차이가 날 수 있다)
+    """
+
+    def __init__(self, pokemon, moves, level=50):
+        self.pokemon = pokemon
+        self.moves = moves
+        self.level = level
+        # 공격/방어 스탯을 분류(물리/특수)별로 쌓아 두고 category 번호로 고른다
+        self._attack = np.stack([pokemon.atk, pokemon.spatk])
+        self._defense = np.stack([pokemon.def_, pokemon.spdef])
+        self._level_factor = np.float32(2 * level / 5 + 2)
+
+    def effectiveness(self, move_idx, defender_idx):
+        """기술 타입 → 방어자(복합 타입) 상성 배율 (타입 없는 기술은 1)"""
+        move_type = self.moves.type[move_idx]
+        chart = DUAL_TYPE_CHART[np.minimum(move_type, NO_TYPE - 1),
+                                self.pokemon.type1[defender_idx], self.pokemon.type2[defender_idx]]
+        return np.where(move_type == NO_TYPE, np.float32(1), chart)
+
+    def stab(self, attacker_idx, move_idx):
+        move_type = self.moves.type[move_idx]
+        same = (move_type != NO_TYPE) & ((self.pokemon.type1[attacker_idx] == move_type) |
+                                         (self.pokemon.type2[attacker_idx] == move_type))
+        return np.where(same, np.float32(STAB), np.float32(1))
+
+    def expected_damage(self, attacker_idx, move_idx, defender_idx):
+        """인덱스 배열(브로드캐스팅 가능) → 기대 피해량 float32 배열 (변화 기술은 0)"""
+        attacker_idx = np.asarray(attacker_idx)
+        move_idx = np.asarray(move_idx)
+        defender_idx = np.asarray(defender_idx)
+
+        category = self.moves.category[move_idx]
+        damaging = category != STATUS
+        kind = np.where(damaging, category, PHYSICAL)
+        attack = self._attack[kind, attacker_idx]
+        defense = self._defense[kind, defender_idx]
+
+        base = self._level_factor * self.moves.power[move_idx] * attack / defense / 50 + 2
+        damage = (base * self.stab(attacker_idx, move_idx) * self.effectiveness(move_idx, defender_idx)
+                  * np.float32(RANDOM_FACTOR * CRIT_FACTOR) * self.moves.accuracy[move_idx])
+        return np.where(damaging & (self.moves.power[move_idx] > 0), damage, 0).astype(np.float32)
+
+    def matrix(self, attackers, moves, defenders):
+        """모든 조합의 기대 피해량 [공격자, 기술, 방어자] 3차원 배열"""
+        a, m, d = np.ix_(np.asarray(attackers), np.asarray(moves), np.asarray(defenders))
+        return self.expected_damage(a, m, d)
@@ -0,0 +1,255 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from game.damage import STATUS, DamageCalculator, MoveArrays, PokemonArrays
+from util.snapshot import open_snapshot
+
+DEFAULT_SNAPSHOT = "data/raw/gamedata.snapshot"
+
+
+class BattleData:
+    """시뮬레이션용 게임 데이터 (스냅숏을 mmap 으로 열어 프로세스 간 페이지 공유)
+
+    덱에 넣을 수 있는 포켓몬은 스탯이 있는 행, 기술 카드는 위력이 있는 공격 기술만 쓴다.
+    """
+
+    def __init__(self, snapshot_path=DEFAULT_SNAPSHOT, level=50):
+        self.snapshot = open_snapshot(snapshot_path)
+        table = self.snapshot.pokemon
+        self.calc = DamageCalculator(PokemonArrays.from_snapshot(self.snapshot),
+                                     MoveArrays.from_snapshot(self.snapshot), level=level)
+        # 레벨 50 기준 실능력치 근사: HP = 2×종족값×L/100 + L + 10
+        self.max_hp = (2 * table["HP"].astype(np.float32) * level / 100 + level + 10).astype(np.float32)
+        self.speed = table["Spd"].astype(np.float32)
+
+        self.pokemon_pool = np.flatnonzero((table["HP"] > 0) & (table["Atk"] > 0) & (table["Spd"] >= 0))
+        moves = self.calc.moves
+        self.move_pool = np.flatnonzero((moves.category != STATUS) & (moves.power > 0))
+        if not len(self.pokemon_pool) or not len(self.move_pool):
+            raise ValueError(f"시뮬레이션에 쓸 포켓몬/기술이 없습니다: {snapshot_path}")
+
+    @property
+    def n_pokemon(self):
+        return len(self.speed)
+
+    @property
+    def n_moves(self):
+        return len(self.calc.moves)
+
+    def random_teams(self, rng, size, team_size, moves_per_pokemon):
+        """무작위 덱 size 개 → (팀 [size, T], 기술 카드 [size, T, K])"""
+        team = rng.choice(self.pokemon_pool, size=(size, team_size))
+        cards = rng.choice(self.move_pool, size=(size, team_size, moves_per_pokemon))
+        return team, cards
+
+
+class BatchStats:
+    """배치 결과 집계 (경기별 객체 없이 카운트 배열만, 부모 프로세스에서 합친다)"""
+
+    def __init__(self, n_pokemon, n_moves, floors=0):
+        self.battles = 0
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.turns = 0
+        self.pokemon_picks = np.zeros(n_pokemon, dtype=np.int64)
+        self.pokemon_wins = np.zeros(n_pokemon, dtype=np.int64)
+        self.move_usage = np.zeros(n_moves, dtype=np.int64)
+        self.floors_cleared = np.zeros(floors + 1, dtype=np.int64)
+
+    def merge(self, other):
+        for name in ("battles", "wins", "losses", "draws", "turns"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in ("pokemon_picks", "pokemon_wins", "move_usage", "floors_cleared"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    @property
+    def win_rate(self):
+        return self.wins / self.battles if self.battles else 0.0
+
+    def pokemon_win_rates(self):
+        """포켓몬별 (출전한 덱의) 승률, 출전하지 않은 포켓몬은 NaN"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.pokemon_wins / self.pokemon_picks
+
+    def summary(self, top=10):
+        usage = np.argsort(self.move_usage)[::-1][:top]
+        return {
+            "battles": self.battles, "wins": self.wins, "losses": self.losses, "draws": self.draws,
+            "win_rate": round(self.win_rate, 4),
+            "avg_turns": round(self.turns / self.battles, 2) if self.battles else 0.0,
+            "top_moves": [(int(m), int(self.move_usage[m])) for m in usage if self.move_usage[m]],
+            "floors_cleared": self.floors_cleared.tolist(),
+        }
+
+
+def battle(data, rng, team_a, cards_a, team_b, cards_b, hp_a=None, stats=None, max_turns=100):
+    """B개 경기를 한 번에 진행 (NumPy 벡터화)
+
+    매 턴 양쪽 선두 포켓몬이 자기 기술 카드 중 하나를 무작위로 쓰고, 스피드가 높은 쪽
+    (같으면 무작위)이 먼저 공격한다. 먼저 맞은 쪽이 쓰러지면 반격하지 못하고 다음 포켓몬이 나온다.
+    피해량은 기대 피해량에 난수 0.85~1.00 을 다시 곱한 값이다.
+    hp_a: A 팀 시작 HP [B, T] (연속 전투에서 이어받기, 없으면 최대 HP)
+    → (결과 [B]: 1 A 승 / -1 B 승 / 0 무승부, 경기 후 A 팀 HP [B, T])
+    """
+    size, team_size = team_a.shape
+    moves_per_pokemon = cards_a.shape[2]
+    hp_a = data.max_hp[team_a].copy() if hp_a is None else hp_a.copy()
+    hp_b = data.max_hp[team_b].copy()
+    for _ in range(max_turns):
+        # 앞 포켓몬부터 차례로 쓰러지므로 쓰러진 수가 곧 선두 번호
+        active_a = (hp_a <= 0).sum(axis=1)
+        active_b = (hp_b <= 0).sum(axis=1)
+        live = np.flatnonzero((active_a < team_size) & (active_b < team_size))
+        if not len(live):
+            break
+        slot_a, slot_b = active_a[live], active_b[live]
+        pa, pb = team_a[live, slot_a], team_b[live, slot_b]
+        ma = cards_a[live, slot_a, rng.integers(0, moves_per_pokemon, len(live))]
+        mb = cards_b[live, slot_b, rng.integers(0, moves_per_pokemon, len(live))]
+
+        roll = rng.uniform(0.85, 1.0, size=(2, len(live))).astype(np.float32) / np.float32(0.925)
+        dmg_a = data.calc.expected_damage(pa, ma, pb) * roll[0]
+        dmg_b = data.calc.expected_damage(pb, mb, pa) * roll[1]
+
+        speed_a, speed_b = data.speed[pa], data.speed[pb]
+        a_first = (speed_a > speed_b) | ((speed_a == speed_b) & (rng.random(len(live)) < 0.5))
+        cur_a, cur_b = hp_a[live, slot_a], hp_b[live, slot_b]
+        a_hits = a_first | (cur_a - dmg_b > 0)
+        b_hits = ~a_first | (cur_b - dmg_a > 0)
+        hp_b[live, slot_b] = cur_b - np.where(a_hits, dmg_a, 0)
+        hp_a[live, slot_a] = cur_a - np.where(b_hits, dmg_b, 0)
+
+        if stats is not None:
+            stats.turns += len(live)
+            stats.move_usage += np.bincount(ma[a_hits], minlength=len(stats.move_usage))
+
+    a_out = (hp_a <= 0).all(axis=1)
+    b_out = (hp_b <= 0).all(axis=1)
+    result = np.where(b_out & ~a_out, 1, np.where(a_out & ~b_out, -1, 0)).astype(np.int8)
+    if stats is not None:
+        stats.battles += size
+        stats.wins += int((result == 1).sum())
+        stats.losses += int((result == -1).sum())
+        stats.draws += int((result == 0).sum())
+    return result, np.maximum(hp_a, 0)
+
+
+# 작업 프로세스마다 한 번만 여는 게임 데이터
+_DATA = None
+
+
+def _init_worker(snapshot_path, level):
+    global _DATA
+    _DATA = BattleData(snapshot_path, level=level)
+
+
+def _worker_data(snapshot_path, level):
+    if _DATA is None or _DATA.snapshot.path != snapshot_path:
+        _init_worker(snapshot_path, level)
+    return _DATA
+
+
+def _battle_batch(snapshot_path, level, seed, size, team_size, moves_per_pokemon):
+    """무작위 덱끼리 size 경기 (작업 프로세스에서 실행) → BatchStats"""
+    data = _worker_data(snapshot_path, level)
+    rng = np.random.default_rng(seed)
+    stats = BatchStats(data.n_pokemon, data.n_moves)
+    team_a, cards_a = data.random_teams(rng, size, team_size, moves_per_pokemon)
+    team_b, cards_b = data.random_teams(rng, size, team_size, moves_per_pokemon)
+    result, _ = battle(data, rng, team_a, cards_a, team_b, cards_b, stats=stats)
+
+    won = result == 1
+    stats.pokemon_picks += np.bincount(team_a.ravel(), minlength=data.n_pokemon)
+    stats.pokemon_wins += np.bincount(team_a[won].ravel(), minlength=data.n_pokemon)
+    return stats
+
+
+def _run_batch(snapshot_path, level, seed, size, team_size, moves_per_pokemon, floors):
+    """로그라이크 런 size 개: 덱 하나로 층마다 새 무작위 상대와 싸우며 HP는 이어진다 → BatchStats"""
+    data = _worker_data(snapshot_path, level)
+    rng = np.random.default_rng(seed)
+    stats = BatchStats(data.n_pokemon, data.n_moves, floors=floors)
+    team, cards = data.random_teams(rng, size, team_size, moves_per_pokemon)
+    hp = data.max_hp[team].copy()
+    cleared = np.zeros(size, dtype=np.int64)
+    alive = np.arange(size)
+
+    for _ in range(floors):
+        if not len(alive):
+            break
+        enemy, enemy_cards = data.random_teams(rng, len(alive), team_size, moves_per_pokemon)
+        result, hp[alive] = battle(data, rng, team[alive], cards[alive], enemy, enemy_cards,
+                                   hp_a=hp[alive], stats=stats)
+        cleared[alive[result == 1]] += 1
+        alive = alive[result == 1]
+
+    stats.floors_cleared += np.bincount(cleared, minlength=floors + 1)
+    stats.pokemon_picks += np.bincount(team.ravel(), minlength=data.n_pokemon)
+    # 런 결과로는 "끝까지 클리어"를 승리로 본다
+    finished = cleared == floors
+    stats.pokemon_wins += np.bincount(team[finished].ravel(), minlength=data.n_pokemon)
+    return stats
+
+
+def _split(total, batch_size):
+    sizes = [batch_size] * (total // batch_size)
+    if total % batch_size:
+        sizes.append(total % batch_size)
+    return sizes
+
+
+def _map_batches(func, args_list, snapshot_path, level, workers):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        return [func(*args) for args in args_list]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(snapshot_path, level)) as pool:
+        return list(pool.map(func, *zip(*args_list)))
+
+
+def _merge(results, n_pokemon, n_moves, floors=0):
+    stats = BatchStats(n_pokemon, n_moves, floors=floors)
+    for result in results:
+        stats.merge(result)
+    return stats
+
+
+def simulate_battles(n_battles, snapshot_path=DEFAULT_SNAPSHOT, seed=0, workers=None,
+                     batch_size=10000, team_size=3, moves_per_pokemon=4, level=50):
+    """무작위 덱끼리 n_battles 경기를 시뮬레이션해 합친 BatchStats 반환
+
+    seed 하나에서 SeedSequence.spawn 으로 배치마다 독립 난수열을 나누므로,
+    workers 수와 관계없이 같은 seed면 같은 결과가 나온다.
+    workers: 작업 프로세스 수 (0이면 프로세스 없이 실행, None이면 CPU 코어 수)
+    """
+    sizes = _split(n_battles, batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args_list = [(snapshot_path, level, s, size, team_size, moves_per_pokemon) for s, size in zip(seeds, sizes)]
+    results = _map_batches(_battle_batch, args_list, snapshot_path, level, workers)
+    return _merge(results, *_shape(results))
+
+
+def simulate_runs(n_runs, floors=10, snapshot_path=DEFAULT_SNAPSHOT, seed=0, workers=None,
+                  batch_size=2000, team_size=3, moves_per_pokemon=4, level=50):
+    """로그라이크 런 n_runs 개 시뮬레이션 → BatchStats (floors_cleared: 클리어한 층 수 분포)
+
+    나머지 인자는 simulate_battles 와 같다.
+    """
+    sizes = _split(n_runs, batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args_list = [(snapshot_path, level, s, size, team_size, moves_per_pokemon, floors)
+                 for s, size in zip(seeds, sizes)]
+    results = _map_batches(_run_batch, args_list, snapshot_path, level, workers)
+    return _merge(results, *_shape(results), floors=floors)
+
+
+def _shape(results):
+    """배치 결과 → (포켓몬 수, 기술 수)"""
+    if not results:
+        return 0, 0
+    return len(results[0].pokemon_picks), len(results[0].move_usage)
@@ -9,6 +9,13 @@ setup(
         "requests",
         "beautifulsoup4", 
         "pandas",
+        "numpy",
         "tqdm"
-    ]
+    ],
+    extras_require={
+        "fast": ["lxml", "selectolax"],
+        "parquet": ["pyarrow"],
+        "async": ["aiohttp"],
+        "zstd": ["zstandard"],
+    }
 ) 
\ No newline at end of file
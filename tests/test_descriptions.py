@@ -0,0 +1,45 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "data", "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from pokemon_basic import parse_pokemon_details  # noqa: E402
+from util.descriptions import DescriptionStoreWriter, open_descriptions, split_descriptions  # noqa: E402
+
+# 문장 안에 ", (" 가 들어 있는 도감 설명
+SENTENCE = "It naps in the sun, (as it is said) storing energy."
+DEX_HTML = f"""<html><body><main>
+<h2>Pokédex entries</h2>
+<table>
+<tr><th><span>Red</span><span>Blue</span></th><td>{SENTENCE}</td></tr>
+<tr><th>Yellow</th><td>Another Pokémon entry.</td></tr>
+</table>
+</main></body></html>"""
+
+
+def test_dex_entries_keep_sentences_with_comma_paren():
+    data = parse_pokemon_details(DEX_HTML, "/pokedex/test", partial=False)
+    assert data["descriptions"] == [
+        ["Red", SENTENCE], ["Blue", SENTENCE], ["Yellow", "Another POKEMON entry."],
+    ]
+
+
+def test_description_store_roundtrip(tmp_path):
+    path = str(tmp_path / "descriptions.bin")
+    writer = DescriptionStoreWriter()
+    writer.add_descriptions("0001", [["Red", SENTENCE], ["Blue", SENTENCE], ["Yellow", "Short."]])
+    writer.add_descriptions("0001", [["Red", "폼 중복은 건너뛴다"]])
+    writer.save(path)
+
+    store = open_descriptions(path)
+    assert store.get(1) == {"Red": SENTENCE, "Blue": SENTENCE, "Yellow": "Short."}
+    assert writer.unique_count == 2
+
+
+def test_split_legacy_descriptions():
+    assert split_descriptions("(Red&Blue)First., (Yellow)Second.") == [
+        ("Red", "First."), ("Blue", "First."), ("Yellow", "Second."),
+    ]
@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "bench"), os.path.join(ROOT, "data", "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from corpus import iter_pages  # noqa: E402
+from learnset_basic import parse_learnset  # noqa: E402
+from move_basic import parse_move_details  # noqa: E402
+from pokemon_basic import parse_pokemon_details  # noqa: E402
+from util.evolution import EvolutionCache  # noqa: E402
+
+POKEMON_PAGES = list(iter_pages("pokemon_detail"))
+MOVE_PAGES = list(iter_pages("move_detail"))
+
+BACKENDS = ["html.parser", "lxml", "selectolax"]
+
+
+def require(backend):
+    """설치되지 않은 백엔드는 건너뛴다"""
+    if backend != "html.parser":
+        pytest.importorskip(backend)
+
+
+def encode(detail):
+    return json.dumps(detail, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+def test_corpus_is_not_empty():
+    assert POKEMON_PAGES and MOVE_PAGES
+
+
+@pytest.mark.parametrize("partial", [False, True])
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_pokemon_details_identical_across_backends(backend, partial):
+    require(backend)
+    # 기준: html.parser 전체 파싱 (진화 차트도 매번 파싱하도록 호출마다 빈 캐시 사용)
+    for link, html in POKEMON_PAGES:
+        expected = encode(parse_pokemon_details(html, link, partial=False, evolution_cache=EvolutionCache()))
+        got = encode(parse_pokemon_details(html, link, parser_backend=backend, partial=partial,
+                                           evolution_cache=EvolutionCache()))
+        assert got == expected, link
+
+
+@pytest.mark.parametrize("partial", [False, True])
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_learnset_identical_across_backends(backend, partial):
+    require(backend)
+    for link, html in POKEMON_PAGES:
+        expected = encode(parse_learnset(html, partial=False))
+        assert encode(parse_learnset(html, parser_backend=backend, partial=partial)) == expected, link
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_move_details_identical_across_backends(backend):
+    require(backend)
+    for link, html in MOVE_PAGES:
+        expected = encode(parse_move_details(html))
+        assert encode(parse_move_details(html, parser_backend=backend)) == expected, link
@@ -0,0 +1,228 @@
+import gzip
+import json
+import mmap
+import os
+import threading
+import time
+
+from util import metrics
+from util.delta import page_hash
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+DEFAULT_ARCHIVE_PATH = "data/raw/pages.archive"
+
+# zstandard가 있으면 zstd, 없으면 gzip (레코드마다 코덱을 색인에 기록하므로 섞여 있어도 읽을 수 있다)
+DEFAULT_CODEC = "zstd" if HAS_ZSTD else "gzip"
+
+
+class ArchiveMiss(Exception):
+    """보관소에 없는 URL을 요청한 경우 (ArchiveFetcher)"""
+
+
+def _index_path(path):
+    return path + ".idx"
+
+
+def _compress(codec, data, level):
+    if codec == "zstd":
+        if not HAS_ZSTD:
+            raise ImportError("zstd 보관소에는 zstandard가 필요합니다 (pip install zstandard)")
+        return zstandard.ZstdCompressor(level=level or 10).compress(data)
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=level or 6)
+    raise ValueError(f"지원하지 않는 코덱: {codec}")
+
+
+def _decompress(codec, data):
+    if codec == "zstd":
+        if not HAS_ZSTD:
+            raise ImportError("zstd 보관소에는 zstandard가 필요합니다 (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "gzip":
+        return gzip.decompress(data)
+    raise ValueError(f"지원하지 않는 코덱: {codec}")
+
+
+def read_index(path):
+    """색인 파일 → {url: 색인 항목} (같은 URL은 마지막 줄 우선, 잘린 줄은 무시)"""
+    entries = {}
+    index_path = _index_path(path)
+    if not os.path.exists(index_path):
+        return entries
+    with open(index_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                entries[entry["url"]] = entry
+            except (ValueError, KeyError, TypeError):
+                continue
+    return entries
+
+
+class PageArchiveWriter:
+    """수집한 원본 HTML을 압축해 추가 기록하는 페이지 보관소 (WARC와 비슷한 구조)
+
+    path: 레코드 파일. 레코드마다 독립된 gzip 멤버 / zstd 프레임이라 파일 전체를
+          zcat / zstdcat 으로도 풀 수 있다. 레코드 내용은 헤더 JSON 한 줄 + 본문(UTF-8).
+    path + ".idx": {"url", "offset", "length", "codec", "hash", "fetched_at"} JSONL 색인
+    codec: "zstd" / "gzip" (기본: zstandard가 있으면 zstd)
+
+    같은 URL의 본문이 마지막 기록과 같으면(내용 해시 비교) 다시 기록하지 않는다.
+    레코드를 먼저 flush 한 뒤 색인을 쓰므로 중단되어도 색인은 완전한 레코드만 가리킨다.
+    여러 프로세스가 같은 보관소에 동시에 기록하면 안 된다.
+    """
+
+    def __init__(self, path=DEFAULT_ARCHIVE_PATH, codec=None, level=None):
+        self.path = path
+        self.codec = codec or DEFAULT_CODEC
+        self.level = level
+        self.added = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._latest = {url: entry.get("hash") for url, entry in read_index(path).items()}
+        self._data = open(path, "ab")
+        self._index = open(_index_path(path), "ab")
+        # 중단으로 잘린 마지막 색인 줄 뒤에 이어 쓰지 않도록 줄을 끝내 둔다
+        if self._index.tell() > 0:
+            with open(_index_path(path), "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._index.write(b"\n")
+
+    def __len__(self):
+        return len(self._latest)
+
+    def add(self, url, html, fetched_at=None):
+        """페이지 기록, 마지막 기록과 내용이 같아 건너뛰면 False"""
+        digest = page_hash(html)
+        with self._lock:
+            if self._latest.get(url) == digest:
+                self.skipped += 1
+                return False
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        header = json.dumps({"url": url, "hash": digest, "fetched_at": fetched_at}, ensure_ascii=False)
+        # 압축은 잠금 밖에서 (수집 스레드마다 병렬로)
+        record = _compress(self.codec, (header + "\n" + html).encode("utf-8"), self.level)
+
+        with self._lock:
+            if self._latest.get(url) == digest:
+                self.skipped += 1
+                return False
+            offset = self._data.tell()
+            self._data.write(record)
+            self._data.flush()
+            entry = {"url": url, "offset": offset, "length": len(record), "codec": self.codec,
+                     "hash": digest, "fetched_at": fetched_at}
+            self._index.write((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+            self._index.flush()
+            self._latest[url] = digest
+            self.added += 1
+        metrics.inc("archive.records")
+        metrics.inc("archive.bytes", len(record))
+        return True
+
+    def close(self):
+        with self._lock:
+            self._data.close()
+            self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PageArchive:
+    """mmap 으로 연 페이지 보관소 (읽기 전용, URL별 최신 레코드)
+
+    연 시점의 색인만 읽으므로, 기록 중인 보관소를 열어도 이후 추가된 레코드는 보이지 않는다.
+    스레드에서 동시에 get() 해도 안전하다.
+    """
+
+    def __init__(self, path=DEFAULT_ARCHIVE_PATH):
+        self.path = path
+        # 색인을 먼저 읽어야 mmap 범위가 색인이 가리키는 레코드를 모두 포함한다
+        self._entries = read_index(path)
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url):
+        return url in self._entries
+
+    def urls(self):
+        return list(self._entries)
+
+    def entry(self, url):
+        """색인 항목 (없으면 None)"""
+        return self._entries.get(url)
+
+    def record(self, url):
+        """(헤더 dict, 본문) 반환 (없으면 None)"""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        raw = _decompress(entry["codec"], self._mm[entry["offset"]:entry["offset"] + entry["length"]])
+        header, _, body = raw.decode("utf-8").partition("\n")
+        return json.loads(header), body
+
+    def get(self, url):
+        """URL의 최신 본문 (없으면 None)"""
+        record = self.record(url)
+        return record[1] if record else None
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_archive(path=DEFAULT_ARCHIVE_PATH):
+    return PageArchive(path)
+
+
+class ArchiveFetcher:
+    """Fetcher 대신 넘겨 보관소의 페이지만으로 수집을 재현하는 오프라인 수집기 (네트워크 요청 없음)
+
+        with open_archive() as archive:
+            rows = list(iter_pokemon_rows(fetcher=ArchiveFetcher(archive)))
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+
+    def fetch(self, url):
+        body = self.archive.get(url)
+        if body is None:
+            metrics.inc("archive.miss")
+            raise ArchiveMiss(url)
+        metrics.inc("archive.hit")
+        return body
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,175 @@
+import asyncio
+import random
+import time
+from functools import partial
+
+from util import metrics
+from util.cache import CacheMiss
+from util.fetcher import DEFAULT_HEADERS, RETRY_STATUS
+from util.ratelimit import parse_retry_after
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+
+def _require_aiohttp():
+    if not HAS_AIOHTTP:
+        raise ImportError("asyncio 수집에는 aiohttp가 필요합니다 (pip install aiohttp)")
+
+
+class AsyncFetcher:
+    """aiohttp 기반 asyncio HTTP 수집기 (Fetcher와 같은 재시도/캐시/요청 제한 규칙)
+
+    concurrency: 동시에 진행하는 요청 수 상한 (세마포어)
+    per_host: 호스트당 커넥션 수 상한
+    timeout: 요청 전체 타임아웃(초)
+    나머지 인자는 Fetcher와 같다. HttpCache 디스크 읽기/쓰기와 보관소(archive) 기록은 기본 스레드 풀에서 실행한다.
+
+        async with AsyncFetcher(concurrency=32) as fetcher:
+            pages = await fetcher.fetch_all(urls)
+    """
+
+    def __init__(self, concurrency=20, per_host=8, timeout=30, retries=3, backoff=0.5, max_backoff=30.0,
+                 headers=None, cache=None, rate_limiter=None, archive=None, logger=None):
+        _require_aiohttp()
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.archive = archive
+        self.logger = logger
+        self._session = None
+        self._semaphore = None
+
+    async def _ensure_session(self):
+        # aiohttp 세션과 세마포어는 실행 중인 이벤트 루프 안에서 만들어야 한다
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def _sleep_backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            # rate_limiter가 있으면 다음 예약에서 Retry-After만큼 기다린다
+            if self.rate_limiter is None:
+                await asyncio.sleep(retry_after)
+            return retry_after
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        await asyncio.sleep(delay)
+        return delay
+
+    async def _request(self, session, url, headers):
+        """요청 1회 → (상태 코드, 응답 헤더, 본문)"""
+        start = time.perf_counter()
+        async with session.get(url, headers=headers) as res:
+            ttfb = time.perf_counter() - start
+            body = await res.read()
+            total = time.perf_counter() - start
+            text = body.decode(res.get_encoding(), errors="replace") if res.status != 304 else ""
+            metrics.observe("fetch.ttfb", ttfb)
+            metrics.observe("fetch.download", total - ttfb)
+            metrics.observe("fetch.total", total)
+            metrics.inc(f"fetch.status_{res.status}")
+            metrics.inc("fetch.bytes_body", len(body))
+            return res.status, res.headers, text
+
+    async def get(self, url, headers=None):
+        """재시도를 포함한 GET 요청 → (상태 코드, 응답 헤더, 본문), 최종 실패 시 예외 발생"""
+        session = await self._ensure_session()
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(url)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                metrics.observe("ratelimit.wait", wait)
+            if attempt > 0:
+                metrics.inc("fetch.retries")
+            metrics.inc("fetch.requests")
+            try:
+                async with self._semaphore:
+                    status, res_headers, text = await self._request(session, url, headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                metrics.inc("fetch.errors")
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_error(url)
+                if attempt >= self.retries:
+                    raise
+                delay = await self._sleep_backoff(attempt)
+                if self.logger:
+                    self.logger.debug("요청 재시도 %s/%s (%s): %s - %.2f초 대기", attempt + 1, self.retries, url, e, delay)
+                continue
+
+            retry_after = res_headers.get("Retry-After")
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_response(url, status, retry_after)
+
+            if status in RETRY_STATUS and attempt < self.retries:
+                delay = await self._sleep_backoff(attempt, parse_retry_after(retry_after))
+                if self.logger:
+                    self.logger.debug("요청 재시도 %s/%s (%s): HTTP %s - %.2f초 대기", attempt + 1, self.retries, url, status, delay)
+                continue
+
+            if status >= 400:
+                raise aiohttp.ClientResponseError(None, (), status=status, message=f"HTTP {status}: {url}")
+            return status, res_headers, text
+
+    async def _in_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+
+    async def fetch(self, url):
+        """페이지 본문(text) 반환, 캐시가 있으면 캐시를 먼저 확인 (Fetcher.fetch 와 같은 순서)"""
+        body = await self._fetch_body(url)
+        if self.archive is not None:
+            await self._in_thread(self.archive.add, url, body)
+        return body
+
+    async def _fetch_body(self, url):
+        if self.cache is None:
+            _, _, text = await self.get(url)
+            return text
+
+        entry = await self._in_thread(self.cache.lookup, url)
+        if entry is not None and (self.cache.offline or self.cache.is_fresh(entry)):
+            metrics.inc("cache.hit")
+            return entry.body
+        if self.cache.offline:
+            metrics.inc("cache.miss")
+            raise CacheMiss(url)
+
+        headers = self.cache.validators(entry) if entry is not None else {}
+        status, res_headers, text = await self.get(url, headers=headers)
+        if status == 304 and entry is not None:
+            metrics.inc("cache.revalidated")
+            await self._in_thread(self.cache.refresh, entry)
+            return entry.body
+        metrics.inc("cache.miss")
+        await self._in_thread(self.cache.put, url, text, res_headers.get("ETag"), res_headers.get("Last-Modified"))
+        return text
+
+    async def fetch_all(self, urls):
+        """여러 URL을 동시에 수집, urls 순서대로 본문 또는 예외 객체 목록 반환"""
+        return await asyncio.gather(*(self.fetch(url) for url in urls), return_exceptions=True)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
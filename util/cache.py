@@ -0,0 +1,129 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+CacheEntry = namedtuple("CacheEntry", ["url", "body", "etag", "last_modified", "fetched_at"])
+
+
+class CacheMiss(Exception):
+    """오프라인(cache-only) 모드에서 캐시에 없는 URL을 요청한 경우"""
+
+
+class HttpCache:
+    """URL 기반 디스크 응답 캐시
+
+    - ttl(초) 이내의 응답은 네트워크 없이 반환
+    - ttl이 지난 응답은 ETag/Last-Modified 조건부 요청으로 재검증 (304면 본문 재사용)
+    - 전체 크기가 max_bytes를 넘으면 마지막 접근 시각이 오래된 항목부터 삭제 (LRU)
+    - offline=True 이면 네트워크 없이 캐시만 사용 (만료 여부 무시)
+
+    본문은 <key>.html.gz, 메타데이터는 <key>.json 으로 저장하며
+    본문 파일의 mtime을 마지막 접근 시각으로 사용한다.
+    """
+
+    def __init__(self, directory=".cache/http", ttl=7 * 24 * 3600,
+                 max_bytes=2 * 1024 ** 3, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        subdir = os.path.join(self.directory, key[:2])
+        return subdir, os.path.join(subdir, key + ".html.gz"), os.path.join(subdir, key + ".json")
+
+    def lookup(self, url):
+        """캐시 항목 반환 (없으면 None), 접근 시각 갱신"""
+        _, body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with gzip.open(body_path, "rt", encoding="utf-8") as f:
+                body = f.read()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(url, body, meta.get("etag"), meta.get("last_modified"), meta.get("fetched_at", 0))
+
+    def is_fresh(self, entry):
+        return self.ttl is None or time.time() - entry.fetched_at < self.ttl
+
+    def validators(self, entry):
+        """조건부 요청 헤더"""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _write_meta(self, meta_path, url, etag, last_modified):
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+        tmp_path = f"{meta_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    def refresh(self, entry):
+        """304 응답 후 fetched_at만 갱신"""
+        _, _, meta_path = self._paths(entry.url)
+        self._write_meta(meta_path, entry.url, entry.etag, entry.last_modified)
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """응답 저장 후 필요하면 오래된 항목 정리"""
+        subdir, body_path, meta_path = self._paths(url)
+        os.makedirs(subdir, exist_ok=True)
+
+        try:
+            old_size = os.path.getsize(body_path)
+        except OSError:
+            old_size = 0
+
+        tmp_path = f"{body_path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            f.write(body)
+        new_size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, body_path)
+        self._write_meta(meta_path, url, etag, last_modified)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += new_size - old_size
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for subdir in os.scandir(self.directory):
+            if not subdir.is_dir():
+                continue
+            for item in os.scandir(subdir.path):
+                if item.name.endswith(".html.gz"):
+                    stat = item.stat()
+                    yield item.path, stat.st_size, stat.st_mtime
+
+    def _scan_total(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        # 최대 크기의 90%까지 줄여서 매 put마다 정리가 반복되지 않게 함
+        target = self.max_bytes * 0.9
+        for body_path, size, _ in sorted(self._entries(), key=lambda e: e[2]):
+            if self._total_bytes <= target:
+                break
+            meta_path = body_path[:-len(".html.gz")] + ".json"
+            for path in (body_path, meta_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes -= size
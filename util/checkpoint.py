@@ -0,0 +1,66 @@
+import json
+import os
+import threading
+
+
+class CheckpointJournal:
+    """완료된 상세 수집 결과를 한 줄(JSON)씩 추가 기록하는 체크포인트 저널
+
+    resume=False 이면 기존 저널을 비우고 새로 시작하고,
+    resume=True 이면 기존 기록을 읽어 completed 에 적재한 뒤 이어서 기록한다.
+    이번 실행에서 기록한 항목은 메모리에 쌓지 않는다 (파일에만 추가).
+    중단 시점에 잘린 마지막 줄은 무시한다.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.completed = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume and os.path.exists(path):
+            self.completed = self._load()
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+        # 중단으로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄을 끝내 둔다
+        if resume and self._ends_without_newline():
+            self._file.write("\n")
+            self._file.flush()
+
+    def _ends_without_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def _load(self):
+        completed = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    completed[record["key"]] = record["detail"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return completed
+
+    def record(self, key, detail):
+        """완료 항목 기록 (즉시 flush)"""
+        line = json.dumps({"key": key, "detail": detail}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
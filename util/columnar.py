@@ -0,0 +1,156 @@
+import glob
+import logging
+import os
+import shutil
+
+from util.common import LOGGER_NAME
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# 정수 열 타입별 값 범위 (벗어나면 pyarrow 가 배열을 만들지 못한다)
+_INT_RANGES = {"uint8": (0, 2**8 - 1), "uint16": (0, 2**16 - 1), "int32": (-2**31, 2**31 - 1)}
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("Parquet 출력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+def _arrow_type(name):
+    """타입 이름 → pyarrow 타입
+
+    category 는 int8 인덱스 사전 인코딩 (타입/분류처럼 값 종류가 127개 이하인 열)
+    """
+    return {
+        "uint8": pa.uint8(),
+        "uint16": pa.uint16(),
+        "int32": pa.int32(),
+        "float32": pa.float32(),
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int8(), pa.string()),
+    }[name]
+
+
+def _coerce(value, type_name):
+    """수집 행의 값 → 열 타입에 맞는 파이썬 값 (빈 값은 None)
+
+    숫자로 바꿀 수 없거나 정수 열 범위를 벗어나면 ValueError
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, float) and value != value:  # NaN
+        return None
+    if type_name in _INT_RANGES:
+        # "0001" 같은 문자열 ID도 정수로 저장
+        number = int(value)
+        low, high = _INT_RANGES[type_name]
+        if not low <= number <= high:
+            raise ValueError(f"{type_name} 범위를 벗어난 값: {number}")
+        return number
+    if type_name == "float32":
+        # 명중률 "inf"(반드시 명중) → inf
+        return float(value)
+    return str(value)
+
+
+def build_schema(columns, types):
+    return pa.schema([(col, _arrow_type(types.get(col, "string"))) for col in columns])
+
+
+class ParquetWriter:
+    """partition_by 열 값별 디렉터리에 나눠 쓰는 Parquet 작성기
+
+    <directory>/<partition_by>=<값>/part-0.parquet 형태(hive 파티션)로 기록하며
+    파티션 열 자체는 파일에 넣지 않는다. 파티션마다 batch_size 행씩 모아
+    row group 으로 기록하므로 메모리는 batch_size × 파티션 수 행을 넘지 않는다.
+    types: {열 이름: "uint8" / "uint16" / "int32" / "float32" / "string" / "category"}
+    열 타입으로 바꿀 수 없는 값(잘못 수집된 값)은 수집을 멈추지 않도록 빈 값으로 기록하고
+    경고 로그를 남긴다 (invalid: 그런 값의 수).
+    """
+
+    def __init__(self, directory, columns, types, partition_by="generation", batch_size=500):
+        _require_pyarrow()
+        self.directory = directory
+        self.partition_by = partition_by
+        self.batch_size = batch_size
+        self.types = types
+        self.columns = [col for col in columns if col != partition_by]
+        self.schema = build_schema(self.columns, types)
+        self.count = 0
+        self.invalid = 0
+        self._buffers = {}
+        self._writers = {}
+
+        # 이전 실행의 파티션만 지우고 새로 기록
+        for old in glob.glob(os.path.join(directory, f"{partition_by}=*")):
+            shutil.rmtree(old)
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, row):
+        key = row.get(self.partition_by)
+        self._buffers.setdefault(key, []).append(row)
+        self.count += 1
+        if len(self._buffers[key]) >= self.batch_size:
+            self._flush(key)
+
+    def _flush(self, key):
+        rows = self._buffers.pop(key, [])
+        if not rows:
+            return
+        arrays = []
+        for col, field in zip(self.columns, self.schema):
+            type_name = self.types.get(col, "string")
+            values = [self._value(row, col, type_name) for row in rows]
+            if type_name == "category":
+                arrays.append(pa.array(values, pa.string()).dictionary_encode().cast(field.type))
+            else:
+                arrays.append(pa.array(values, field.type))
+        table = pa.Table.from_arrays(arrays, schema=self.schema)
+
+        if key not in self._writers:
+            part_dir = os.path.join(self.directory, f"{self.partition_by}={key}")
+            os.makedirs(part_dir, exist_ok=True)
+            self._writers[key] = pq.ParquetWriter(os.path.join(part_dir, "part-0.parquet"), self.schema, compression="zstd")
+        self._writers[key].write_table(table)
+
+    def _value(self, row, col, type_name):
+        value = row.get(col)
+        try:
+            return _coerce(value, type_name)
+        except (TypeError, ValueError, OverflowError) as e:
+            self.invalid += 1
+            logger.warning("Parquet %s 열 값 변환 실패 → 빈 값 (%s): %s", col, row.get("link"), e)
+            return None
+
+    def close(self):
+        for key in list(self._buffers):
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_parquet_dataset(directory, partition_by="generation", values=None, columns=None):
+    """파티션된 Parquet 데이터셋 읽기 (values 파티션만 읽음) → pandas DataFrame"""
+    _require_pyarrow()
+    dataset = ds.dataset(directory, format="parquet", partitioning="hive")
+    filter_expr = ds.field(partition_by).isin(list(values)) if values is not None else None
+    table = dataset.to_table(columns=columns, filter=filter_expr)
+    # 결측이 있는 정수 열이 float로 바뀌지 않도록 pandas nullable 정수 사용
+    import pandas as pd
+    nullable = {pa.uint8(): pd.UInt8Dtype(), pa.uint16(): pd.UInt16Dtype(), pa.int32(): pd.Int32Dtype()}
+    return table.to_pandas(types_mapper=nullable.get)
@@ -1,42 +1,128 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
+import time
 from datetime import datetime
 import os
 
+LOGGER_NAME = "pokemon_collector"
+
+_listener = None
+_log_filename = None
+_setup_lock = threading.Lock()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 그대로 큐에 넣는 QueueHandler
+
+    기본 QueueHandler.prepare 는 호출한 스레드에서 메시지를 포맷하지만, 같은 프로세스의
+    리스너 스레드로만 넘기므로 포맷(% 치환 포함)은 리스너 스레드에서 하도록 미룬다.
+    따라서 로그 인자로 넘긴 객체는 기록 후 변경하지 않아야 한다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class SampledFilter(logging.Filter):
+    """같은 메시지 템플릿의 반복 로그를 제한하는 필터
+
+    (로거 이름, 메시지 템플릿)마다 interval 초 안에 burst 건까지만 통과시키고,
+    나머지는 버린 뒤 다음에 통과하는 레코드에 생략 건수를 덧붙인다.
+    levels 에 있는 레벨(기본: DEBUG 파싱 오류)만 제한하고, WARNING 이상은 항목별 실패 링크를
+    남겨야 하므로 levels 와 관계없이 항상 통과한다.
+    """
+
+    def __init__(self, burst=5, interval=10.0, levels=(logging.DEBUG,)):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.levels = frozenset(levels)
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or record.levelno not in self.levels:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            start, passed, dropped = self._windows.get(key, (now, 0, 0))
+            if now - start >= self.interval:
+                start, passed = now, 0
+            if passed >= self.burst:
+                self._windows[key] = (start, passed, dropped + 1)
+                return False
+            self._windows[key] = (start, passed + 1, 0)
+        if dropped:
+            record.msg = f"{record.msg} (같은 로그 {dropped}건 생략)"
+        return True
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 
 def setup_logging():
-    """로깅 설정"""
-    # 로그 디렉토리 생성
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 로그 파일명 (타임스탬프 포함)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = f"{log_dir}/pokemon_collection_{timestamp}.log"
-    
-    # 로깅 포맷 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # 루트 로거 설정
-    logger = logging.getLogger('pokemon_collector')
-    logger.setLevel(logging.DEBUG)
-    
-    # 콘솔 핸들러 (INFO 레벨 이상)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    
-    # 파일 핸들러 (DEBUG 레벨 이상)
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    
-    # 핸들러 추가
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    
-    logger.info(f"로깅 시작 - 로그 파일: {log_filename}")
+    """로깅 설정
+
+    여러 번 호출해도 핸들러는 한 번만 설치한다 (두 수집기를 한 프로세스에서 실행해도
+    로그가 중복되지 않음). 로거에는 큐 핸들러만 달고, 콘솔/파일 출력과 메시지 포맷은
+    백그라운드 리스너 스레드에서 처리한다. 프로세스 종료 시 남은 로그를 모두 기록한다.
+    """
+    global _listener, _log_filename
+    logger = logging.getLogger(LOGGER_NAME)
+    with _setup_lock:
+        if _listener is not None:
+            return logger
+
+        # 로그 디렉토리 생성
+        log_dir = "logs"
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+
+        # 로그 파일명 (타임스탬프 포함)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        _log_filename = f"{log_dir}/pokemon_collection_{timestamp}.log"
+
+        # 로깅 포맷 설정
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
+        # 루트 로거 설정
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        # 콘솔 핸들러 (INFO 레벨 이상)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+
+        # 파일 핸들러 (DEBUG 레벨 이상)
+        file_handler = logging.FileHandler(_log_filename, encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+
+        # 큐 핸들러 추가 (반복되는 파싱 오류 등은 SampledFilter로 제한)
+        log_queue = queue.SimpleQueue()
+        queue_handler = _DeferredQueueHandler(log_queue)
+        queue_handler.addFilter(SampledFilter())
+        logger.handlers = [queue_handler]
+
+        _listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_stop_listener)
+
+    logger.info("로깅 시작 - 로그 파일: %s", _log_filename)
     return logger
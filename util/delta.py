@@ -0,0 +1,222 @@
+import csv
+import hashlib
+import importlib
+import json
+import os
+import threading
+
+CHANGE_OPS = ("added", "removed", "modified")
+
+
+def page_hash(html, salt=""):
+    """페이지 본문(+ 파싱 옵션 salt) → 내용 해시 (16바이트 hex)"""
+    digest = hashlib.blake2b(salt.encode("utf-8"), digest_size=16)
+    digest.update(html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def parser_version(*module_names):
+    """추출기 모듈들의 소스 내용 → 버전 해시 (page_hash 의 salt 로 사용)
+
+    추출기 코드가 바뀌면 값이 달라지므로, 변경 감지 저장소에 남은 예전 추출 결과를
+    페이지가 그대로여도 재사용하지 않는다 (다시 파싱할 뿐 다시 요청하지는 않는다).
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for name in module_names:
+        with open(importlib.import_module(name).__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class PageHashStore:
+    """URL별 (페이지 해시, 추출 결과) 저장소, 실행이 바뀌어도 유지되는 변경 감지용
+
+    JSONL 파일에 {"url", "hash", "detail"} 를 추가 기록하고(같은 URL은 마지막 줄 우선),
+    close() 에서 최신 항목만 남기도록 다시 쓴다. 중단 시점에 잘린 마지막 줄은 무시한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path):
+            self._load()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._entries[record["url"]] = (record["hash"], record["detail"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    def __len__(self):
+        return len(self._entries)
+
+    def unchanged(self, url, digest):
+        """저장된 해시와 같고 추출 결과가 있으면 True"""
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry is not None and entry[0] == digest and bool(entry[1])
+
+    def detail(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry[1] if entry else None
+
+    def record(self, url, digest, detail):
+        line = json.dumps({"url": url, "hash": digest, "detail": detail}, ensure_ascii=False)
+        with self._lock:
+            self._entries[url] = (digest, detail)
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for url, (digest, detail) in self._entries.items():
+                    f.write(json.dumps({"url": url, "hash": digest, "detail": detail}, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _iter_tsv(f):
+    """열린 TSV(바이너리) → (행 시작 위치, 값 목록) yield (따옴표 안의 줄바꿈으로 여러 줄인 행 포함)"""
+    position = [f.tell()]
+
+    def lines():
+        while True:
+            line = f.readline()
+            if not line:
+                return
+            position[0] += len(line)
+            yield line.decode("utf-8")
+
+    start = position[0]
+    for values in csv.reader(lines(), delimiter="\t"):
+        yield start, values
+        start = position[0]
+
+
+def _read_tsv_row(f, header, offset):
+    f.seek(offset)
+    return dict(zip(header, next(_iter_tsv(f))[1]))
+
+
+def _row_hash(row, columns):
+    digest = hashlib.blake2b(digest_size=16)
+    for col in columns:
+        digest.update(row.get(col, "").encode("utf-8") + b"\0")
+    return digest.digest()
+
+
+def _keyed(rows, key_columns):
+    """(위치, 행) → (키 + 같은 키 안에서의 순번, 위치, 행)"""
+    counts = {}
+    for offset, row in rows:
+        key = tuple(row.get(col, "") for col in key_columns)
+        n = counts[key] = counts.get(key, -1) + 1
+        yield key + (n,), offset, row
+
+
+def diff_tsv(old_path, new_path, key_columns, columns=None):
+    """이전/새 TSV → 변경 목록 [{op, key, row | changes}] 을 하나씩 yield
+
+    key_columns 값이 같은 행끼리 비교한다. modified 의 changes 는 {열: [이전 값, 새 값]}.
+    키가 같은 행이 여럿이면(같은 번호·이름의 폼) 나온 순서대로 짝짓고, key 에 순번(dup)을 붙인다.
+    메모리에는 이전 파일의 {키: (파일 위치, 행 해시)} 만 두고, 새 파일을 한 행씩 읽으며 해시가 다른
+    행만 이전 파일에서 다시 읽어 비교한다. 출력 순서: 새 파일 순서의 added/modified, 그다음 removed.
+    """
+    def key_dict(key):
+        result = dict(zip(key_columns, key[:-1]))
+        if key[-1]:
+            result["dup"] = key[-1]
+        return result
+
+    with open(old_path, "rb") as old, open(new_path, "rb") as new:
+        old_rows = _iter_tsv(old)
+        old_header = next(old_rows, (0, []))[1]
+        new_rows = _iter_tsv(new)
+        new_header = next(new_rows, (0, []))[1]
+        fields = list(columns) if columns else sorted(set(old_header) | set(new_header))
+
+        index = {}
+        for key, offset, row in _keyed(((o, dict(zip(old_header, v))) for o, v in old_rows), key_columns):
+            index[key] = (offset, _row_hash(row, fields))
+
+        for key, _, row in _keyed(((o, dict(zip(new_header, v))) for o, v in new_rows), key_columns):
+            previous = index.pop(key, None)
+            if previous is None:
+                yield {"op": "added", "key": key_dict(key), "row": row}
+                continue
+            if previous[1] == _row_hash(row, fields):
+                continue
+            old_row = _read_tsv_row(old, old_header, previous[0])
+            diff = {col: [old_row.get(col, ""), row.get(col, "")] for col in fields
+                    if old_row.get(col, "") != row.get(col, "")}
+            yield {"op": "modified", "key": key_dict(key), "changes": diff}
+
+        for key, (offset, _) in index.items():
+            yield {"op": "removed", "key": key_dict(key), "row": _read_tsv_row(old, old_header, offset)}
+
+
+class ChangesetWriter:
+    """TeeWriter 에 끼워 쓰는 변경 목록 작성기
+
+    생성 시 이전 출력(previous_path TSV)을 previous_path + ".prev" 로 옮겨 두므로, 같은 파일에
+    새로 쓰는 RowWriter 보다 먼저 만들고, TeeWriter 에서는 그 RowWriter 보다 뒤에 두어 새 파일이
+    닫힌 다음 close() 되게 한다. 행은 메모리에 모으지 않고, close() 에서 두 파일을 diff_tsv 로
+    비교해 path(JSONL)에 변경 목록을 쓴 뒤 .prev 를 지운다.
+    이전 출력이 없으면(첫 실행) 변경 목록을 쓰지 않는다. 중단된 실행이 남긴 .prev 가 있으면
+    (그때의 previous_path 는 쓰다 만 파일이므로) .prev 를 이전 출력으로 쓴다.
+    """
+
+    def __init__(self, path, previous_path, key_columns, columns=None):
+        self.path = path
+        self.previous_path = previous_path
+        self.key_columns = list(key_columns)
+        self.columns = list(columns) if columns else None
+        self.counts = dict.fromkeys(CHANGE_OPS, 0)
+        self.count = 0
+
+        self._old_path = f"{previous_path}.prev" if previous_path else None
+        if self._old_path and not os.path.exists(self._old_path) and os.path.exists(previous_path):
+            os.replace(previous_path, self._old_path)
+        self.has_previous = self._old_path is not None and os.path.exists(self._old_path)
+
+    def write(self, row):
+        self.count += 1
+
+    def summary(self):
+        return dict(self.counts)
+
+    def close(self):
+        if not self.has_previous or not os.path.exists(self.previous_path):
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            for change in diff_tsv(self._old_path, self.previous_path, self.key_columns, self.columns):
+                self.counts[change["op"]] += 1
+                f.write(json.dumps(change, ensure_ascii=False) + "\n")
+        os.remove(self._old_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,181 @@
+import json
+import os
+import re
+import struct
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+
+# 설명 저장소 파일: 헤더 + 메타데이터(JSON) + 압축 블록들
+#   메타데이터: games(게임 이름 목록), blocks([오프셋, 길이]),
+#              texts(문장별 [블록, 시작, 끝]을 평탄화), index(pokemon_id → [game, text, ...])
+MAGIC = b"PDDX"
+VERSION = 1
+_HEADER = struct.Struct("<4sII")  # magic, version, 메타데이터 길이
+
+# 압축 전 블록 크기: 작은 문장을 하나씩 압축하면 효율이 낮으므로 여러 문장을 묶는다
+BLOCK_SIZE = 64 * 1024
+
+# 예전 수집 결과의 "(Red&Blue)문장, (Yellow)문장" 형태에서 게임 머리표 위치
+_ENTRY_HEAD = re.compile(r"(?:^|, )\(([^()]+)\)")
+
+
+def split_descriptions(text):
+    """예전 수집 결과(pokemon_basic.csv)의 descriptions 문자열 → [(게임, 문장)]
+
+    "Red&Blue" 처럼 여러 게임이 한 문장을 공유하면 게임마다 한 항목으로 나눈다.
+    문장 안의 ", (" 도 머리표로 보므로 새 수집 결과에는 쓰지 않는다
+    (pokemon_basic 은 [게임, 문장] 목록을 바로 넘긴다).
+    """
+    if not text:
+        return []
+    heads = list(_ENTRY_HEAD.finditer(text))
+    entries = []
+    for head, next_head in zip(heads, heads[1:] + [None]):
+        sentence = text[head.end():next_head.start() if next_head else len(text)].strip()
+        for game in head.group(1).split("&"):
+            if game.strip() and sentence:
+                entries.append((game.strip(), sentence))
+    return entries
+
+
+class DescriptionStoreWriter:
+    """(포켓몬, 게임, 문장) 모음 → 설명 저장소 파일
+
+    같은 문장은 게임/포켓몬이 달라도 한 번만 저장한다.
+    """
+
+    def __init__(self):
+        self._games = {}
+        self._texts = {}
+        self._entries = {}
+
+    def add(self, pokemon_id, game, sentence):
+        pokemon_id = int(pokemon_id)
+        game_idx = self._games.setdefault(game, len(self._games))
+        text_idx = self._texts.setdefault(sentence, len(self._texts))
+        games = self._entries.setdefault(pokemon_id, {})
+        games.setdefault(game_idx, text_idx)
+
+    def add_descriptions(self, pokemon_id, entries):
+        """[(게임, 문장)] 목록 추가 (이미 기록된 포켓몬은 건너뜀, 폼 중복 방지)"""
+        if not entries or int(pokemon_id) in self._entries:
+            return
+        for game, sentence in entries:
+            self.add(pokemon_id, game, sentence)
+
+    def __len__(self):
+        return sum(len(games) for games in self._entries.values())
+
+    @property
+    def unique_count(self):
+        return len(self._texts)
+
+    def save(self, path, level=9):
+        blocks, texts = [], []
+        chunk, chunk_size = [], 0
+        for sentence in self._texts:
+            encoded = sentence.encode("utf-8")
+            texts.extend((len(blocks), chunk_size, chunk_size + len(encoded)))
+            chunk.append(encoded)
+            chunk_size += len(encoded)
+            if chunk_size >= BLOCK_SIZE:
+                blocks.append(zlib.compress(b"".join(chunk), level))
+                chunk, chunk_size = [], 0
+        if chunk:
+            blocks.append(zlib.compress(b"".join(chunk), level))
+
+        block_table, offset = [], 0
+        for block in blocks:
+            block_table.append([offset, len(block)])
+            offset += len(block)
+        meta = json.dumps({
+            "games": list(self._games),
+            "blocks": block_table,
+            "texts": texts,
+            "index": {str(pid): [v for item in sorted(games.items()) for v in item]
+                      for pid, games in sorted(self._entries.items())},
+        }, separators=(",", ":")).encode("utf-8")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(meta)))
+            f.write(meta)
+            for block in blocks:
+                f.write(block)
+        os.replace(tmp_path, path)
+
+
+class DescriptionStore:
+    """설명 저장소 읽기 (인덱스만 먼저 읽고, 문장 블록은 요청 시 읽어 압축 해제)
+
+    cache_blocks: 압축 해제해 둘 블록 수 (LRU)
+    """
+
+    def __init__(self, path, cache_blocks=4):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, meta_len = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"설명 저장소 형식이 아닙니다: {path}")
+            meta = json.loads(f.read(meta_len).decode("utf-8"))
+        self._data_offset = _HEADER.size + meta_len
+        self.games = meta["games"]
+        self._game_index = {game: i for i, game in enumerate(self.games)}
+        self._blocks = meta["blocks"]
+        self._texts = array("I", meta["texts"])
+        self._index = {int(pid): array("I", entries) for pid, entries in meta["index"].items()}
+        self._cache = OrderedDict()
+        self._cache_blocks = cache_blocks
+        self._lock = threading.Lock()
+
+    def _block(self, block_idx):
+        with self._lock:
+            data = self._cache.get(block_idx)
+            if data is not None:
+                self._cache.move_to_end(block_idx)
+                return data
+            offset, length = self._blocks[block_idx]
+            with open(self.path, "rb") as f:
+                f.seek(self._data_offset + offset)
+                data = zlib.decompress(f.read(length))
+            self._cache[block_idx] = data
+            if len(self._cache) > self._cache_blocks:
+                self._cache.popitem(last=False)
+            return data
+
+    def _text(self, text_idx):
+        block_idx, start, end = self._texts[text_idx * 3:text_idx * 3 + 3]
+        return self._block(block_idx)[start:end].decode("utf-8")
+
+    def pokemon_ids(self):
+        return sorted(self._index)
+
+    def games_of(self, pokemon_id):
+        entries = self._index.get(int(pokemon_id), ())
+        return [self.games[game_idx] for game_idx in entries[::2]]
+
+    def get(self, pokemon_id, game=None):
+        """포켓몬의 설명: game 을 주면 그 게임의 문장(없으면 None), 아니면 {게임: 문장}"""
+        entries = self._index.get(int(pokemon_id), ())
+        if game is None:
+            return {self.games[g]: self._text(t) for g, t in zip(entries[::2], entries[1::2])}
+        game_idx = self._game_index.get(game)
+        for g, t in zip(entries[::2], entries[1::2]):
+            if g == game_idx:
+                return self._text(t)
+        return None
+
+    def __contains__(self, pokemon_id):
+        return int(pokemon_id) in self._index
+
+    def __len__(self):
+        return sum(len(entries) // 2 for entries in self._index.values())
+
+
+def open_descriptions(path="data/raw/pokemon_descriptions.bin", cache_blocks=4):
+    return DescriptionStore(path, cache_blocks=cache_blocks)
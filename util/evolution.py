@@ -0,0 +1,129 @@
+import threading
+
+# 진화 간선 테이블 열
+EVOLUTION_COLUMNS = ["from_id", "from_name", "from_form", "to_id", "to_name", "to_form", "condition"]
+
+
+def _classes(el):
+    return el.get("class", ()) if getattr(el, "name", None) else ()
+
+
+def _card_node(card):
+    """infocard → (도감 번호, 이름(URL 마지막 부분), 폼 이름 또는 None)"""
+    name_link = card.select_one("a.ent-name")
+    id_small = card.select_one("small")
+    form_small = card.select_one("small.text-muted")
+    pokemon_id = id_small.text.strip().replace("#", "") if id_small else None
+    name = name_link["href"].rstrip("/").split("/")[-1] if name_link else None
+    form = form_small.text.strip() if form_small else None
+    return pokemon_id, name, form
+
+
+def _arrow_condition(arrow):
+    small = arrow.select_one("small")
+    if not small:
+        return None
+    # 괄호 제거: "(Level 16)" -> "Level 16"
+    return small.text.strip().strip("()")
+
+
+def _walk_chain(container, prev, edges):
+    """infocard-list-evo 하나를 순서대로 읽어 간선 추가
+
+    카드 → 화살표 → 카드 는 직선 진화, infocard-evo-split 안의 각
+    infocard-list-evo 는 직전 카드에서 갈라지는 가지다 (이브이, 피카츄 → 라이츄/알로라 라이츄).
+    """
+    condition = None
+    for el in container.children:
+        classes = _classes(el)
+        if "infocard-arrow" in classes:
+            condition = _arrow_condition(el)
+        elif "infocard" in classes:
+            node = _card_node(el)
+            if prev is not None:
+                edges.append(dict(zip(EVOLUTION_COLUMNS, (*prev, *node, condition))))
+            prev, condition = node, None
+        elif "infocard-evo-split" in classes:
+            for branch in el.find_all("div", class_="infocard-list-evo", recursive=False):
+                _walk_chain(branch, prev, edges)
+
+
+def parse_evolution_chart(containers):
+    """진화 차트(infocard-list-evo 목록) → 간선 목록 [{from_id, ..., condition}]
+
+    같은 페이지에 차트가 여러 개(지역 폼별 진화)면 모두 읽는다.
+    """
+    edges = []
+    for container in containers:
+        _walk_chain(container, None, edges)
+    return edges
+
+
+def evolution_containers(section):
+    """Evolution chart 섹션의 최상위 infocard-list-evo 목록 (다음 h2 전까지)"""
+    containers = []
+    for el in section.heading.next_siblings:
+        if getattr(el, "name", None) == "h2":
+            break
+        if "infocard-list-evo" in _classes(el):
+            containers.append(el)
+    if not containers and section.div("infocard-list-evo") is not None:
+        containers.append(section.div("infocard-list-evo"))
+    return containers
+
+
+class EvolutionFamily:
+    """한 진화 계열의 간선 목록"""
+
+    __slots__ = ("edges", "members")
+
+    def __init__(self, edges):
+        self.edges = edges
+        self.members = {edge["from_name"] for edge in edges} | {edge["to_name"] for edge in edges}
+
+    def edge_to(self, name):
+        """name으로 진화하는 간선 (폼 간선이 여럿이면 기본 폼 우선, 없으면 None)"""
+        candidates = [edge for edge in self.edges if edge["to_name"] == name]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda edge: edge["to_form"] is not None)
+
+
+class EvolutionCache:
+    """포켓몬 이름 → 진화 계열 캐시 (계열당 차트를 한 번만 파싱, 스레드 안전)"""
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            return self._families.get(name)
+
+    def add(self, family, name=None):
+        """family 를 모든 구성원 이름으로 등록 (진화하지 않는 포켓몬은 name으로)"""
+        with self._lock:
+            for member in family.members | ({name} if name else set()):
+                self._families[member] = family
+
+    def clear(self):
+        with self._lock:
+            self._families.clear()
+
+
+class EvolutionEdges:
+    """수집 중 나온 간선을 중복 없이 모으는 테이블"""
+
+    def __init__(self):
+        self.edges = []
+        self._seen = set()
+
+    def add_all(self, edges):
+        for edge in edges or ():
+            key = tuple(edge.get(col) for col in EVOLUTION_COLUMNS)
+            if key not in self._seen:
+                self._seen.add(key)
+                self.edges.append(edge)
+
+    def __len__(self):
+        return len(self.edges)
@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from util import metrics
+from util.cache import CacheMiss, HttpCache
+from util.ratelimit import RateLimiter, parse_retry_after
+
+try:
+    import brotli  # noqa: F401  (requests가 br 응답을 풀 수 있을 때만 협상)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "porodeck-collector/0.1",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# 재시도 대상 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 재시도 대상 예외 (연결 실패/타임아웃, 본문 도중 연결이 끊긴 응답)
+RETRY_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+
+class Fetcher:
+    """커넥션 풀(keep-alive)을 재사용하는 공용 HTTP 수집기
+
+    timeout: (연결, 읽기) 타임아웃(초)
+    retries: 연결 오류/타임아웃/잘린 응답/RETRY_STATUS 응답 시 재시도 횟수
+    backoff: 지수 백오프 기본 대기(초), 실제 대기는 [0, backoff * 2^n] 구간의 무작위 값
+    pool_size: 호스트당 유지할 커넥션 수 (동시 작업 수 이상으로 설정)
+    cache: HttpCache 인스턴스 (없으면 항상 네트워크 요청)
+    rate_limiter: RateLimiter 인스턴스, 실제 네트워크 요청 직전에만 대기 (캐시 응답은 대기 없음)
+    archive: PageArchiveWriter 인스턴스, fetch() 로 얻은 본문을 (캐시 응답 포함) 모두 보관소에 기록
+    """
+
+    def __init__(self, timeout=(5, 30), retries=3, backoff=0.5, max_backoff=30.0,
+                 pool_size=10, headers=None, cache=None, rate_limiter=None, archive=None, logger=None):
+        self.timeout = timeout
+        self.cache = cache
+        self.archive = archive
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.logger = logger
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+    def _sleep_backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            # Retry-After는 그대로 따름 (rate_limiter가 있으면 다음 acquire에서 대기)
+            delay = retry_after
+            if self.rate_limiter is None:
+                time.sleep(delay)
+            return delay
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        time.sleep(delay)
+        return delay
+
+    def get(self, url, **kwargs):
+        """재시도를 포함한 GET 요청, 최종 실패 시 예외 발생"""
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter is not None:
+                metrics.observe("ratelimit.wait", self.rate_limiter.acquire(url))
+            if attempt > 0:
+                metrics.inc("fetch.retries")
+            metrics.inc("fetch.requests")
+            start = time.perf_counter()
+            try:
+                res = self.session.get(url, **kwargs)
+            except RETRY_ERRORS as e:
+                metrics.inc("fetch.errors")
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_error(url)
+                if attempt >= self.retries:
+                    raise
+                delay = self._sleep_backoff(attempt)
+                if self.logger:
+                    self.logger.debug("요청 재시도 %s/%s (%s): %s - %.2f초 대기", attempt + 1, self.retries, url, e, delay)
+                continue
+
+            self._record_response(res, time.perf_counter() - start)
+            retry_after = res.headers.get("Retry-After")
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_response(url, res.status_code, retry_after)
+
+            if res.status_code in RETRY_STATUS and attempt < self.retries:
+                delay = self._sleep_backoff(attempt, parse_retry_after(retry_after))
+                if self.logger:
+                    self.logger.debug("요청 재시도 %s/%s (%s): HTTP %s - %.2f초 대기", attempt + 1, self.retries, url, res.status_code, delay)
+                continue
+
+            res.raise_for_status()
+            return res
+
+    @staticmethod
+    def _record_response(res, total):
+        """응답 시간/크기 계측
+
+        requests는 DNS 조회와 연결 시간을 따로 알려주지 않으므로 res.elapsed(요청 전송 ~
+        응답 헤더 수신, 연결 시간 포함)를 TTFB로, 나머지를 본문 다운로드 시간으로 기록한다.
+        """
+        ttfb = res.elapsed.total_seconds()
+        metrics.observe("fetch.ttfb", ttfb)
+        metrics.observe("fetch.download", max(0.0, total - ttfb))
+        metrics.observe("fetch.total", total)
+        metrics.inc(f"fetch.status_{res.status_code}")
+        metrics.inc("fetch.bytes_body", len(res.content))
+        # 압축된 상태로 실제 전송된 바이트 (urllib3가 알려주는 경우)
+        wire_bytes = getattr(res.raw, "tell", lambda: None)()
+        if wire_bytes:
+            metrics.inc("fetch.bytes_wire", wire_bytes)
+
+    def fetch(self, url):
+        """페이지 본문(text) 반환, 캐시가 있으면 캐시를 먼저 확인"""
+        body = self._fetch_body(url)
+        if self.archive is not None:
+            self.archive.add(url, body)
+        return body
+
+    def _fetch_body(self, url):
+        if self.cache is None:
+            return self.get(url).text
+
+        entry = self.cache.lookup(url)
+        if entry is not None and (self.cache.offline or self.cache.is_fresh(entry)):
+            metrics.inc("cache.hit")
+            return entry.body
+        if self.cache.offline:
+            metrics.inc("cache.miss")
+            raise CacheMiss(url)
+
+        headers = self.cache.validators(entry) if entry is not None else {}
+        res = self.get(url, headers=headers)
+        if res.status_code == 304 and entry is not None:
+            metrics.inc("cache.revalidated")
+            self.cache.refresh(entry)
+            return entry.body
+        metrics.inc("cache.miss")
+
+        body = res.text
+        self.cache.put(url, body, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+        return body
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+def get_default_fetcher():
+    """fetcher 인자를 넘기지 않은 호출이 공유하는 기본 Fetcher"""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher(cache=HttpCache(), rate_limiter=RateLimiter())
+        return _default_fetcher
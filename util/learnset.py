@@ -0,0 +1,183 @@
+import bisect
+import csv
+import os
+import struct
+import sys
+from array import array
+
+# 바이너리 인덱스 파일: 헤더 뒤에 포켓몬→기술, 기술→포켓몬 순서로 CSR 블록 2개
+MAGIC = b"PLSI"
+VERSION = 1
+_HEADER = struct.Struct("<4sI")
+_BLOCK = struct.Struct("<II")  # offsets 길이, values 길이
+
+PAIR_COLUMNS = ["pokemon_id", "move_id"]
+
+
+def _to_int(value):
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+def pairs_from_move_table(rows):
+    """move_basic 행(id, learnable) → (pokemon_id, move_id) 쌍
+
+    learnable 은 "0001,0004,..." 형태의 콤마 문자열이며, ID가 없는 기술은 건너뛴다.
+    """
+    pairs = set()
+    for row in rows:
+        move_id = _to_int(row.get("id"))
+        if move_id is None or not row.get("learnable"):
+            continue
+        for pokemon_id in row["learnable"].split(","):
+            pokemon_id = _to_int(pokemon_id)
+            if pokemon_id is not None:
+                pairs.add((pokemon_id, move_id))
+    return sorted(pairs)
+
+
+def pairs_from_learnset_table(rows, move_ids):
+    """learnset_basic 행(pokemon_id, move_name) + {기술 이름: ID} → (pokemon_id, move_id) 쌍"""
+    pairs = set()
+    for row in rows:
+        pokemon_id = _to_int(row.get("pokemon_id"))
+        move_id = move_ids.get(row.get("move_name"))
+        if pokemon_id is not None and move_id is not None:
+            pairs.add((pokemon_id, move_id))
+    return sorted(pairs)
+
+
+class CsrIndex:
+    """정수 키 → 정렬된 정수 값 목록 (CSR: offsets + values)
+
+    키가 도감 번호/기술 ID처럼 작은 정수이므로 offsets 를 키로 바로 인덱싱한다.
+    values[offsets[k]:offsets[k + 1]] 가 키 k의 값 목록 (O(1) 조회).
+    """
+
+    __slots__ = ("offsets", "values")
+
+    def __init__(self, offsets, values):
+        self.offsets = offsets
+        self.values = values
+
+    @classmethod
+    def build(cls, pairs):
+        """(키, 값) 쌍 → CsrIndex (키별 값은 정렬, 중복 제거)"""
+        pairs = sorted(set(pairs))
+        max_key = pairs[-1][0] if pairs else -1
+        counts = [0] * (max_key + 2)
+        for key, _ in pairs:
+            counts[key + 1] += 1
+        offsets = array("I", counts)
+        for i in range(1, len(offsets)):
+            offsets[i] += offsets[i - 1]
+        values = array("H", (value for _, value in pairs))
+        return cls(offsets, values)
+
+    def get(self, key):
+        """키의 값 목록 (memoryview, 없으면 빈 목록)"""
+        if key < 0 or key + 1 >= len(self.offsets):
+            return memoryview(self.values)[0:0]
+        return memoryview(self.values)[self.offsets[key]:self.offsets[key + 1]]
+
+    def contains(self, key, value):
+        values = self.get(key)
+        i = bisect.bisect_left(values, value)
+        return i < len(values) and values[i] == value
+
+    def keys(self):
+        return [k for k in range(len(self.offsets) - 1) if self.offsets[k + 1] > self.offsets[k]]
+
+    def __len__(self):
+        return len(self.values)
+
+
+def _write_block(f, index):
+    offsets, values = index.offsets, index.values
+    if sys.byteorder != "little":
+        offsets, values = array("I", offsets), array("H", values)
+        offsets.byteswap()
+        values.byteswap()
+    f.write(_BLOCK.pack(len(offsets), len(values)))
+    f.write(offsets.tobytes())
+    f.write(values.tobytes())
+
+
+def _read_block(f):
+    n_offsets, n_values = _BLOCK.unpack(f.read(_BLOCK.size))
+    offsets, values = array("I"), array("H")
+    offsets.frombytes(f.read(n_offsets * offsets.itemsize))
+    values.frombytes(f.read(n_values * values.itemsize))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        values.byteswap()
+    return CsrIndex(offsets, values)
+
+
+class LearnsetIndex:
+    """포켓몬 ↔ 기술 양방향 조회 인덱스
+
+    moves_of(pokemon_id) / pokemon_of(move_id) 는 O(1)로 정렬된 ID 목록을 돌려주고,
+    can_learn 은 그 목록에서 이진 탐색한다.
+    """
+
+    def __init__(self, by_pokemon, by_move):
+        self.by_pokemon = by_pokemon
+        self.by_move = by_move
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        pairs = list(pairs)
+        return cls(CsrIndex.build(pairs), CsrIndex.build((m, p) for p, m in pairs))
+
+    def moves_of(self, pokemon_id):
+        return self.by_pokemon.get(int(pokemon_id))
+
+    def pokemon_of(self, move_id):
+        return self.by_move.get(int(move_id))
+
+    def can_learn(self, pokemon_id, move_id):
+        return self.by_pokemon.contains(int(pokemon_id), int(move_id))
+
+    def pairs(self):
+        for pokemon_id in self.by_pokemon.keys():
+            for move_id in self.by_pokemon.get(pokemon_id):
+                yield pokemon_id, move_id
+
+    def __len__(self):
+        return len(self.by_pokemon)
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION))
+            _write_block(f, self.by_pokemon)
+            _write_block(f, self.by_move)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, version = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"learnset 인덱스 형식이 아닙니다: {path}")
+            return cls(_read_block(f), _read_block(f))
+
+
+def write_pairs(path, pairs):
+    """조인 테이블(pokemon_id, move_id) TSV 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+        writer.writerow(PAIR_COLUMNS)
+        writer.writerows(pairs)
+
+
+def load_learnset_index(path="data/raw/learnset_index.bin"):
+    """덱 빌더용 로더: 저장된 양방향 인덱스 읽기"""
+    return LearnsetIndex.load(path)
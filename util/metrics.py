@@ -0,0 +1,243 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 시간 히스토그램 구간 상한(초)
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """고정 구간 히스토그램 (count/sum/min/max + 구간별 개수)"""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, buckets=TIME_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸: +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q):
+        """구간 상한 기준 근사 분위수"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+    def to_state(self):
+        return [self.buckets, self.counts, self.count, self.sum, self.min, self.max]
+
+    @classmethod
+    def from_state(cls, state):
+        hist = cls(state[0])
+        hist.counts, hist.count, hist.sum, hist.min, hist.max = list(state[1]), *state[2:]
+        return hist
+
+
+class Metrics:
+    """수집 실행 단위 계측값 (카운터 + 시간 히스토그램, 스레드 안전)
+
+    이름은 "단계.항목" 형식 (예: fetch.ttfb, parse.vitals, cache.hit)
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self):
+        """다른 프로세스로 넘길 수 있는 상태 (merge_snapshot 으로 합침)"""
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {name: hist.to_state() for name, hist in self.histograms.items()},
+            }
+
+    def merge_snapshot(self, snapshot):
+        with self._lock:
+            for name, value in snapshot["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for name, state in snapshot["histograms"].items():
+                other = Histogram.from_state(state)
+                if name in self.histograms:
+                    self.histograms[name].merge(other)
+                else:
+                    self.histograms[name] = other
+
+    def ratio(self, numerator, *others):
+        """numerator / (numerator + others) 카운터 비율 (분모가 0이면 None)"""
+        num = self.counters.get(numerator, 0)
+        total = num + sum(self.counters.get(name, 0) for name in others)
+        return num / total if total else None
+
+    def summary(self):
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "elapsed_sec": round(time.time() - self.started_at, 3),
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {name: hist.summary() for name, hist in sorted(self.histograms.items())},
+            }
+
+    def write_json(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def write_prometheus(self, path, prefix="porodeck", labels=None):
+        """Prometheus node_exporter textfile 형식으로 기록 (임시 파일 → 교체)
+
+        카운터는 <prefix>_<이름>_total, 히스토그램은 <prefix>_<이름>_seconds 로 내보낸다.
+        """
+        label_text = ",".join(f'{k}="{v}"' for k, v in sorted((labels or {}).items()))
+
+        def labelled(extra=""):
+            parts = [p for p in (label_text, extra) if p]
+            return "{" + ",".join(parts) + "}" if parts else ""
+
+        def metric_name(name):
+            return f"{prefix}_{name}".replace(".", "_").replace("-", "_")
+
+        lines = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                full = metric_name(name) + "_total"
+                lines += [f"# TYPE {full} counter", f"{full}{labelled()} {value}"]
+            for name, hist in sorted(self.histograms.items()):
+                full = metric_name(name) + "_seconds"
+                lines.append(f"# TYPE {full} histogram")
+                cumulative = 0
+                for bound, n in zip(hist.buckets + (float("inf"),), hist.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    le_label = f'le="{le}"'
+                    lines.append(f"{full}_bucket{labelled(le_label)} {cumulative}")
+                lines.append(f"{full}_sum{labelled()} {hist.sum}")
+                lines.append(f"{full}_count{labelled()} {hist.count}")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+
+# 프로세스 전역 계측 (수집기/파서가 기록하고, 실행 시작 시 reset_metrics 로 새로 시작)
+_metrics = Metrics()
+
+
+def get_metrics():
+    return _metrics
+
+
+def reset_metrics():
+    """새 실행용 계측 객체로 교체 후 반환"""
+    global _metrics
+    _metrics = Metrics()
+    return _metrics
+
+
+def inc(name, value=1):
+    _metrics.inc(name, value)
+
+
+def observe(name, value):
+    _metrics.observe(name, value)
+
+
+def timed(name):
+    return _metrics.timed(name)
+
+
+def run_with_metrics(func, *args):
+    """다른 프로세스에서 func 실행 후 (결과, 계측 스냅숏) 반환
+
+    그 프로세스에서 기록된 값만 담기도록 새 계측 객체로 교체한 뒤 실행한다.
+    """
+    metrics = reset_metrics()
+    result = func(*args)
+    return result, metrics.snapshot()
+
+
+def export_run_metrics(metrics, json_path=None, prometheus_path=None, labels=None, logger=None):
+    """실행 종료 시 계측 요약을 JSON(과 Prometheus textfile)로 저장하고 주요 값을 로그로 남김"""
+    if json_path:
+        metrics.write_json(json_path)
+    if prometheus_path:
+        metrics.write_prometheus(prometheus_path, labels=labels)
+    if logger:
+        hit_ratio = metrics.ratio("cache.hit", "cache.miss", "cache.revalidated")
+        ttfb = metrics.histograms.get("fetch.ttfb")
+        page = metrics.histograms.get("parse.page")
+        wait = metrics.histograms.get("ratelimit.wait")
+        logger.info(
+            "계측 요약: 요청 %s회 (재시도 %s회), 캐시 적중률 %s, TTFB p50 %s초, 페이지 파싱 p50 %s초, 요청 제한 대기 합계 %.1f초",
+            metrics.counters.get("fetch.requests", 0),
+            metrics.counters.get("fetch.retries", 0),
+            f"{hit_ratio:.1%}" if hit_ratio is not None else "-",
+            ttfb.quantile(0.5) if ttfb else "-",
+            page.quantile(0.5) if page else "-",
+            wait.sum if wait else 0.0,
+        )
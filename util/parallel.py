@@ -0,0 +1,33 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _call(func, item):
+    try:
+        return func(item), None
+    except Exception as e:
+        return None, e
+
+
+def ordered_map(func, items, workers=1):
+    """items 순서대로 (item, 결과, 예외) 반환
+
+    workers > 1 이면 스레드 풀에서 실행하되, 동시에 처리 중인 작업 수를
+    workers * 2 개로 제한하고 결과는 입력 순서 그대로 내보낸다.
+    """
+    if workers <= 1:
+        for item in items:
+            result, error = _call(func, item)
+            yield item, result, error
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append((item, executor.submit(_call, func, item)))
+            if len(pending) >= workers * 2:
+                done_item, future = pending.popleft()
+                yield (done_item, *future.result())
+        while pending:
+            done_item, future = pending.popleft()
+            yield (done_item, *future.result())
@@ -0,0 +1,189 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+# html.parser: 순수 파이썬 (기본값), lxml: C 기반 트리 빌더,
+# selectolax: C 기반 셀렉터 엔진으로 필요한 조각만 잘라낸 뒤 BeautifulSoup으로 파싱
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+
+def available_backends():
+    """현재 환경에서 사용할 수 있는 파서 백엔드 목록"""
+    backends = ["html.parser"]
+    if HAS_LXML:
+        backends.append("lxml")
+    if SelectolaxParser is not None:
+        backends.append("selectolax")
+    return backends
+
+
+def resolve_backend(backend):
+    """"auto"는 설치된 가장 빠른 백엔드로, 미설치 백엔드는 ValueError"""
+    if backend == "auto":
+        return available_backends()[-1]
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {backend} (가능: {', '.join(PARSER_BACKENDS)})")
+    if backend not in available_backends():
+        raise ValueError(f"파서 백엔드 {backend} 를 사용하려면 패키지를 설치해야 합니다")
+    return backend
+
+
+class PartialSpec:
+    """부분 파싱 대상 요소
+
+    tags 중 class 속성이 없거나 classes 중 하나를 가진 요소(와 그 하위 트리)만
+    트리에 만든다. 선택된 요소들의 문서 순서는 유지된다.
+    classless=False 이면 class 속성이 없는 요소는 고르지 않는다.
+    """
+
+    def __init__(self, tags, classes, classless=True):
+        self.tags = tuple(tags)
+        self.classes = frozenset(classes)
+        self.classless = classless
+
+    def _class_matches(self, value):
+        if value is None:
+            return self.classless
+        # bs4 버전에 따라 "a b" 문자열 또는 개별 클래스가 전달됨
+        parts = value.split() if isinstance(value, str) else value
+        return any(part in self.classes for part in parts)
+
+    def strainer(self):
+        return SoupStrainer(list(self.tags), class_=self._class_matches)
+
+    def css(self):
+        selectors = [f"{tag}:not([class])" for tag in self.tags] if self.classless else []
+        selectors += [f"{tag}.{cls}" for tag in self.tags for cls in sorted(self.classes)]
+        return ", ".join(selectors)
+
+
+# 포켓몬 상세 페이지에서 실제로 읽는 요소: 섹션 제목, vitals 테이블(기본/Training/
+# Base stats/도감 설명/Other languages), 진화 차트
+POKEMON_DETAIL_PARTS = PartialSpec(("h2", "table", "div"), ("vitals-table", "infocard-list-evo"))
+
+# 포켓몬 상세 페이지의 "Moves learned by ..." 게임별 탭 묶음 (배울 수 있는 기술 표)
+LEARNSET_PARTS = PartialSpec(("div",), ("tabset-moves-game",), classless=False)
+
+
+def _selectolax_fragments(html, spec):
+    """selectolax로 spec에 맞는 최상위 요소만 골라 HTML 조각으로 이어 붙임"""
+    tree = SelectolaxParser(html)
+    selected = set()
+    fragments = []
+    for node in tree.css(spec.css()):
+        parent = node.parent
+        nested = False
+        while parent is not None:
+            if parent.mem_id in selected:
+                nested = True
+                break
+            parent = parent.parent
+        selected.add(node.mem_id)
+        if not nested:
+            fragments.append(node.html)
+    return "".join(fragments)
+
+
+def make_soup(html, backend="html.parser", partial=None):
+    """백엔드 선택 + (선택적) 부분 파싱으로 BeautifulSoup 생성
+
+    partial: PartialSpec, 주면 해당 요소만 트리로 만든다.
+    """
+    backend = resolve_backend(backend)
+    if backend == "selectolax":
+        tree_builder = "lxml" if HAS_LXML else "html.parser"
+        if partial is None:
+            return BeautifulSoup(html, tree_builder)
+        return BeautifulSoup(_selectolax_fragments(html, partial), tree_builder)
+    if partial is None:
+        return BeautifulSoup(html, backend)
+    return BeautifulSoup(html, backend, parse_only=partial.strainer())
+
+
+class Section:
+    """h2 제목 하나와 그 뒤에 처음 나오는 table / 관심 div"""
+
+    __slots__ = ("title", "heading", "table", "divs")
+
+    def __init__(self, title, heading):
+        self.title = title
+        self.heading = heading
+        self.table = None
+        self.divs = {}
+
+    def div(self, key):
+        return self.divs.get(key)
+
+
+class SectionIndex:
+    """문서를 한 번만 순회해 h2 제목 → 섹션(table, div) 색인 생성
+
+    section.table 은 h2.find_next("table"), section.div(cls) 는
+    h2.find_next("div", class_=cls) 와 같은 요소를 가리킨다.
+    div_classes: 색인할 div 클래스 목록, 항목이 튜플이면 그중 하나를 가진 div
+                 (예: "infocard-list-evo", ("infocard-list", "infocard-list-pkmn-md"))
+    """
+
+    def __init__(self, soup, div_classes=()):
+        self.sections = []
+        self.tables = []
+        # 키가 튜플이면 그중 하나라도 가진 div (find_next의 class_=[...] 와 동일)
+        div_keys = [(key, (key,) if isinstance(key, str) else tuple(key)) for key in div_classes]
+
+        def div_matches(tag):
+            classes = tag.get("class", ())
+            return [key for key, names in div_keys if any(c in classes for c in names)]
+
+        def wanted(tag):
+            if tag.name in ("h2", "table"):
+                return True
+            return tag.name == "div" and bool(div_keys) and bool(div_matches(tag))
+
+        waiting_table = []
+        waiting_div = {key: [] for key, _ in div_keys}
+        for el in soup.find_all(wanted):
+            if el.name == "h2":
+                section = Section(el.get_text(), el)
+                self.sections.append(section)
+                waiting_table.append(section)
+                for waiting in waiting_div.values():
+                    waiting.append(section)
+            elif el.name == "table":
+                self.tables.append(el)
+                for section in waiting_table:
+                    section.table = el
+                waiting_table = []
+            else:
+                for key in div_matches(el):
+                    for section in waiting_div[key]:
+                        section.divs[key] = el
+                    waiting_div[key] = []
+
+    def find(self, title_part):
+        """제목에 title_part가 포함된 첫 섹션 (없으면 None)"""
+        for section in self.sections:
+            if title_part in section.title:
+                return section
+        return None
+
+    def find_all(self, title_part):
+        return [s for s in self.sections if title_part in s.title]
+
+    def table_with_class(self, class_name):
+        """class_name 클래스를 가진 첫 table (없으면 None)"""
+        for table in self.tables:
+            if class_name in table.get("class", ()):
+                return table
+        return None
+
+    def tables_with_class(self, class_name):
+        return [t for t in self.tables if class_name in t.get("class", ())]
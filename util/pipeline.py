@@ -0,0 +1,114 @@
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from util.metrics import get_metrics, run_with_metrics, timed
+from util.parallel import ordered_map
+
+_DONE = object()
+
+
+class _Resolved:
+    """프로세스 풀을 거치지 않은 결과 (Future와 같은 result() 인터페이스)"""
+
+    __slots__ = ("value", "error")
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _parse_timed(parse, item, html):
+    with timed("parse.page"):
+        return parse(item, html)
+
+
+def _call_parse(parse, item, html):
+    try:
+        return _Resolved(_parse_timed(parse, item, html))
+    except Exception as e:
+        return _Resolved(error=e)
+
+
+def pipeline_map(fetch, parse, items, fetch_workers=4, parse_workers=None, queue_size=None):
+    """수집(스레드) → 파싱(프로세스) 2단계 파이프라인, items 순서대로 (item, 결과, 예외) 반환
+
+    fetch(item) → html: fetch_workers 개 스레드에서 실행 (I/O), None을 반환하면 파싱을 건너뛰고 결과도 None
+    parse(item, html) → 결과: parse_workers 개 프로세스에서 실행 (CPU)
+        프로세스로 넘기므로 모듈 최상위 함수(또는 그 functools.partial)여야 한다.
+        parse_workers=0 이면 호출한 스레드에서 바로 파싱 (프로세스 풀 없음),
+        None이면 CPU 코어 수만큼 프로세스를 띄운다.
+        파싱 프로세스에서 기록한 계측값(util.metrics)은 결과와 함께 돌려받아 합친다.
+    queue_size: 파싱을 기다리는 html 최대 개수, 가득 차면 수집 스레드가 대기 (기본: 파싱 작업 수 × 4)
+    """
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+    parse_slots = max(parse_workers, 1) * 2
+    html_queue = queue.Queue(maxsize=queue_size or parse_slots * 2)
+    stop = threading.Event()
+
+    def feed():
+        try:
+            for entry in ordered_map(fetch, items, workers=fetch_workers):
+                while not stop.is_set():
+                    try:
+                        html_queue.put(entry, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+        finally:
+            while not stop.is_set():
+                try:
+                    html_queue.put(_DONE, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+    feeder = threading.Thread(target=feed, name="pipeline-fetch", daemon=True)
+    pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+    feeder.start()
+    pending = deque()
+
+    def resolve(entry):
+        item, future, error = entry
+        if error is not None or future is None:
+            return item, None, error
+        try:
+            result = future.result()
+        except Exception as e:
+            return item, None, e
+        if pool is not None:
+            result, snapshot = result
+            get_metrics().merge_snapshot(snapshot)
+        return item, result, None
+
+    try:
+        while True:
+            entry = html_queue.get()
+            if entry is _DONE:
+                break
+            item, html, error = entry
+            if error is not None or html is None:
+                pending.append((item, None, error))
+            elif pool is None:
+                pending.append((item, _call_parse(parse, item, html), None))
+            else:
+                pending.append((item, pool.submit(run_with_metrics, _parse_timed, parse, item, html), None))
+            # 결과는 입력 순서대로 내보내고, 처리 중인 파싱 작업 수를 제한
+            while len(pending) > parse_slots:
+                yield resolve(pending.popleft())
+        while pending:
+            yield resolve(pending.popleft())
+    finally:
+        stop.set()
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
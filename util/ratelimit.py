@@ -0,0 +1,148 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# 감속 대상 상태 코드 (서버 과부하/요청 제한 신호)
+SLOWDOWN_STATUS = {429, 503}
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더 → 대기 시간(초), 해석할 수 없으면 None
+
+    초 단위 정수("120")와 HTTP 날짜("Wed, 21 Oct 2015 07:28:00 GMT") 모두 지원
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 burst 개까지 쌓이는 토큰 버킷 (스레드 안전)
+
+    _updated 는 토큰 수를 센 시각으로, Retry-After 로 막히면 막힘이 풀리는 미래 시각이 된다.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self):
+        """토큰 하나를 예약하고 그때까지 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def block(self, seconds):
+        """seconds 동안 새 요청을 막음 (Retry-After)
+
+        버킷 시계를 막힘이 풀리는 시각으로 옮기고 토큰을 1개만 두므로, 기다리던 요청이
+        풀리는 순간 한꺼번에 나가지 않고 1/rate 간격으로 이어진다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            until = now + seconds
+            # 이미 예약된 요청이 until 이후까지 잡혀 있으면 그대로 둔다
+            next_slot = self._updated + max(0.0, 1 - self._tokens) / self.rate
+            if until > next_slot:
+                self._updated = until
+                self._tokens = 1.0
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 요청 제한 (AIMD 방식으로 속도 자동 조절)
+
+    rate: 목표 요청 속도(초당 요청 수), 성공이 이어지면 이 속도까지 회복
+    burst: 한 번에 몰아서 보낼 수 있는 요청 수
+    min_rate: 감속 하한
+    increase: 성공 응답 1건마다 늘리는 속도 (가산 증가)
+    decrease: 429/503/연결 오류 시 곱하는 비율 (곱셈 감소)
+
+    429/503 응답에 Retry-After가 있으면 해당 호스트의 요청을 그 시간 동안 멈춘다.
+    캐시에서 응답한 경우에는 acquire를 호출하지 않으므로 대기하지 않는다.
+    """
+
+    def __init__(self, rate=5.0, burst=1, min_rate=0.2, increase=0.1, decrease=0.5, logger=None):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.logger = logger
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def current_rate(self, url):
+        return self._bucket(url).rate
+
+    def reserve(self, url):
+        """url 호스트의 토큰 하나를 예약하고 기다려야 할 시간(초) 반환 (직접 대기하지 않음, asyncio용)"""
+        return self._bucket(url).reserve()
+
+    def acquire(self, url):
+        """url 호스트로 요청을 보낼 수 있을 때까지 대기, 대기한 시간(초) 반환"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _slow_down(self, url, bucket, reason):
+        new_rate = max(self.min_rate, bucket.rate * self.decrease)
+        if new_rate < bucket.rate:
+            bucket.set_rate(new_rate)
+            if self.logger:
+                self.logger.info("요청 속도 감소 (%s, %s): 초당 %.2f회", urlsplit(url).netloc, reason, new_rate)
+
+    def on_response(self, url, status, retry_after=None):
+        """응답 상태에 따라 속도 조절 (retry_after: Retry-After 헤더 값)"""
+        bucket = self._bucket(url)
+        if status in SLOWDOWN_STATUS:
+            delay = parse_retry_after(retry_after)
+            if delay:
+                bucket.block(delay)
+                if self.logger:
+                    self.logger.info("Retry-After %.1f초 동안 %s 요청 중지", delay, urlsplit(url).netloc)
+            self._slow_down(url, bucket, f"HTTP {status}")
+        elif status < 500 and bucket.rate < self.rate:
+            bucket.set_rate(min(self.rate, bucket.rate + self.increase))
+
+    def on_error(self, url):
+        """연결 오류/타임아웃"""
+        bucket = self._bucket(url)
+        self._slow_down(url, bucket, "연결 오류")
@@ -0,0 +1,203 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+# 스냅숏 파일 구조 (리틀 엔디언, 각 블록은 8바이트 정렬)
+#   헤더: MAGIC, VERSION, 블록 수
+#   블록 목록: (이름 8바이트, 오프셋, 바이트 수, 행 수)
+#   블록: pokemon / move 고정 길이 레코드 배열, strofs(문자열 시작 오프셋 uint32), strdata(UTF-8)
+MAGIC = b"PDSNAP\0\0"
+VERSION = 2
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<8sQQQ")
+_ALIGN = 8
+
+# 정수 결측값 (-1), 실수 결측값은 NaN, 문자열 결측값은 문자열 0번("")
+MISSING = -1
+
+# (열 이름, dtype): "str" 열은 문자열 풀 인덱스(uint32)로 저장
+POKEMON_FIELDS = [
+    ("id", "<i2"), ("generation", "<i2"), ("name_en", "str"), ("name_kr", "str"),
+    ("type1", "str"), ("type2", "str"), ("species", "str"),
+    ("height_m", "<f4"), ("weight_kg", "<f4"), ("base_exp", "<i2"), ("catch_rate", "<i2"),
+    ("form", "str"), ("evo_from_id", "<i2"), ("evo_from_cond", "str"),
+    ("HP", "<i2"), ("Atk", "<i2"), ("Def", "<i2"), ("SpAtk", "<i2"), ("SpDef", "<i2"), ("Spd", "<i2"),
+    ("Tot", "<i2"), ("link", "str"),
+]
+MOVE_FIELDS = [
+    ("id", "<i2"), ("name_en", "str"), ("name_kr", "str"), ("type", "str"), ("category", "str"),
+    ("power", "<i2"), ("accuracy", "<f4"), ("pp", "<i2"), ("effects", "str"), ("description", "str"),
+    ("target", "str"), ("generation", "<i2"), ("link", "str"),
+]
+
+# 예전 수집 결과(pokemon_basic.csv)의 열 이름 (도감 설명은 util.descriptions 저장소에 따로 둔다)
+COLUMN_ALIASES = {"spd": "Spd"}
+
+
+def record_dtype(fields):
+    return np.dtype([(name, "<u4" if kind == "str" else kind) for name, kind in fields])
+
+
+class StringPool:
+    """중복 없는 문자열 풀 (0번은 빈 문자열 = 결측)"""
+
+    def __init__(self):
+        self._index = {"": 0}
+        self.strings = [""]
+
+    def add(self, value):
+        if value is None or (isinstance(value, float) and value != value):
+            return 0
+        value = str(value)
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def encode(self):
+        """→ (오프셋 배열 uint32[n + 1], UTF-8 바이트)"""
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return offsets, b"".join(encoded)
+
+
+def _number(value, kind):
+    if value is None or value == "" or (isinstance(value, float) and value != value):
+        return float("nan") if kind == "<f4" else MISSING
+    if kind == "<f4":
+        return float(value)
+    return int(float(value))
+
+
+def build_records(rows, fields, pool):
+    """행(dict) 목록 → 고정 길이 레코드 배열"""
+    records = np.zeros(len(rows), dtype=record_dtype(fields))
+    for i, row in enumerate(rows):
+        row = {COLUMN_ALIASES.get(k, k): v for k, v in row.items()}
+        records[i] = tuple(
+            pool.add(row.get(name)) if kind == "str" else _number(row.get(name), kind)
+            for name, kind in fields
+        )
+    return records
+
+
+def _pad(f):
+    pad = -f.tell() % _ALIGN
+    if pad:
+        f.write(b"\0" * pad)
+
+
+def write_snapshot(path, pokemon_rows, move_rows):
+    """포켓몬/기술 행 → 스냅숏 파일 (임시 파일에 쓴 뒤 교체)"""
+    pool = StringPool()
+    blocks = [
+        (b"pokemon", build_records(pokemon_rows, POKEMON_FIELDS, pool)),
+        (b"move", build_records(move_rows, MOVE_FIELDS, pool)),
+    ]
+    offsets, data = pool.encode()
+    blocks += [(b"strofs", offsets), (b"strdata", np.frombuffer(data, dtype=np.uint8))]
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(blocks)))
+        table_pos = f.tell()
+        f.write(b"\0" * (_ENTRY.size * len(blocks)))
+        entries = []
+        for name, array in blocks:
+            _pad(f)
+            entries.append(_ENTRY.pack(name, f.tell(), array.nbytes, len(array)))
+            f.write(array.tobytes())
+        f.seek(table_pos)
+        f.write(b"".join(entries))
+    os.replace(tmp_path, path)
+
+
+class Snapshot:
+    """mmap 으로 연 스냅숏 (읽기 전용, 복사 없음)
+
+    pokemon / moves 는 파일 페이지를 그대로 가리키는 NumPy 레코드 배열이며,
+    같은 파일을 여는 여러 프로세스는 OS 페이지 캐시를 공유한다.
+    문자열 열 값은 풀 인덱스이므로 string(i) 로 필요할 때만 디코딩한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_blocks = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"스냅숏 형식이 아닙니다: {path}")
+        self._blocks = {}
+        for i in range(n_blocks):
+            name, offset, nbytes, count = _ENTRY.unpack_from(self._mm, _HEADER.size + i * _ENTRY.size)
+            self._blocks[name.rstrip(b"\0").decode()] = (offset, nbytes, count)
+
+        self.pokemon = self._array("pokemon", record_dtype(POKEMON_FIELDS))
+        self.moves = self._array("move", record_dtype(MOVE_FIELDS))
+        self._str_offsets = self._array("strofs", np.dtype("<u4"))
+        self._str_base = self._blocks["strdata"][0]
+        self._pokemon_rows = None
+
+    def _array(self, name, dtype):
+        offset, _, count = self._blocks[name]
+        return np.frombuffer(self._mm, dtype=dtype, count=count, offset=offset)
+
+    def string(self, index):
+        index = int(index)
+        if index == 0:
+            return None
+        start, end = self._str_offsets[index], self._str_offsets[index + 1]
+        return self._mm[self._str_base + start:self._str_base + end].decode("utf-8")
+
+    def _record(self, record, fields):
+        result = {}
+        for name, kind in fields:
+            value = record[name]
+            if kind == "str":
+                result[name] = self.string(value)
+            elif kind == "<f4":
+                result[name] = None if np.isnan(value) else float(value)
+            else:
+                result[name] = None if value == MISSING else int(value)
+        return result
+
+    def pokemon_rows(self, pokemon_id):
+        """도감 번호 → 행 번호 목록 (폼마다 한 행)"""
+        if self._pokemon_rows is None:
+            rows = {}
+            for i, pid in enumerate(self.pokemon["id"].tolist()):
+                rows.setdefault(pid, []).append(i)
+            self._pokemon_rows = rows
+        return self._pokemon_rows.get(int(pokemon_id), [])
+
+    def get_pokemon(self, pokemon_id):
+        """도감 번호 → 기본(첫 번째) 폼 dict (없으면 None)"""
+        rows = self.pokemon_rows(pokemon_id)
+        return self._record(self.pokemon[rows[0]], POKEMON_FIELDS) if rows else None
+
+    def get_move(self, move_id):
+        """기술 ID → dict (없으면 None)"""
+        matches = np.flatnonzero(self.moves["id"] == int(move_id))
+        return self._record(self.moves[matches[0]], MOVE_FIELDS) if len(matches) else None
+
+    def close(self):
+        # NumPy 배열이 버퍼를 참조하는 동안에는 mmap을 닫을 수 없으므로 참조를 먼저 끊는다
+        self.pokemon = self.moves = self._str_offsets = None
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_snapshot(path="data/raw/gamedata.snapshot"):
+    return Snapshot(path)
@@ -0,0 +1,264 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+from util.ratelimit import SLOWDOWN_STATUS, parse_retry_after
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS items (kind TEXT, seq INTEGER, key TEXT, item TEXT, PRIMARY KEY (kind, seq));
+CREATE TABLE IF NOT EXISTS tasks (
+    kind TEXT, key TEXT, seq INTEGER, item TEXT,
+    status TEXT DEFAULT 'pending', worker TEXT, lease_until REAL,
+    attempts INTEGER DEFAULT 0, result TEXT, error TEXT,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (kind, status, seq);
+CREATE TABLE IF NOT EXISTS host_budget (host TEXT PRIMARY KEY, rate REAL, next_at REAL);
+"""
+
+TASK_STATUSES = ("pending", "leased", "done", "failed")
+
+
+def _connect(path, timeout=60.0):
+    # 트랜잭션은 직접 연다 (BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡아 교착을 피함)
+    conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+    conn.execute("PRAGMA busy_timeout = %d" % int(timeout * 1000))
+    return conn
+
+
+class _Transaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, *exc):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class _Database:
+    """스레드마다 따로 연결을 여는 SQLite 파일 (sqlite3 연결은 스레드 간에 공유하지 않는다)"""
+
+    def __init__(self, path, timeout=60.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.path, self.timeout)
+            self._prepare(conn)
+        return conn
+
+    def _prepare(self, conn):
+        pass
+
+    def transaction(self):
+        return _Transaction(self._conn())
+
+
+class WorkQueue(_Database):
+    """여러 수집 프로세스(다른 머신 포함)가 나눠 처리하는 SQLite 작업 테이블
+
+    items: 목록 페이지에서 나온 항목 전체 (kind별 순서 유지, 병합 시 이 순서로 행을 만든다)
+    tasks: 상세 URL(key)당 한 행. 폼처럼 같은 URL을 가리키는 항목은 한 번만 수집한다.
+        pending → (claim) leased → done / failed
+    작업자는 claim 으로 lease_seconds 동안 작업을 빌리고 heartbeat 로 연장한다.
+    lease가 끝날 때까지 완료하지 못한 작업(작업자 중단)은 다른 작업자가 다시 가져가고,
+    max_attempts 번 실패한 작업은 failed 로 남는다.
+
+    공유 파일 시스템(NFS 등)에서도 쓸 수 있도록 WAL이 아닌 기본 롤백 저널을 쓰며,
+    lease 시각은 각 머신의 time.time() 기준이므로 머신 간 시계가 맞아 있어야 한다.
+    """
+
+    def __init__(self, path, lease_seconds=120.0, max_attempts=3, timeout=60.0):
+        super().__init__(path, timeout)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def set_meta(self, key, value):
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, json.dumps(value, ensure_ascii=False)))
+
+    def get_meta(self, key, default=None):
+        row = self._conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def add_items(self, kind, items, key="link", reset=False):
+        """kind 항목 목록 등록 → 새로 추가된 작업 수
+
+        목록은 매번 새로 쓰고, 이미 있는 작업(같은 key)은 상태와 결과를 그대로 둔다 (이어서 수집).
+        reset=True 면 kind 작업을 모두 지우고 새로 시작한다.
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM items WHERE kind = ?", (kind,))
+            if reset:
+                conn.execute("DELETE FROM tasks WHERE kind = ?", (kind,))
+            before = conn.execute("SELECT COUNT(*) FROM tasks WHERE kind = ?", (kind,)).fetchone()[0]
+            for seq, item in enumerate(items):
+                data = json.dumps(item, ensure_ascii=False)
+                conn.execute("INSERT INTO items VALUES (?, ?, ?, ?)", (kind, seq, item[key], data))
+                conn.execute("INSERT OR IGNORE INTO tasks (kind, key, seq, item) VALUES (?, ?, ?, ?)",
+                             (kind, item[key], seq, data))
+            after = conn.execute("SELECT COUNT(*) FROM tasks WHERE kind = ?", (kind,)).fetchone()[0]
+        return after - before
+
+    def claim(self, kind, worker, limit=16):
+        """처리할 작업을 limit 개까지 빌림 → [항목 dict] (목록 순서)
+
+        대기 중인 작업과 lease가 끝난 작업을 가져가고, 시도 횟수가 다 찬 채로 lease가 끝난 작업은
+        failed 로 바꾼다.
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute("UPDATE tasks SET status = 'failed', error = COALESCE(error, 'lease expired') "
+                         "WHERE kind = ? AND status = 'leased' AND lease_until < ? AND attempts >= ?",
+                         (kind, now, self.max_attempts))
+            rows = conn.execute(
+                "SELECT key, item FROM tasks WHERE kind = ? "
+                "AND (status = 'pending' OR (status = 'leased' AND lease_until < ?)) ORDER BY seq LIMIT ?",
+                (kind, now, limit)).fetchall()
+            conn.executemany(
+                "UPDATE tasks SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE kind = ? AND key = ?",
+                [(worker, now + self.lease_seconds, kind, key) for key, _ in rows])
+        return [json.loads(item) for _, item in rows]
+
+    def heartbeat(self, worker):
+        """worker 가 빌린 작업의 lease 연장 → 연장한 작업 수"""
+        with self.transaction() as conn:
+            return conn.execute("UPDATE tasks SET lease_until = ? WHERE status = 'leased' AND worker = ?",
+                                (time.time() + self.lease_seconds, worker)).rowcount
+
+    def finish(self, kind, worker, results):
+        """results: [(key, 결과, 예외)] 기록 → 기록한 수
+
+        아직 worker 가 빌리고 있는 작업만 기록한다 (lease가 끝나 다른 작업자에게 넘어간 작업은 무시).
+        예외가 있으면 시도 횟수가 남은 경우 다시 pending, 아니면 failed.
+        """
+        done = 0
+        with self.transaction() as conn:
+            for key, result, error in results:
+                if error is None:
+                    cur = conn.execute(
+                        "UPDATE tasks SET status = 'done', result = ?, error = NULL, lease_until = NULL "
+                        "WHERE kind = ? AND key = ? AND status = 'leased' AND worker = ?",
+                        (json.dumps(result, ensure_ascii=False), kind, key, worker))
+                else:
+                    cur = conn.execute(
+                        "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                        "error = ?, lease_until = NULL WHERE kind = ? AND key = ? AND status = 'leased' AND worker = ?",
+                        (self.max_attempts, str(error), kind, key, worker))
+                done += cur.rowcount
+        return done
+
+    def counts(self, kind=None):
+        """상태별 작업 수 {kind: {status: n}}"""
+        counts = {}
+        query = "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status"
+        for row_kind, status, n in self._conn().execute(query):
+            counts.setdefault(row_kind, dict.fromkeys(TASK_STATUSES, 0))[status] = n
+        return counts.get(kind, dict.fromkeys(TASK_STATUSES, 0)) if kind else counts
+
+    def unfinished(self, kinds):
+        """pending/leased 작업 수"""
+        marks = ",".join("?" * len(kinds))
+        return self._conn().execute(
+            f"SELECT COUNT(*) FROM tasks WHERE kind IN ({marks}) AND status IN ('pending', 'leased')",
+            list(kinds)).fetchone()[0]
+
+    def next_expiry(self, kinds):
+        """가장 먼저 끝나는 lease 시각 (빌린 작업이 없으면 None)"""
+        marks = ",".join("?" * len(kinds))
+        return self._conn().execute(
+            f"SELECT MIN(lease_until) FROM tasks WHERE kind IN ({marks}) AND status = 'leased'",
+            list(kinds)).fetchone()[0]
+
+    def results(self, kind):
+        """목록 순서대로 (항목, 결과, 오류) yield (결과가 없으면 None)"""
+        query = ("SELECT i.item, t.result, t.error FROM items i LEFT JOIN tasks t "
+                 "ON t.kind = i.kind AND t.key = i.key WHERE i.kind = ? ORDER BY i.seq")
+        for item, result, error in self._conn().execute(query, (kind,)):
+            yield json.loads(item), json.loads(result) if result else None, error
+
+
+class SharedRateLimiter(_Database):
+    """여러 프로세스·머신이 같은 SQLite 파일로 나눠 쓰는 호스트별 요청 예산 (RateLimiter와 같은 인터페이스)
+
+    호스트마다 다음 요청을 보낼 수 있는 시각(next_at)을 두고, 요청할 때마다 1/rate 초씩 뒤로 미룬다.
+    작업자 수와 관계없이 전체 요청 속도가 rate 를 넘지 않는다. 429/503 응답과 연결 오류는
+    모든 작업자의 속도를 함께 줄이고(곱셈 감소), 성공 응답마다 rate 까지 조금씩 회복한다(가산 증가).
+    Retry-After 는 해당 호스트의 next_at 을 그만큼 미룬다.
+    """
+
+    def __init__(self, path, rate=5.0, min_rate=0.2, increase=0.1, decrease=0.5, logger=None, timeout=60.0):
+        super().__init__(path, timeout)
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.logger = logger
+
+    def _prepare(self, conn):
+        # 예산 상태는 잃어도 곧 다시 맞춰지므로 디스크 동기화를 기다리지 않는다
+        conn.execute("PRAGMA synchronous = OFF")
+
+    def _row(self, conn, host, now):
+        row = conn.execute("SELECT rate, next_at FROM host_budget WHERE host = ?", (host,)).fetchone()
+        if row is None:
+            conn.execute("INSERT INTO host_budget VALUES (?, ?, ?)", (host, self.rate, now))
+            return self.rate, now
+        return row
+
+    def current_rate(self, url):
+        with self.transaction() as conn:
+            return self._row(conn, urlsplit(url).netloc, time.time())[0]
+
+    def reserve(self, url):
+        """url 호스트의 요청 시각 하나를 예약하고 기다려야 할 시간(초) 반환"""
+        host = urlsplit(url).netloc
+        with self.transaction() as conn:
+            now = time.time()
+            rate, next_at = self._row(conn, host, now)
+            slot = max(now, next_at)
+            conn.execute("UPDATE host_budget SET next_at = ? WHERE host = ?", (slot + 1.0 / rate, host))
+        return slot - now
+
+    def acquire(self, url):
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _slow_down(self, url, reason, delay=None):
+        host = urlsplit(url).netloc
+        with self.transaction() as conn:
+            now = time.time()
+            rate, next_at = self._row(conn, host, now)
+            new_rate = max(self.min_rate, rate * self.decrease)
+            next_at = max(next_at, now + delay) if delay else next_at
+            conn.execute("UPDATE host_budget SET rate = ?, next_at = ? WHERE host = ?", (new_rate, next_at, host))
+        if self.logger and new_rate < rate:
+            self.logger.info("공유 요청 속도 감소 (%s, %s): 초당 %.2f회", host, reason, new_rate)
+
+    def on_response(self, url, status, retry_after=None):
+        if status in SLOWDOWN_STATUS:
+            self._slow_down(url, f"HTTP {status}", parse_retry_after(retry_after))
+        elif status < 500:
+            with self.transaction() as conn:
+                conn.execute("UPDATE host_budget SET rate = MIN(?, rate + ?) WHERE host = ? AND rate < ?",
+                             (self.rate, self.increase, urlsplit(url).netloc, self.rate))
+
+    def on_error(self, url):
+        self._slow_down(url, "연결 오류")
@@ -0,0 +1,87 @@
+import csv
+import json
+import math
+import os
+
+
+def _tsv_value(value):
+    # pandas.to_csv 와 같은 표기: None/NaN → 빈 칸
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return value
+
+
+class RowWriter:
+    """행(dict)을 받는 즉시 파일에 기록하는 TSV/JSONL 작성기
+
+    수집 도중에도 이미 기록된 행은 그대로 읽을 수 있도록 flush_every 행마다
+    flush 한다. 형식은 확장자(.tsv / .jsonl)로 정하거나 fmt로 지정한다.
+    """
+
+    def __init__(self, path, columns, fmt=None, flush_every=1):
+        self.path = path
+        self.columns = list(columns)
+        self.fmt = fmt or ("jsonl" if path.endswith(".jsonl") else "tsv")
+        self.flush_every = flush_every
+        self.count = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        if self.fmt == "tsv":
+            self._csv = csv.writer(self._file, delimiter="\t", lineterminator="\n")
+            self._csv.writerow(self.columns)
+            self._file.flush()
+
+    def write(self, row):
+        if self.fmt == "tsv":
+            self._csv.writerow([_tsv_value(row.get(col)) for col in self.columns])
+        else:
+            record = {col: row.get(col) for col in self.columns}
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TeeWriter:
+    """같은 행을 여러 작성기에 동시에 기록"""
+
+    def __init__(self, writers):
+        self.writers = list(writers)
+
+    @property
+    def count(self):
+        return self.writers[0].count if self.writers else 0
+
+    def write(self, row):
+        for writer in self.writers:
+            writer.write(row)
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_writer(path, columns, types=None):
+    """확장자로 작성기 선택: .parquet 은 세대별 파티션 Parquet, 그 외는 TSV/JSONL"""
+    if path.endswith(".parquet"):
+        from util.columnar import ParquetWriter
+        return ParquetWriter(path, columns, types or {})
+    return RowWriter(path, columns)